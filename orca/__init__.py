@@ -0,0 +1 @@
+"""Orca Cafe POS: modul bersama (database, akuntansi, penjualan) dan halaman menu."""
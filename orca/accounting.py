@@ -0,0 +1,112 @@
+"""Fungsi akuntansi: posting jurnal, jurnal pembalik, dan buku besar (saldo laporan ada di orca/statements.py)."""
+import pandas as pd
+
+from orca.config import OUTLET_ID
+from orca.db import get_connection, run_query
+from orca.money import to_rupiah
+
+
+def create_journal_entry(entry_date, description, entries, transaction_id=None, expense_id=None, conn=None, outlet_id=OUTLET_ID):
+    """Posting jurnal berimbang. Jika `conn` diberikan, jurnal ditulis di dalam transaksi pemanggil
+    (commit/rollback dilakukan pemanggil), sehingga tidak bentrok dengan lock tulis yang sedang dipegang.
+    Nilai tiap baris dibulatkan ke rupiah, jadi keseimbangan diperiksa eksak.
+
+    Mengembalikan (berhasil, pesan, id jurnal baru atau None jika gagal)."""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    c = conn.cursor()
+    try:
+        if own_conn:
+            c.execute("BEGIN TRANSACTION")
+        # Keseimbangan diperiksa sebelum menulis apa pun, agar jurnal gagal tidak meninggalkan header di transaksi pemanggil
+        items = [(entry['account_id'], to_rupiah(entry.get('debit', 0)), to_rupiah(entry.get('kredit', 0))) for entry in entries]
+        total_debit = sum(debit for _, debit, _ in items)
+        total_kredit = sum(kredit for _, _, kredit in items)
+        if total_debit != total_kredit:
+            raise ValueError(f"Jurnal tidak seimbang! Debit: {total_debit}, Kredit: {total_kredit}")
+
+        c.execute("INSERT INTO journal_entries (entry_date, description, transaction_id, expense_id, outlet_id) VALUES (?, ?, ?, ?, ?)",
+                  (entry_date, description, transaction_id, expense_id, outlet_id))
+        journal_entry_id = c.lastrowid
+        c.executemany("INSERT INTO journal_items (journal_entry_id, account_id, debit, kredit, entry_date) VALUES (?, ?, ?, ?, ?)",
+                      [(journal_entry_id, account_id, debit, kredit, entry_date) for account_id, debit, kredit in items])
+
+        if own_conn:
+            conn.commit()
+        return True, "Jurnal berhasil dibuat.", journal_entry_id
+    except Exception as e:
+        if own_conn:
+            conn.rollback()
+        return False, f"Gagal membuat jurnal: {e}", None
+    finally:
+        if own_conn:
+            conn.close()
+
+def reverse_journal_entries(conn, journal_entry_ids, entry_date, reason):
+    """Jurnal pembalik (debit <-> kredit) untuk setiap jurnal, di dalam transaksi pemanggil.
+
+    Buku besar hanya ditambah: jurnal asli tidak diubah/dihapus, hanya ditandai reversed_by. Jurnal yang sudah
+    dibalik atau yang merupakan jurnal pembalik dilewati. Mengembalikan jumlah jurnal yang dibalik.
+    """
+    if not journal_entry_ids:
+        return 0
+    c = conn.cursor()
+    c.execute(f"""SELECT id, description, transaction_id, expense_id, outlet_id FROM journal_entries
+        WHERE id IN ({', '.join('?' * len(journal_entry_ids))}) AND reversed_by IS NULL AND reversal_of IS NULL""", list(journal_entry_ids))
+    originals = c.fetchall()
+    for journal_entry_id, description, transaction_id, expense_id, outlet_id in originals:
+        c.execute("SELECT account_id, debit, kredit FROM journal_items WHERE journal_entry_id = ?", (journal_entry_id,))
+        lines = [{'account_id': account_id, 'debit': kredit, 'kredit': debit} for account_id, debit, kredit in c.fetchall()]
+        success_journal, msg_journal, reversal_id = create_journal_entry(entry_date, f"Pembalikan: {description} ({reason})", lines, transaction_id, expense_id, conn=conn, outlet_id=outlet_id)
+        if not success_journal:
+            raise ValueError(msg_journal)
+        c.execute("UPDATE journal_entries SET reversal_of = ? WHERE id = ?", (journal_entry_id, reversal_id))
+        c.execute("UPDATE journal_entries SET reversed_by = ? WHERE id = ?", (reversal_id, journal_entry_id))
+    return len(originals)
+
+LEDGER_PAGE_SIZE = 100
+
+def get_ledger_opening(account_id, start_date):
+    """Saldo awal akun sebelum start_date (sesuai saldo normal), dijumlah dari indeks buku besar."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""SELECT IFNULL(SUM(ji.debit - ji.kredit), 0) * (CASE a.normal_balance WHEN 'Debit' THEN 1 ELSE -1 END)
+        FROM accounts a LEFT JOIN journal_items ji ON ji.account_id = a.id AND ji.entry_date < ? WHERE a.id = ?""", (start_date, account_id))
+    opening = c.fetchone()[0] or 0
+    conn.close()
+    return opening
+
+def get_ledger_page(account_id, end_date, after_key, opening, limit=LEDGER_PAGE_SIZE):
+    """Satu halaman buku besar setelah kunci (entry_date, journal_entry_id, id) dengan saldo berjalan.
+
+    Halaman diambil dengan seek indeks (keyset, tanpa OFFSET) lalu saldo berjalan dihitung dengan
+    SUM() OVER hanya atas baris halaman itu, dimulai dari `opening` (saldo akhir halaman sebelumnya).
+    """
+    query = """
+        SELECT p.id, p.entry_date AS 'Tanggal', p.journal_entry_id AS 'No. Jurnal', je.description AS 'Deskripsi',
+            p.debit AS 'Debit', p.kredit AS 'Kredit',
+            ? + SUM((p.debit - p.kredit) * (CASE a.normal_balance WHEN 'Debit' THEN 1 ELSE -1 END))
+                OVER (ORDER BY p.entry_date, p.journal_entry_id, p.id) AS 'Saldo'
+        FROM (
+            SELECT id, entry_date, journal_entry_id, debit, kredit FROM journal_items
+            WHERE account_id = ? AND (entry_date, journal_entry_id, id) > (?, ?, ?) AND entry_date <= ?
+            ORDER BY entry_date, journal_entry_id, id LIMIT ?
+        ) p
+        JOIN journal_entries je ON je.id = p.journal_entry_id
+        JOIN accounts a ON a.id = ?
+        ORDER BY p.entry_date, p.journal_entry_id, p.id
+    """
+    conn = get_connection()
+    df = pd.read_sql_query(query, conn, params=(opening, account_id, *after_key, end_date, limit, account_id))
+    conn.close()
+    return df
+
+def ledger_version():
+    """Penanda isi buku besar & daftar akun, dipakai sebagai kunci cache laporan.
+
+    Buku besar hanya ditambah (koreksi lewat jurnal pembalik), jadi id baris jurnal terakhir (seek indeks
+    rowid) sudah menandai perubahannya; perubahan daftar akun dari change_counters.
+    """
+    return run_query("""SELECT (SELECT IFNULL(MAX(id), 0) FROM journal_items),
+        (SELECT IFNULL(MAX(version), 0) FROM change_counters WHERE name = 'accounts')""", fetch='one')
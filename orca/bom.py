@@ -0,0 +1,129 @@
+"""Resep bertingkat (bahan setengah jadi) dan BOM yang sudah diratakan.
+
+Bahan setengah jadi (mis. sirup, espresso base, sambal) adalah baris ingredients dengan
+is_intermediate = 1. Resepnya per batch ada di sub_recipes dan stoknya bertambah lewat
+produksi batch. Penjualan tetap mengurangi resep langsung produk (bahan setengah jadi
+punya stok dan lot FIFO sendiri), jadi cukup satu query berapa pun kedalamannya.
+
+BOM rata (flattened) per produk diselesaikan secara topologis sekali per versi struktur
+resep (change_counters 'bom') dan dipakai untuk HPP standar & perencanaan kebutuhan bahan.
+"""
+from datetime import datetime
+
+import streamlit as st
+
+from orca.config import OUTLET_ID
+from orca.db import get_connection, run_query, get_change_version
+from orca.inventory import post_stock_movements
+from orca.money import to_rupiah
+
+
+class FlatBom:
+    """Kebutuhan per 1 unit produk: gross = semua level (termasuk setengah jadi), raw = bahan baku saja."""
+
+    def __init__(self, recipes, sub_recipes, batch_yields):
+        self.intermediates = set(batch_yields)
+        components = {}
+        for parent_id, ingredient_id, qty_per_batch in sub_recipes:
+            if parent_id in self.intermediates:
+                components.setdefault(parent_id, []).append((ingredient_id, qty_per_batch / (batch_yields[parent_id] or 1)))
+        # Ekspansi tiap bahan setengah jadi dalam urutan topologis (DFS post-order, siklus ditolak)
+        self.expansion = {}
+        visiting = set()
+        def expand(item_id):
+            if item_id in self.expansion:
+                return self.expansion[item_id]
+            if item_id in visiting:
+                raise ValueError(f"Resep setengah jadi membentuk siklus (bahan ID {item_id}).")
+            visiting.add(item_id)
+            needs = {}
+            for component_id, qty in components.get(item_id, []):
+                needs[component_id] = needs.get(component_id, 0) + qty
+                for sub_id, sub_qty in expand(component_id).items():
+                    needs[sub_id] = needs.get(sub_id, 0) + qty * sub_qty
+            visiting.discard(item_id)
+            self.expansion[item_id] = needs
+            return needs
+
+        self.gross = {}
+        for product_id, ingredient_id, qty_per_unit in recipes:
+            needs = self.gross.setdefault(product_id, {})
+            needs[ingredient_id] = needs.get(ingredient_id, 0) + qty_per_unit
+            for sub_id, sub_qty in expand(ingredient_id).items():
+                needs[sub_id] = needs.get(sub_id, 0) + qty_per_unit * sub_qty
+        self.raw = {product_id: {ing_id: qty for ing_id, qty in needs.items() if ing_id not in self.intermediates}
+                    for product_id, needs in self.gross.items()}
+
+    def standard_costs(self, unit_costs):
+        """HPP standar per produk dari bahan baku paling dasar: {product_id: biaya}."""
+        return {product_id: sum(qty * (unit_costs.get(ing_id) or 0) for ing_id, qty in needs.items())
+                for product_id, needs in self.raw.items()}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _flat_bom(version):
+    return FlatBom(
+        run_query("SELECT product_id, ingredient_id, qty_per_unit FROM recipes", fetch='all'),
+        run_query("SELECT parent_id, ingredient_id, qty_per_batch FROM sub_recipes", fetch='all'),
+        dict(run_query("SELECT id, batch_yield FROM ingredients WHERE is_intermediate = 1", fetch='all')),
+    )
+
+def get_flat_bom():
+    """BOM rata yang di-memo; dibangun ulang hanya jika struktur resep berubah."""
+    return _flat_bom(get_change_version('bom'))
+
+def get_standard_costs():
+    """HPP standar semua produk (biaya bahan baku terkini x BOM rata)."""
+    return get_flat_bom().standard_costs(dict(run_query("SELECT id, cost_per_unit FROM ingredients", fetch='all')))
+
+def would_create_cycle(parent_id, ingredient_id):
+    """True jika menambahkan ingredient_id ke resep parent_id membuat resep saling memuat."""
+    row = run_query("""
+        WITH RECURSIVE reach(id) AS (
+            SELECT ? UNION SELECT sr.ingredient_id FROM sub_recipes sr JOIN reach ON sr.parent_id = reach.id
+        ) SELECT 1 FROM reach WHERE id = ? LIMIT 1
+    """, (ingredient_id, parent_id), fetch='one')
+    return row is not None
+
+def run_production(ingredient_id, batches, employee_id=None):
+    """Produksi batch: kurangi komponen (biaya FIFO) dan tambah stok bahan setengah jadi dengan lot seharga biaya aktualnya.
+
+    Mengembalikan (berhasil, pesan).
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT name, IFNULL(batch_yield, 1), IFNULL(stock, 0), IFNULL(cost_per_unit, 0) FROM ingredients WHERE id = ? AND is_intermediate = 1", (ingredient_id,))
+        row = c.fetchone()
+        if not row:
+            raise ValueError("Bahan bukan bahan setengah jadi.")
+        name, batch_yield, stock, cost_per_unit = row
+        # Produksi memakai stok komponen di outlet terminal ini
+        c.execute("""SELECT sr.ingredient_id, i.name, IFNULL(s.stock, 0), sr.qty_per_batch FROM sub_recipes sr JOIN ingredients i ON i.id = sr.ingredient_id
+            LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = sr.ingredient_id WHERE sr.parent_id = ?""", (OUTLET_ID, ingredient_id))
+        components = c.fetchall()
+        if not components:
+            raise ValueError(f"Resep '{name}' belum memiliki komponen.")
+        short = [f"{comp_name} (butuh {qty * batches:,.2f}, stok {comp_stock:,.2f})" for _, comp_name, comp_stock, qty in components if comp_stock < qty * batches]
+        if short:
+            raise ValueError(f"Stok tidak cukup: {', '.join(short)}")
+
+        produced_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        qty_produced = batch_yield * batches
+        c.execute("INSERT INTO production_runs (ingredient_id, batches, qty_produced, total_cost, produced_at, employee_id) VALUES (?, ?, ?, 0, ?, ?)",
+                  (ingredient_id, batches, qty_produced, produced_at, employee_id))
+        run_id = c.lastrowid
+        total_cost = post_stock_movements(c, [(comp_id, -qty * batches) for comp_id, _, _, qty in components], 'Produksi', run_id, produced_at)
+        unit_cost = total_cost / qty_produced
+        post_stock_movements(c, [(ingredient_id, qty_produced)], 'Hasil Produksi', run_id, produced_at, unit_costs={ingredient_id: unit_cost})
+        on_hand = max(stock, 0)
+        c.execute("UPDATE ingredients SET cost_per_unit = ? WHERE id = ?", ((on_hand * cost_per_unit + total_cost) / (on_hand + qty_produced), ingredient_id))
+        c.execute("UPDATE production_runs SET total_cost = ? WHERE id = ?", (to_rupiah(total_cost), run_id))
+        conn.commit()
+        return True, f"Produksi #{run_id}: {qty_produced:,.2f} {name} (biaya Rp {total_cost:,.0f}, Rp {unit_cost:,.2f}/unit)."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal produksi: {e}"
+    finally:
+        conn.close()
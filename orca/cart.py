@@ -0,0 +1,79 @@
+"""Keranjang belanja kasir dan pesanan yang ditahan (parked orders)."""
+import json
+from datetime import datetime
+
+from orca.db import run_query
+from orca.money import to_rupiah
+
+
+class Cart:
+    """Keranjang per baris (produk + opsi varian/tambahan) dengan snapshot harga (rupiah bulat) saat item ditambahkan.
+
+    Total dan jumlah item diperbarui setiap kali item ditambah/dihapus, jadi
+    panel keranjang tidak perlu mencari harga ke katalog di setiap rerun.
+    """
+
+    def __init__(self, lines=None):
+        self.lines = {} # line_key -> {'product_id', 'option_ids', 'name', 'price', 'qty'}
+        self.total = 0
+        self.count = 0
+        for line in lines or []:
+            self.add(line['product_id'], line['name'], line['price'], line['qty'], line.get('option_ids', ()))
+
+    def __bool__(self):
+        return bool(self.lines)
+
+    @staticmethod
+    def line_key(product_id, option_ids=()):
+        """Produk yang sama dengan opsi berbeda menjadi baris terpisah."""
+        return f"{product_id}:{','.join(map(str, sorted(option_ids)))}" if option_ids else str(product_id)
+
+    def add(self, product_id, name, price, qty=1, option_ids=()):
+        key = self.line_key(product_id, option_ids)
+        line = self.lines.get(key)
+        if line is None:
+            line = self.lines[key] = {'product_id': product_id, 'option_ids': list(option_ids), 'name': name, 'price': to_rupiah(price), 'qty': 0}
+        line['qty'] += qty
+        self.total += line['price'] * qty
+        self.count += qty
+
+    def remove(self, key):
+        line = self.lines.pop(key, None)
+        if line:
+            self.total -= line['price'] * line['qty']
+            self.count -= line['qty']
+
+    def items(self):
+        """(line_key, product_id, option_ids, name, price, qty) untuk setiap baris."""
+        return [(key, line['product_id'], line['option_ids'], line['name'], line['price'], line['qty']) for key, line in self.lines.items()]
+
+    def to_json(self):
+        return json.dumps(list(self.lines.values()))
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(json.loads(data))
+
+
+def get_cart(session_state):
+    """Keranjang aktif di session; dibuat jika belum ada."""
+    if not isinstance(session_state.get('cart'), Cart):
+        session_state.cart = Cart()
+    return session_state.cart
+
+def park_cart(cart, terminal, label, employee_id):
+    """Simpan keranjang sebagai pesanan yang ditahan di terminal ini."""
+    run_query("INSERT INTO parked_orders (terminal, label, employee_id, cart_json, total_amount, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+              (terminal, label, employee_id, cart.to_json(), cart.total, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+def list_parked_orders(terminal):
+    """Daftar (id, label, total, created_at) pesanan yang ditahan di terminal ini."""
+    return run_query("SELECT id, label, total_amount, created_at FROM parked_orders WHERE terminal = ? ORDER BY id", (terminal,), fetch='all')
+
+def resume_parked_order(order_id):
+    """Ambil pesanan yang ditahan sebagai Cart dan hapus dari daftar tahanan."""
+    row = run_query("SELECT cart_json FROM parked_orders WHERE id = ?", (order_id,), fetch='one')
+    if not row:
+        return None
+    run_query("DELETE FROM parked_orders WHERE id = ?", (order_id,))
+    return Cart.from_json(row[0])
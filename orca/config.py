@@ -0,0 +1,22 @@
+"""Konfigurasi aplikasi."""
+import os
+
+DB = "pos.db"
+PERF_BUFFER_SIZE = 5000 # Jumlah maksimum sampel query/rerun yang disimpan di memori
+TERMINAL_ID = os.environ.get("ORCA_TERMINAL", "KASIR-1") # Identitas terminal kasir untuk pesanan yang ditahan
+OUTLET_ID = int(os.environ.get("ORCA_OUTLET", "1")) # Outlet (cabang) tempat terminal ini berada; transaksi & stok dicatat ke outlet ini
+OUTLET_WORKERS = 4 # Jumlah thread untuk menghitung laporan per outlet secara paralel
+# Posting jurnal penjualan: 'transaksi' = satu jurnal per penjualan, 'harian' = penjualan ditampung di
+# sales_accruals lalu diposting satu jurnal ringkasan per hari, outlet & metode bayar saat tutup harian
+SALES_POSTING_MODE = os.environ.get("ORCA_SALES_POSTING", "transaksi")
+# Titik pesan ulang bahan (lihat orca/reorder.py)
+REORDER_HISTORY_DAYS = 365 # Riwayat penjualan yang dipakai untuk menghitung laju pemakaian
+REORDER_LEAD_TIME_DAYS = 3 # Waktu tunggu pengiriman dari pemasok
+REORDER_SAFETY_Z = 1.65 # Faktor stok pengaman (1.65 ~ tingkat layanan 95%)
+REORDER_SMOOTHING_ALPHA = 0.3 # Bobot exponential smoothing per hari dalam seminggu
+REORDER_HORIZON_DAYS = 28 # Panjang proyeksi pemakaian untuk menghitung hari ketersediaan
+# Piutang & utang usaha (lihat orca/subledgers.py)
+PAYMENT_TERM_DAYS = 30 # Jatuh tempo bawaan faktur/tagihan sejak tanggal dokumen
+AGING_BUCKETS = ["0-30 hari", "31-60 hari", "61-90 hari", "> 90 hari"] # Kelompok umur menurut hari lewat jatuh tempo
+# Shift kasir (lihat orca/shifts.py)
+CASH_DENOMINATIONS = [100000, 50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100] # Pecahan rupiah untuk hitung laci saat tutup shift
@@ -0,0 +1,100 @@
+"""Costing FIFO per lot bahan.
+
+Setiap mutasi masuk membuat satu lot (inventory_lots) di outlet tersebut dengan harga
+perolehannya; mutasi keluar mengambil dari lot tertua di outlet yang sama lebih dulu. Saat posting, lot terbuka
+bahan yang terlibat dimuat sekali ke deque per bahan, dikonsumsi di memori, lalu
+sisa qty lot yang tersentuh ditulis balik dengan executemany.
+"""
+from collections import deque
+
+from orca.config import OUTLET_ID
+
+EPSILON = 1e-9 # Sisa lot sekecil ini dianggap habis (galat float)
+
+
+class FifoLayers:
+    """Lapisan FIFO per bahan: deque berisi [lot_id, qty_remaining, unit_cost], lot tertua di kiri."""
+
+    def __init__(self, lots=(), fallback_costs=None, stock=None):
+        self.layers = {}
+        self.fallback_costs = fallback_costs or {} # HPP bahan, dipakai jika lot tidak mencukupi
+        self.stock = stock or {}
+        self.touched = {} # lot_id -> qty_remaining terbaru
+        for lot_id, ingredient_id, qty_remaining, unit_cost in lots:
+            self.layers.setdefault(ingredient_id, deque()).append([lot_id, qty_remaining, unit_cost])
+
+    @classmethod
+    def load(cls, c, ingredient_ids, outlet_id=OUTLET_ID):
+        """Muat lot terbuka outlet + HPP bahan & stok outlet untuk ingredient_ids (dua query, memakai indeks parsial lot terbuka per outlet)."""
+        ids = list(set(ingredient_ids))
+        placeholders = ', '.join('?' * len(ids))
+        c.execute(f"SELECT id, ingredient_id, qty_remaining, unit_cost FROM inventory_lots WHERE outlet_id = ? AND ingredient_id IN ({placeholders}) AND qty_remaining > 0 ORDER BY ingredient_id, id", [outlet_id, *ids])
+        lots = c.fetchall()
+        c.execute(f"SELECT i.id, IFNULL(i.cost_per_unit, 0), IFNULL(s.stock, 0) FROM ingredients i LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id WHERE i.id IN ({placeholders})", [outlet_id, *ids])
+        rows = c.fetchall()
+        return cls(lots, {row[0]: row[1] for row in rows}, {row[0]: row[2] for row in rows})
+
+    def consume(self, ingredient_id, qty):
+        """Ambil qty dari lot tertua. Mengembalikan (biaya, [(lot_id, qty, unit_cost), ...]).
+
+        Bagian yang tidak tertutup lot dibiayai dengan HPP bahan dan dicatat dengan lot_id None.
+        """
+        layers = self.layers.get(ingredient_id)
+        cost, used = 0.0, []
+        while qty > EPSILON and layers:
+            layer = layers[0]
+            take = min(qty, layer[1])
+            layer[1] -= take
+            qty -= take
+            cost += take * layer[2]
+            used.append((layer[0], take, layer[2]))
+            if layer[1] <= EPSILON:
+                layer[1] = 0.0
+                layers.popleft()
+            self.touched[layer[0]] = layer[1]
+        if qty > EPSILON:
+            unit_cost = self.fallback_costs.get(ingredient_id, 0)
+            cost += qty * unit_cost
+            used.append((None, qty, unit_cost))
+        return cost, used
+
+    def flush(self, c):
+        """Tulis sisa qty lot yang berubah."""
+        c.executemany("UPDATE inventory_lots SET qty_remaining = ? WHERE id = ?", [(qty, lot_id) for lot_id, qty in self.touched.items()])
+        self.touched.clear()
+
+
+def post_fifo(c, movements, reason, ref_id, moved_at, unit_costs=None, outlet_id=OUTLET_ID):
+    """Buat lot untuk mutasi masuk dan konsumsi FIFO untuk mutasi keluar di satu outlet. Mengembalikan total biaya keluar."""
+    fifo = FifoLayers.load(c, [ingredient_id for ingredient_id, _ in movements], outlet_id)
+    unit_costs = unit_costs or {}
+    new_lots, consumptions, total_cost = [], [], 0.0
+    for ingredient_id, qty_delta in movements:
+        if qty_delta > 0:
+            # Stok minus sudah dibiayai saat keluar; hanya sisanya yang menjadi lot baru
+            lot_qty = qty_delta - max(-fifo.stock.get(ingredient_id, 0), 0)
+            if lot_qty > EPSILON:
+                unit_cost = unit_costs.get(ingredient_id, fifo.fallback_costs.get(ingredient_id, 0))
+                new_lots.append((ingredient_id, moved_at, lot_qty, lot_qty, unit_cost, reason, ref_id, outlet_id))
+        else:
+            cost, used = fifo.consume(ingredient_id, -qty_delta)
+            total_cost += cost
+            consumptions.extend((lot_id, ingredient_id, qty, unit_cost, reason, ref_id) for lot_id, qty, unit_cost in used)
+        fifo.stock[ingredient_id] = fifo.stock.get(ingredient_id, 0) + qty_delta
+    fifo.flush(c)
+    c.executemany("INSERT INTO inventory_lots (ingredient_id, received_at, qty_received, qty_remaining, unit_cost, source, ref_id, outlet_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", new_lots)
+    c.executemany("INSERT INTO lot_consumptions (lot_id, ingredient_id, qty, unit_cost, reason, ref_id) VALUES (?, ?, ?, ?, ?, ?)", consumptions)
+    return total_cost
+
+def restore_consumptions(c, reason, ref_id, moved_at, outlet_id=OUTLET_ID):
+    """Kembalikan qty ke lot asalnya untuk mutasi keluar (reason, ref_id), mis. saat transaksi dibatalkan.
+
+    Mengembalikan jumlah baris konsumsi yang dipulihkan (0 = tidak ada catatan FIFO).
+    """
+    c.execute("SELECT lot_id, ingredient_id, qty, unit_cost FROM lot_consumptions WHERE reason = ? AND ref_id = ?", (reason, ref_id))
+    rows = c.fetchall()
+    c.executemany("UPDATE inventory_lots SET qty_remaining = qty_remaining + ? WHERE id = ?", [(qty, lot_id) for lot_id, _, qty, _ in rows if lot_id is not None])
+    c.executemany("INSERT INTO inventory_lots (ingredient_id, received_at, qty_received, qty_remaining, unit_cost, source, ref_id, outlet_id) VALUES (?, ?, ?, ?, ?, 'Pembatalan', ?, ?)",
+                  [(ingredient_id, moved_at, qty, qty, unit_cost, ref_id, outlet_id) for lot_id, ingredient_id, qty, unit_cost in rows if lot_id is None])
+    c.execute("DELETE FROM lot_consumptions WHERE reason = ? AND ref_id = ?", (reason, ref_id))
+    return len(rows)
@@ -0,0 +1,44 @@
+"""Akses database: koneksi ber-instrumentasi dan helper query."""
+import sqlite3
+
+from orca.config import DB
+from orca.perf import TimedConnection
+
+
+def get_connection():
+    """Koneksi ke DB dengan instrumentasi query (dipakai oleh semua helper)."""
+    return sqlite3.connect(DB, factory=TimedConnection)
+
+def run_query(query, params=(), fetch=None):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(query, params)
+    if fetch == 'one': 
+        result = c.fetchone()
+    elif fetch == 'all': 
+        result = c.fetchall()
+    else: 
+        result = None
+    conn.commit()
+    conn.close()
+    return result
+
+def register_numpy_adapters():
+    """ID dari DataFrame (mis. .iloc[0] atau opsi selectbox) bertipe numpy; tanpa adapter sqlite3
+    mengikatnya sebagai BLOB sehingga WHERE id = ? tidak pernah cocok."""
+    import numpy as np
+    for numpy_type, python_type in ((np.int64, int), (np.int32, int), (np.float64, float), (np.bool_, bool)):
+        sqlite3.register_adapter(numpy_type, python_type)
+
+def get_df(query, params=()):
+    import pandas as pd # Diimpor saat dibutuhkan agar halaman login tidak memuat pandas
+    register_numpy_adapters()
+    conn = get_connection()
+    df = pd.read_sql_query(query, conn, params=params)
+    conn.close()
+    return df
+
+def get_change_version(name):
+    """Versi data sebuah tabel dari change_counters (naik setiap INSERT/UPDATE/DELETE)."""
+    row = run_query("SELECT version FROM change_counters WHERE name = ?", (name,), fetch='one')
+    return row[0] if row else 0
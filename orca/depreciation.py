@@ -0,0 +1,110 @@
+"""Penyusutan aktiva tetap: jadwal bulanan semua aset dan posting jurnal penyusutan per bulan.
+
+Jadwal seluruh aset dihitung sekaligus sebagai matriks aset x bulan (numpy), bukan loop per aset per bulan:
+- Straight-line: (biaya - residu) / umur bulan, rata setiap bulan.
+- Declining-balance (saldo menurun ganda): tarif 2 / umur tahun per tahun (dibagi 12 per bulan) dari nilai buku,
+  tidak pernah di bawah nilai residu; sisa yang belum tersusut dihabiskan di bulan terakhir umur aset.
+Penyusutan dimulai pada bulan perolehan dan dibulatkan ke rupiah per bulan (setengah ke atas, seperti to_rupiah);
+sisa pembulatan masuk ke bulan terakhir. Jadwal di-cache per versi tabel fixed_assets (change_counters).
+"""
+import calendar
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from orca.accounting import create_journal_entry
+from orca.db import get_connection, get_df, get_change_version
+
+DEPRECIATION_METHODS = ["Straight-line", "Declining-balance"]
+EXPENSE_ACCOUNT = "Beban Penyusutan"
+ACCUMULATED_ACCOUNT = "Akumulasi Penyusutan"
+
+
+def compute_schedules(assets):
+    """Jadwal penyusutan bulanan untuk DataFrame aset (id, acquisition_date, acquisition_cost, useful_life_years,
+    salvage_value, depreciation_method).
+
+    Mengembalikan DataFrame panjang (asset_id, period 'YYYY-MM', depreciation, accumulated, book_value).
+    """
+    columns = ['asset_id', 'period', 'depreciation', 'accumulated', 'book_value']
+    if assets.empty:
+        return pd.DataFrame(columns=columns)
+    cost = np.floor(assets['acquisition_cost'].fillna(0).to_numpy(dtype=float) + 0.5)
+    salvage = np.minimum(np.floor(assets['salvage_value'].fillna(0).to_numpy(dtype=float) + 0.5), cost)
+    months = np.maximum(assets['useful_life_years'].fillna(1).to_numpy(dtype=int), 1) * 12
+    depreciable = cost - salvage
+    declining = (assets['depreciation_method'] == 'Declining-balance').to_numpy()
+
+    t = np.arange(months.max())[None, :] # bulan ke-0..n-1 (kolom)
+    in_life = t < months[:, None]
+    # Akumulasi s/d akhir bulan t untuk kedua metode, lalu dipilih per aset
+    straight = depreciable[:, None] * np.minimum(t + 1, months[:, None]) / months[:, None]
+    rate = 2 / (months[:, None] / 12) / 12
+    double_declining = np.minimum(cost[:, None] * (1 - (1 - np.minimum(rate, 1)) ** (t + 1)), depreciable[:, None])
+    double_declining = np.where(t >= months[:, None] - 1, depreciable[:, None], double_declining)
+    # Penyusutan per bulan dibulatkan ke rupiah; akumulasi tidak melewati biaya - residu dan bulan terakhir
+    # menampung sisa pembulatan sehingga totalnya tepat biaya - residu
+    monthly = np.floor(np.diff(np.where(declining[:, None], double_declining, straight), axis=1, prepend=0.0) + 0.5)
+    accumulated = np.minimum(np.cumsum(monthly, axis=1), depreciable[:, None])
+    accumulated = np.where(t >= months[:, None] - 1, depreciable[:, None], accumulated).astype('int64')
+    depreciation = np.diff(accumulated, axis=1, prepend=0)
+
+    acquired = pd.to_datetime(assets['acquisition_date'], errors='coerce').fillna(pd.Timestamp.today()).to_numpy().astype('datetime64[M]')
+    periods = acquired[:, None] + t.astype('timedelta64[M]')
+    return pd.DataFrame({
+        'asset_id': np.broadcast_to(assets['id'].to_numpy()[:, None], in_life.shape)[in_life],
+        'period': np.datetime_as_string(periods[in_life], unit='M'),
+        'depreciation': depreciation[in_life],
+        'accumulated': accumulated[in_life],
+        'book_value': (cost.astype('int64')[:, None] - accumulated)[in_life],
+    }, columns=columns)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _schedule(version):
+    return compute_schedules(get_df("SELECT id, acquisition_date, acquisition_cost, useful_life_years, salvage_value, depreciation_method FROM fixed_assets"))
+
+def get_depreciation_schedule():
+    """Jadwal penyusutan semua aset; dihitung ulang hanya jika tabel fixed_assets berubah."""
+    return _schedule(get_change_version('fixed_assets'))
+
+def get_unposted_depreciation(through_period):
+    """Baris jadwal s/d periode 'YYYY-MM' yang belum diposting."""
+    schedule = get_depreciation_schedule()
+    posted = get_df("SELECT asset_id, period FROM depreciation_postings")
+    pending = schedule[(schedule['period'] <= through_period) & (schedule['depreciation'] > 0)]
+    pending = pending.merge(posted, on=['asset_id', 'period'], how='left', indicator=True)
+    return pending[pending['_merge'] == 'left_only'].drop(columns='_merge')
+
+def post_depreciation(through_period):
+    """Posting penyusutan semua aset s/d periode 'YYYY-MM': satu jurnal gabungan per bulan
+    (Beban Penyusutan / Akumulasi Penyusutan), lalu perbarui nilai buku aset. Mengembalikan (berhasil, pesan).
+    """
+    pending = get_unposted_depreciation(through_period)
+    if pending.empty:
+        return True, "Tidak ada penyusutan yang perlu diposting."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT account_name, id FROM accounts WHERE account_name IN (?, ?)", (EXPENSE_ACCOUNT, ACCUMULATED_ACCOUNT))
+        account_ids = dict(c.fetchall())
+        for period, rows in pending.groupby('period'):
+            total = int(rows['depreciation'].sum())
+            year, month = map(int, period.split('-'))
+            success_journal, msg_journal, journal_entry_id = create_journal_entry(
+                f"{period}-{calendar.monthrange(year, month)[1]:02d}", f"Penyusutan Aktiva Tetap {period} ({len(rows)} aset)",
+                [{'account_id': account_ids[EXPENSE_ACCOUNT], 'debit': total}, {'account_id': account_ids[ACCUMULATED_ACCOUNT], 'kredit': total}], conn=conn)
+            if not success_journal:
+                raise ValueError(msg_journal)
+            c.executemany("INSERT INTO depreciation_postings (asset_id, period, amount, journal_entry_id) VALUES (?, ?, ?, ?)",
+                          [(int(asset_id), period, int(amount), journal_entry_id) for asset_id, amount in zip(rows['asset_id'], rows['depreciation'])])
+        c.execute("""UPDATE fixed_assets SET current_book_value = CAST(ROUND(acquisition_cost) AS INTEGER)
+            - IFNULL((SELECT SUM(amount) FROM depreciation_postings WHERE asset_id = fixed_assets.id), 0)""")
+        conn.commit()
+        return True, f"Penyusutan {pending['period'].nunique()} bulan untuk {pending['asset_id'].nunique()} aset diposting (Rp {pending['depreciation'].sum():,.0f})."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal posting penyusutan: {e}"
+    finally:
+        conn.close()
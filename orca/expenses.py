@@ -0,0 +1,97 @@
+"""Logika bisnis pengeluaran: pencatatan, perubahan, dan pembatalan dengan jurnal pembalik.
+
+Pengeluaran tidak pernah dihapus: pembatalan menandai voided_at dan membalik jurnalnya, perubahan
+membalik jurnal lama lalu memposting jurnal baru, sehingga buku besar hanya ditambah.
+"""
+from datetime import datetime
+
+from orca.accounting import create_journal_entry, reverse_journal_entries
+from orca.config import OUTLET_ID
+from orca.db import get_connection
+from orca.money import to_rupiah
+
+PAYMENT_ACCOUNTS = {'Cash': 'Kas', 'Transfer': 'Bank'}
+
+
+def expense_journal_lines(c, account_id, amount, payment_method):
+    """Baris jurnal pengeluaran: D akun beban/aset / K Kas (Cash) atau Bank (Transfer)."""
+    c.execute("SELECT id FROM accounts WHERE account_name = ?", (PAYMENT_ACCOUNTS[payment_method],))
+    row = c.fetchone()
+    if not row:
+        raise ValueError(f"Akun '{PAYMENT_ACCOUNTS[payment_method]}' tidak ditemukan.")
+    return [{'account_id': account_id, 'debit': amount}, {'account_id': row[0], 'kredit': amount}]
+
+def _post_expense_journal(conn, expense_id, entry_date, description, amount, payment_method, account_id, outlet_id):
+    success_journal, msg_journal, _ = create_journal_entry(entry_date, f"Pengeluaran: {description}",
+                                                        expense_journal_lines(conn.cursor(), account_id, amount, payment_method),
+                                                        expense_id=expense_id, conn=conn, outlet_id=outlet_id)
+    if not success_journal:
+        raise ValueError(msg_journal)
+
+def create_expense(expense_date, category, description, amount, payment_method, account_id, outlet_id=OUTLET_ID):
+    """Catat pengeluaran (dibulatkan ke rupiah) beserta jurnalnya dalam satu transaksi. Mengembalikan (berhasil, pesan)."""
+    amount = to_rupiah(amount)
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("INSERT INTO expenses (date, category, description, amount, payment_method, account_id, outlet_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                  (expense_date, category, description, amount, payment_method, account_id, outlet_id))
+        _post_expense_journal(conn, c.lastrowid, expense_date, description, amount, payment_method, account_id, outlet_id)
+        conn.commit()
+        return True, "Pengeluaran ditambahkan dan jurnal dibuat."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menambahkan pengeluaran: {e}"
+    finally:
+        conn.close()
+
+def update_expense(expense_id, expense_date, category, description, amount, payment_method, account_id):
+    """Ubah pengeluaran: jurnal lamanya dibalik lalu jurnal baru diposting sesuai data baru. Mengembalikan (berhasil, pesan)."""
+    amount = to_rupiah(amount)
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT IFNULL(outlet_id, 1), voided_at FROM expenses WHERE id = ?", (expense_id,))
+        row = c.fetchone()
+        if not row:
+            raise ValueError(f"Pengeluaran #{expense_id} tidak ditemukan.")
+        if row[1]:
+            raise ValueError(f"Pengeluaran #{expense_id} sudah dibatalkan.")
+        c.execute("UPDATE expenses SET date=?, category=?, description=?, amount=?, payment_method=?, account_id=? WHERE id=?",
+                  (expense_date, category, description, amount, payment_method, account_id, expense_id))
+        c.execute("SELECT id FROM journal_entries WHERE expense_id = ?", (expense_id,))
+        reverse_journal_entries(conn, [journal_entry_id for journal_entry_id, in c.fetchall()], datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "Diubah")
+        _post_expense_journal(conn, expense_id, expense_date, description, amount, payment_method, account_id, row[0])
+        conn.commit()
+        return True, "Pengeluaran diperbarui, jurnal lama dibalik dan jurnal baru dibuat."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal memperbarui pengeluaran: {e}"
+    finally:
+        conn.close()
+
+def void_expense(expense_id, reason="Dibatalkan"):
+    """Batalkan pengeluaran: tandai voided_at dan balik jurnalnya (tidak ada baris yang dihapus). Mengembalikan (berhasil, pesan)."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT voided_at FROM expenses WHERE id = ?", (expense_id,))
+        row = c.fetchone()
+        if not row:
+            raise ValueError(f"Pengeluaran #{expense_id} tidak ditemukan.")
+        if row[0]:
+            raise ValueError(f"Pengeluaran #{expense_id} sudah dibatalkan pada {row[0]}.")
+        voided_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        c.execute("UPDATE expenses SET voided_at = ? WHERE id = ?", (voided_at, expense_id))
+        c.execute("SELECT id FROM journal_entries WHERE expense_id = ?", (expense_id,))
+        reverse_journal_entries(conn, [journal_entry_id for journal_entry_id, in c.fetchall()], voided_at, reason)
+        conn.commit()
+        return True, f"Pengeluaran #{expense_id} dibatalkan dan jurnalnya dibalik."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal membatalkan pengeluaran: {e}"
+    finally:
+        conn.close()
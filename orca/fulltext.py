@@ -0,0 +1,38 @@
+"""Pencarian global full-text (SQLite FTS5) atas pengeluaran, jurnal, pelanggan, pemasok, dan transaksi.
+
+Indeks dan trigger sinkronisasinya dibuat di orca.schema.create_search_tables.
+"""
+import re
+
+from orca.db import get_df
+
+SEARCH_LIMIT = 50
+
+# Setiap cabang dibatasi & diurutkan dengan bm25 di indeksnya sendiri, lalu digabung berdasarkan skor
+_BRANCHES = [
+    ("Pengeluaran", "expenses_fts", "expenses", "x.date", "x.description"),
+    ("Jurnal", "journal_fts", "journal_entries", "x.entry_date", "x.description"),
+    ("Pelanggan", "customers_fts", "customers", "NULL", "x.name"),
+    ("Pemasok", "suppliers_fts", "suppliers", "NULL", "x.name"),
+    ("Transaksi", "transactions_fts", "transactions", "x.transaction_date", "'Transaksi #' || x.id"),
+]
+SEARCH_SQL = " UNION ALL ".join(f"""
+    SELECT * FROM (
+        SELECT '{kind}' AS kind, x.id AS ref_id, {date_col} AS ref_date, {title_col} AS title,
+            snippet({fts}, -1, '**', '**', '…', 12) AS snippet, bm25({fts}) AS score
+        FROM {fts} JOIN {source} x ON x.id = {fts}.rowid
+        WHERE {fts} MATCH ? ORDER BY score LIMIT ?
+    )""" for kind, fts, source, date_col, title_col in _BRANCHES) + " ORDER BY score LIMIT ?"
+
+
+def build_match_query(text):
+    """Input bebas -> query FTS5: setiap kata dicari sebagai awalan ("kata"*) dan semuanya harus ada."""
+    words = re.findall(r"\w+", text or '')
+    return ' '.join(f'"{word}"*' for word in words)
+
+def global_search(text, limit=SEARCH_LIMIT):
+    """Hasil pencarian lintas entitas, terurut relevansi (bm25, makin kecil makin relevan)."""
+    match = build_match_query(text)
+    if not match:
+        return None
+    return get_df(SEARCH_SQL, (match, limit) * len(_BRANCHES) + (limit,))
@@ -0,0 +1,162 @@
+"""Impor massal produk, bahan, dan resep dari CSV/XLSX.
+
+File dibaca bertahap (per IMPORT_CHUNK_ROWS baris), divalidasi per baris, lalu dibandingkan dengan isi
+database (dry-run) sebelum disimpan. Penyimpanan memakai satu executemany INSERT ... ON CONFLICT DO UPDATE
+per jenis data dalam satu transaksi, sehingga ribuan baris tersimpan tanpa rerun per baris.
+"""
+import pandas as pd
+
+from orca.db import get_connection, get_df
+
+IMPORT_CHUNK_ROWS = 1000
+
+# Kolom file -> kolom internal, kolom kunci, dan kolom nilai yang dibandingkan/diperbarui
+IMPORT_KINDS = {
+    'Produk': {
+        'columns': {'Nama Produk': 'name', 'Harga Jual': 'price'},
+        'keys': ['name'],
+        'values': ['price'],
+    },
+    'Bahan': {
+        'columns': {'Nama Bahan': 'name', 'Satuan': 'unit', 'Harga Kemasan': 'pack_price', 'Berat Kemasan': 'pack_weight'},
+        'keys': ['name'],
+        'values': ['unit', 'pack_price', 'pack_weight', 'cost_per_unit'],
+    },
+    'Resep': {
+        'columns': {'Nama Produk': 'product', 'Nama Bahan': 'ingredient', 'Jumlah': 'qty_per_unit'},
+        'keys': ['product_id', 'ingredient_id'],
+        'values': ['qty_per_unit'],
+    },
+}
+NUMERIC_COLUMNS = {'price', 'pack_price', 'pack_weight', 'qty_per_unit'}
+
+UPSERT_SQL = {
+    'Produk': """INSERT INTO products (name, price) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET price = excluded.price""",
+    'Bahan': """INSERT INTO ingredients (name, unit, pack_price, pack_weight, cost_per_unit, stock) VALUES (?, ?, ?, ?, ?, 0)
+        ON CONFLICT(name) DO UPDATE SET unit = excluded.unit, pack_price = excluded.pack_price,
+            pack_weight = excluded.pack_weight, cost_per_unit = excluded.cost_per_unit""",
+    'Resep': """INSERT INTO recipes (product_id, ingredient_id, qty_per_unit) VALUES (?, ?, ?)
+        ON CONFLICT(product_id, ingredient_id) DO UPDATE SET qty_per_unit = excluded.qty_per_unit""",
+}
+UPSERT_COLUMNS = {
+    'Produk': ['name', 'price'],
+    'Bahan': ['name', 'unit', 'pack_price', 'pack_weight', 'cost_per_unit'],
+    'Resep': ['product_id', 'ingredient_id', 'qty_per_unit'],
+}
+
+
+def import_template(kind):
+    """Template CSV berisi kolom yang dibutuhkan untuk jenis impor tertentu."""
+    return pd.DataFrame(columns=list(IMPORT_KINDS[kind]['columns'])).to_csv(index=False).encode('utf-8')
+
+def iter_import_chunks(uploaded_file):
+    """Baca file impor sebagai potongan DataFrame (semua kolom sebagai teks)."""
+    if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+        try:
+            sheet = pd.read_excel(uploaded_file, dtype=str)
+        except ImportError:
+            raise ValueError("Membaca file Excel membutuhkan paket 'openpyxl' (lihat requirements.txt). Gunakan CSV atau instal paket tersebut.")
+        for start in range(0, len(sheet), IMPORT_CHUNK_ROWS):
+            yield sheet.iloc[start:start + IMPORT_CHUNK_ROWS]
+    else:
+        yield from pd.read_csv(uploaded_file, dtype=str, chunksize=IMPORT_CHUNK_ROWS)
+
+def _validate_chunk(kind, chunk, errors):
+    """Validasi satu potongan; baris bermasalah dicatat di errors (nomor baris sesuai file) dan dibuang."""
+    spec = IMPORT_KINDS[kind]
+    columns = {str(col).strip().lower(): col for col in chunk.columns}
+    missing = [col for col in spec['columns'] if col.lower() not in columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}.")
+    rows = pd.DataFrame({internal: chunk[columns[col.lower()]].astype('string').str.strip() for col, internal in spec['columns'].items()})
+    rows['row'] = chunk.index + 2 # Baris 1 = header
+    rows = rows.dropna(how='all', subset=list(spec['columns'].values()))
+
+    bad = pd.Series(False, index=rows.index)
+    for label, internal in spec['columns'].items():
+        if internal in NUMERIC_COLUMNS:
+            raw = rows[internal]
+            rows[internal] = pd.to_numeric(raw, errors='coerce')
+            invalid = rows[internal].isna() | (rows[internal] < 0)
+            errors += [f"Baris {row}: nilai '{value}' tidak valid untuk kolom {label}." for row, value in zip(rows.loc[invalid & ~bad, 'row'], raw[invalid & ~bad])]
+        else:
+            invalid = rows[internal].isna() | (rows[internal] == '')
+            errors += [f"Baris {row}: kolom {label} kosong." for row in rows.loc[invalid & ~bad, 'row']]
+        bad |= invalid
+    return rows[~bad]
+
+def _lookup(rows, column, table, errors, label):
+    """Ganti nama (tanpa membedakan huruf besar/kecil) menjadi id dari tabel referensi."""
+    reference = get_df(f"SELECT id, name FROM {table}")
+    ids = dict(zip(reference['name'].str.lower(), reference['id']))
+    found = rows[column].str.lower().map(ids)
+    errors += [f"Baris {row}: {label} '{name}' tidak ditemukan." for row, name in zip(rows.loc[found.isna(), 'row'], rows.loc[found.isna(), column])]
+    rows = rows[found.notna()].copy()
+    rows[f"{column}_id"] = found[found.notna()].astype(int)
+    return rows
+
+def prepare_import(kind, uploaded_file):
+    """Dry-run: validasi file dan bandingkan dengan database.
+
+    Mengembalikan (DataFrame dengan kolom 'Status' Baru/Berubah/Sama beserta nilai lama, daftar pesan kesalahan).
+    Tidak ada yang ditulis ke database.
+    """
+    spec = IMPORT_KINDS[kind]
+    errors = []
+    rows = pd.concat([_validate_chunk(kind, chunk, errors) for chunk in iter_import_chunks(uploaded_file)], ignore_index=True)
+
+    if kind == 'Bahan':
+        rows['cost_per_unit'] = (rows['pack_price'] / rows['pack_weight']).where(rows['pack_weight'] > 0, 0.0)
+        existing = get_df("SELECT name AS db_name, unit, pack_price, pack_weight, cost_per_unit FROM ingredients")
+    elif kind == 'Produk':
+        existing = get_df("SELECT name AS db_name, price FROM products")
+    else:
+        rows = _lookup(_lookup(rows, 'product', 'products', errors, 'produk'), 'ingredient', 'ingredients', errors, 'bahan')
+        existing = get_df("SELECT product_id, ingredient_id, qty_per_unit FROM recipes")
+
+    if kind != 'Resep':
+        # Nama dicocokkan tanpa membedakan huruf besar/kecil, lalu memakai ejaan di database agar ON CONFLICT(name) kena
+        rows['key'] = rows['name'].str.lower()
+        existing['key'] = existing['db_name'].str.lower()
+        merge_keys = ['key']
+    else:
+        merge_keys = spec['keys']
+    duplicated = rows.duplicated(merge_keys, keep=False)
+    for _, group in rows[duplicated].groupby(merge_keys, sort=False):
+        errors.append(f"Baris {', '.join(map(str, group['row']))}: data yang sama muncul lebih dari sekali.")
+    rows = rows[~duplicated]
+
+    diff = rows.merge(existing, on=merge_keys, how='left', suffixes=('', '_lama'), indicator=True)
+    if kind != 'Resep':
+        diff['name'] = diff['db_name'].fillna(diff['name'])
+    changed = pd.Series(False, index=diff.index)
+    for col in spec['values']:
+        old = diff[f"{col}_lama"]
+        if col in NUMERIC_COLUMNS or col == 'cost_per_unit':
+            changed |= ~((diff[col] - pd.to_numeric(old)).abs() < 1e-9)
+        else:
+            changed |= (diff[col] != old.astype('string')).fillna(True).astype(bool)
+    diff['Status'] = 'Sama'
+    diff.loc[changed, 'Status'] = 'Berubah'
+    diff.loc[diff['_merge'] == 'left_only', 'Status'] = 'Baru'
+    return diff.drop(columns=['_merge', 'key', 'db_name'], errors='ignore').sort_values('row'), errors
+
+def apply_import(kind, diff):
+    """Simpan baris Baru/Berubah hasil prepare_import dalam satu transaksi. Mengembalikan (berhasil, pesan)."""
+    pending = diff[diff['Status'] != 'Sama']
+    if pending.empty:
+        return True, "Tidak ada perubahan untuk disimpan."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.executemany(UPSERT_SQL[kind], pending[UPSERT_COLUMNS[kind]].itertuples(index=False, name=None))
+        conn.commit()
+        counts = pending['Status'].value_counts()
+        return True, f"Impor {kind.lower()} selesai: {counts.get('Baru', 0)} baru, {counts.get('Berubah', 0)} diperbarui."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal mengimpor {kind.lower()}: {e}"
+    finally:
+        conn.close()
@@ -0,0 +1,99 @@
+"""Buku mutasi stok bahan (stock_movements).
+
+Setiap perubahan stok ditulis sebagai baris mutasi (append-only) dan saldo
+berjalan tetap disimpan di outlet_stock (per outlet) dan ingredients.stock (total
+semua outlet), semuanya dalam transaksi yang sama. Invarian: SUM(qty_delta) per
+(outlet, bahan) == outlet_stock.stock dan per bahan == ingredients.stock. Lot FIFO
+ikut diperbarui per outlet, lihat orca/costing.py.
+"""
+from datetime import datetime
+
+from orca.config import OUTLET_ID
+from orca.db import get_connection, get_df
+from orca.costing import post_fifo
+
+
+def post_stock_movements(c, movements, reason, ref_id=None, moved_at=None, unit_costs=None, fifo=True, outlet_id=OUTLET_ID):
+    """Catat mutasi [(ingredient_id, qty_delta), ...] di outlet_id dan perbarui saldo bahan.
+
+    Mutasi masuk membuat lot FIFO (harga dari unit_costs, default HPP bahan); mutasi keluar
+    mengonsumsi lot tertua. Mengembalikan total biaya FIFO mutasi keluar. fifo=False dipakai
+    jika lot sudah dipulihkan sendiri (pembatalan). Dipanggil dengan cursor milik transaksi
+    pemanggil (commit/rollback oleh pemanggil).
+    """
+    movements = [(ing_id, qty_delta) for ing_id, qty_delta in movements if qty_delta]
+    if not movements:
+        return 0.0
+    moved_at = moved_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    c.executemany("INSERT INTO stock_movements (ingredient_id, qty_delta, reason, ref_id, moved_at, outlet_id) VALUES (?, ?, ?, ?, ?, ?)",
+                  [(ing_id, qty_delta, reason, ref_id, moved_at, outlet_id) for ing_id, qty_delta in movements])
+    consumed_cost = post_fifo(c, movements, reason, ref_id, moved_at, unit_costs, outlet_id) if fifo else 0.0
+    c.executemany("""INSERT INTO outlet_stock (outlet_id, ingredient_id, stock) VALUES (?, ?, ?)
+        ON CONFLICT(outlet_id, ingredient_id) DO UPDATE SET stock = stock + excluded.stock""", [(outlet_id, ing_id, qty_delta) for ing_id, qty_delta in movements])
+    c.executemany("UPDATE ingredients SET stock = IFNULL(stock, 0) + ? WHERE id = ?", [(qty_delta, ing_id) for ing_id, qty_delta in movements])
+    return consumed_cost
+
+def get_outlet_stock(c, ingredient_ids, outlet_id=OUTLET_ID):
+    """Saldo stok bahan di satu outlet: {ingredient_id: stok} (bahan tanpa saldo = 0)."""
+    ids = list(set(ingredient_ids))
+    placeholders = ', '.join('?' * len(ids))
+    c.execute(f"SELECT ingredient_id, stock FROM outlet_stock WHERE outlet_id = ? AND ingredient_id IN ({placeholders})", [outlet_id, *ids])
+    stock = dict(c.fetchall())
+    return {ing_id: stock.get(ing_id) or 0 for ing_id in ids}
+
+def set_stock(c, ingredient_id, new_stock, reason="Penyesuaian", ref_id=None, outlet_id=OUTLET_ID):
+    """Setel stok outlet ke nilai tertentu lewat mutasi selisihnya (untuk koreksi manual/opname)."""
+    current = get_outlet_stock(c, [ingredient_id], outlet_id)[ingredient_id]
+    post_stock_movements(c, [(ingredient_id, new_stock - current)], reason, ref_id, outlet_id=outlet_id)
+
+def stock_as_of(as_of_date, outlet_id=OUTLET_ID):
+    """Posisi stok outlet per akhir tanggal: saldo sekarang dikurangi mutasi sesudahnya (memakai indeks outlet_id, ingredient_id, moved_at)."""
+    return get_df("""
+        SELECT i.id, i.name AS 'Nama', i.unit AS 'Unit',
+            IFNULL(s.stock, 0) - IFNULL((SELECT SUM(m.qty_delta) FROM stock_movements m WHERE m.outlet_id = ? AND m.ingredient_id = i.id AND m.moved_at > ?), 0) AS 'Stok',
+            IFNULL(s.stock, 0) AS 'Stok Saat Ini'
+        FROM ingredients i LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id ORDER BY i.name
+    """, (outlet_id, f"{as_of_date} 23:59:59", outlet_id))
+
+def get_stock_card(ingredient_id, limit=200, outlet_id=OUTLET_ID):
+    """Kartu stok outlet: mutasi terbaru satu bahan beserta saldo setelah setiap mutasi."""
+    return get_df("""
+        SELECT * FROM (
+            SELECT moved_at AS 'Waktu', reason AS 'Keterangan', ref_id AS 'Ref', qty_delta AS 'Mutasi',
+                SUM(qty_delta) OVER (ORDER BY moved_at, id) AS 'Saldo', id
+            FROM stock_movements WHERE outlet_id = ? AND ingredient_id = ?
+        ) ORDER BY id DESC LIMIT ?
+    """, (outlet_id, ingredient_id, limit)).drop(columns='id')
+
+def compact_stock_movements(before_date):
+    """Ringkas mutasi sebelum tanggal menjadi satu baris 'Saldo Awal' per outlet & bahan.
+
+    Saldo dan posisi stok per tanggal >= before_date tidak berubah. Mengembalikan (berhasil, pesan).
+    """
+    cutoff = f"{before_date} 00:00:00"
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT IFNULL(MAX(id), 0), COUNT(*) FROM stock_movements WHERE moved_at < ?", (cutoff,))
+        last_id, old_rows = c.fetchone()
+        c.execute("""INSERT INTO stock_movements (ingredient_id, qty_delta, reason, ref_id, moved_at, outlet_id)
+            SELECT ingredient_id, SUM(qty_delta), 'Saldo Awal', NULL, MAX(moved_at), outlet_id FROM stock_movements
+            WHERE moved_at < ? AND id <= ? GROUP BY outlet_id, ingredient_id HAVING SUM(qty_delta) != 0""", (cutoff, last_id))
+        summary_rows = c.rowcount
+        c.execute("DELETE FROM stock_movements WHERE moved_at < ? AND id <= ?", (cutoff, last_id))
+        conn.commit()
+        return True, f"{old_rows} mutasi sebelum {before_date} diringkas menjadi {summary_rows} baris saldo awal."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal meringkas mutasi stok: {e}"
+    finally:
+        conn.close()
+
+def get_open_lots(ingredient_id, outlet_id=OUTLET_ID):
+    """Lot FIFO yang masih bersisa untuk satu bahan di outlet, tertua lebih dulu."""
+    return get_df("""
+        SELECT received_at AS 'Masuk', source AS 'Sumber', ref_id AS 'Ref', qty_received AS 'Qty Masuk',
+            qty_remaining AS 'Sisa', unit_cost AS 'Harga Satuan'
+        FROM inventory_lots WHERE outlet_id = ? AND ingredient_id = ? AND qty_remaining > 0 ORDER BY id
+    """, (outlet_id, ingredient_id))
@@ -0,0 +1,127 @@
+"""Nilai uang disimpan sebagai rupiah bulat (INTEGER), bukan REAL.
+
+Kolom di MONEY_COLUMNS menyimpan rupiah utuh sehingga penjumlahan di SQL dan pandas eksak (tanpa selisih
+pembulatan float) dan jurnal cukup dibandingkan dengan `==`. Nilai pecahan (mis. HPP dari biaya per gram)
+dibulatkan ke rupiah dengan to_rupiah tepat sebelum disimpan. Kuantitas dan biaya satuan tetap REAL.
+"""
+import re
+from decimal import Decimal, ROUND_HALF_UP
+
+from orca.db import get_connection
+
+# Tabel -> kolom uang (rupiah bulat)
+MONEY_COLUMNS = {
+    'transactions': ['total_amount'],
+    'transaction_items': ['price_per_unit'],
+    'expenses': ['amount'],
+    'journal_items': ['debit', 'kredit'],
+    'sales_accruals': ['amount', 'cogs'],
+    'goods_receipts': ['total_amount'],
+    'open_items': ['amount', 'paid_amount'],
+    'payments': ['amount'],
+    'payment_allocations': ['amount'],
+    'shifts': ['opening_float', 'cash_in', 'cash_out', 'counted_cash', 'expected_cash', 'variance'],
+    'shift_totals': ['sales_amount', 'void_amount'],
+    'shift_cash_movements': ['amount'],
+    'stock_opnames': ['gain_value', 'loss_value'],
+    'production_runs': ['total_cost'],
+    'parked_orders': ['total_amount'],
+    'depreciation_postings': ['amount'],
+    'bank_statement_lines': ['amount', 'fee'],
+}
+
+
+def to_rupiah(amount):
+    """Bulatkan nilai uang ke rupiah utuh (setengah menjauhi nol, sama seperti ROUND() SQLite)."""
+    if amount is None:
+        return 0
+    return int(Decimal(repr(float(amount))).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def convert_money_columns(c):
+    """Migrasi sekali jalan: bangun ulang tabel yang kolom uangnya masih REAL menjadi INTEGER (nilai dibulatkan).
+
+    Indeks dan trigger tabel dibuat ulang dari definisinya di sqlite_master. Jurnal yang menjadi tidak seimbang
+    hanya karena pembulatan per baris diseimbangkan pada baris terbesar di sisi yang kurang.
+    Mengembalikan jumlah tabel yang dikonversi.
+    """
+    converted = 0
+    for table, columns in MONEY_COLUMNS.items():
+        c.execute(f"PRAGMA table_info({table})")
+        info = c.fetchall()
+        if not info or all(col_type.upper() == 'INTEGER' for _, name, col_type, *_ in info if name in columns):
+            continue
+        c.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        create_sql = c.fetchone()[0]
+        for column in columns:
+            create_sql = re.sub(rf"\b({column})\s+REAL(\s+DEFAULT\s+0\.0)?", lambda m: f"{m.group(1)} INTEGER" + (" DEFAULT 0" if m.group(2) else ""), create_sql)
+        create_sql = re.sub(rf"^CREATE TABLE \"?{table}\"?", f"CREATE TABLE {table}_new", create_sql)
+        c.execute("SELECT sql FROM sqlite_master WHERE type IN ('index', 'trigger') AND tbl_name = ? AND sql IS NOT NULL", (table,))
+        dependents = [sql for sql, in c.fetchall()]
+        names = [name for _, name, *_ in info]
+        select = ', '.join(f"CAST(ROUND({name}) AS INTEGER)" if name in columns else name for name in names)
+        # Mode legacy: rename tidak memeriksa/menulis ulang trigger tabel lain yang merujuk nama tabel ini
+        c.execute("PRAGMA legacy_alter_table = ON")
+        c.execute(create_sql)
+        c.execute(f"INSERT INTO {table}_new ({', '.join(names)}) SELECT {select} FROM {table}")
+        c.execute(f"DROP TABLE {table}")
+        c.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        c.execute("PRAGMA legacy_alter_table = OFF")
+        for sql in dependents:
+            c.execute(sql)
+        converted += 1
+    if converted:
+        _balance_rounding(c)
+    return converted
+
+def _balance_rounding(c):
+    """Selisih pembulatan per jurnal (paling banyak setengah rupiah per baris) dipindahkan ke baris terbesar di sisi yang kurang."""
+    c.execute("""SELECT journal_entry_id, SUM(debit) - SUM(kredit), COUNT(*) FROM journal_items
+        GROUP BY journal_entry_id HAVING SUM(debit) != SUM(kredit)""")
+    for journal_entry_id, difference, lines in c.fetchall():
+        if abs(difference) * 2 > lines:
+            continue # Bukan selisih pembulatan; dilaporkan oleh check_money_consistency
+        side = 'kredit' if difference > 0 else 'debit'
+        c.execute(f"""UPDATE journal_items SET {side} = {side} + ? WHERE id = (
+            SELECT id FROM journal_items WHERE journal_entry_id = ? ORDER BY {side} DESC, id LIMIT 1)""", (abs(difference), journal_entry_id))
+
+def check_money_consistency():
+    """Pemeriksaan konsistensi data uang (termasuk total berjalan shift kasir terhadap transaksinya). Mengembalikan DataFrame (Pemeriksaan, Jumlah, Contoh ID); Jumlah 0 berarti lolos."""
+    import pandas as pd # Diimpor saat dibutuhkan: modul ini ikut dimuat saat migrasi di halaman login
+    checks = [
+        ("Nilai uang bukan rupiah bulat", " UNION ALL ".join(
+            f"SELECT '{table}#' || rowid AS id FROM {table} WHERE " + " OR ".join(f"({col} IS NOT NULL AND typeof({col}) != 'integer')" for col in columns)
+            for table, columns in MONEY_COLUMNS.items())),
+        ("Jurnal tidak seimbang (debit != kredit)",
+         "SELECT journal_entry_id AS id FROM journal_items GROUP BY journal_entry_id HAVING SUM(debit) != SUM(kredit)"),
+        ("Total transaksi != jumlah item",
+         """SELECT t.id FROM transactions t JOIN transaction_items ti ON ti.transaction_id = t.id
+            GROUP BY t.id HAVING t.total_amount != SUM(ti.quantity * ti.price_per_unit)"""),
+        ("Jurnal penjualan != total transaksi",
+         """SELECT je.transaction_id AS id FROM journal_entries je
+            JOIN journal_items ji ON ji.journal_entry_id = je.id
+            JOIN accounts a ON a.id = ji.account_id AND a.account_name = 'Pendapatan Penjualan'
+            JOIN transactions t ON t.id = je.transaction_id
+            WHERE je.reversal_of IS NULL AND je.reversed_by IS NULL
+            GROUP BY je.id HAVING SUM(ji.kredit) != MAX(t.total_amount)"""),
+        ("Jurnal pengeluaran != nilai pengeluaran",
+         """SELECT je.expense_id AS id FROM journal_entries je
+            JOIN journal_items ji ON ji.journal_entry_id = je.id
+            JOIN expenses e ON e.id = je.expense_id
+            WHERE je.reversal_of IS NULL AND je.reversed_by IS NULL
+            GROUP BY je.id HAVING SUM(ji.debit) != MAX(e.amount)"""),
+        ("Total berjalan shift != transaksi shift",
+         """SELECT st.shift_id AS id FROM shift_totals st
+            LEFT JOIN (SELECT shift_id, payment_method, COUNT(*) AS n, SUM(total_amount) AS amount FROM transactions
+                WHERE shift_id IS NOT NULL GROUP BY shift_id, payment_method) t ON t.shift_id = st.shift_id AND t.payment_method = st.payment_method
+            WHERE st.sales_count != IFNULL(t.n, 0) OR st.sales_amount != IFNULL(t.amount, 0)"""),
+    ]
+    conn = get_connection()
+    c = conn.cursor()
+    rows = []
+    for name, query in checks:
+        c.execute(f"SELECT COUNT(*) FROM ({query})")
+        count = c.fetchone()[0]
+        c.execute(f"SELECT id FROM ({query}) LIMIT 10")
+        rows.append((name, count, ', '.join(str(row_id) for row_id, in c.fetchall())))
+    conn.close()
+    return pd.DataFrame(rows, columns=['Pemeriksaan', 'Jumlah', 'Contoh ID'])
@@ -0,0 +1,122 @@
+"""Stok opname massal: unggah hasil hitung fisik (CSV/XLSX), bandingkan dengan stok sistem, posting selisih.
+
+Perbandingan dilakukan sekaligus dengan operasi DataFrame (tanpa loop per bahan) dan posting
+semua penyesuaian + jurnal selisih persediaan berlangsung dalam satu transaksi database.
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from orca.config import OUTLET_ID
+from orca.db import get_connection, get_df
+from orca.accounting import create_journal_entry
+from orca.inventory import post_stock_movements
+from orca.money import to_rupiah
+
+NAME_COLUMN = "Nama Bahan"
+COUNT_COLUMN = "Stok Fisik"
+GAIN_ACCOUNT = "Pendapatan Lain-lain" # Selisih lebih persediaan
+LOSS_ACCOUNT = "Beban Lain-lain" # Selisih kurang persediaan
+
+
+def count_template():
+    """Template CSV: semua bahan dengan stok sistem sebagai acuan dan kolom hitung fisik kosong."""
+    df = get_df(f"""SELECT i.name AS '{NAME_COLUMN}', i.unit AS 'Satuan', IFNULL(s.stock, 0) AS 'Stok Sistem' FROM ingredients i
+        LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id ORDER BY i.name""", (OUTLET_ID,))
+    df[COUNT_COLUMN] = None
+    return df.to_csv(index=False).encode('utf-8')
+
+def read_count_file(uploaded_file):
+    """Baca file hitung fisik (CSV atau XLSX) menjadi DataFrame."""
+    if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+        try:
+            return pd.read_excel(uploaded_file)
+        except ImportError:
+            raise ValueError("Membaca file Excel membutuhkan paket 'openpyxl' (lihat requirements.txt). Gunakan CSV atau instal paket tersebut.")
+    return pd.read_csv(uploaded_file)
+
+def compare_counts(count_df):
+    """Validasi & bandingkan hitung fisik dengan stok sistem.
+
+    Mengembalikan (DataFrame selisih, daftar pesan kesalahan). Baris dengan kesalahan tidak ikut diposting.
+    """
+    columns = {str(col).strip().lower(): col for col in count_df.columns}
+    missing = [col for col in (NAME_COLUMN, COUNT_COLUMN) if col.lower() not in columns]
+    if missing:
+        return None, [f"Kolom wajib tidak ditemukan: {', '.join(missing)}."]
+    counts = pd.DataFrame({
+        'name': count_df[columns[NAME_COLUMN.lower()]].astype('string').str.strip(),
+        'counted_qty': pd.to_numeric(count_df[columns[COUNT_COLUMN.lower()]], errors='coerce'),
+        'raw_count': count_df[columns[COUNT_COLUMN.lower()]],
+    })
+    counts = counts[counts['name'].notna() & (counts['name'] != '')]
+    counts['key'] = counts['name'].str.lower()
+
+    errors = []
+    blank = counts['raw_count'].isna() | (counts['raw_count'].astype('string').str.strip() == '')
+    counts = counts[~blank] # Baris tanpa angka = bahan tidak dihitung
+    invalid = counts['counted_qty'].isna() | (counts['counted_qty'] < 0)
+    errors += [f"Stok fisik tidak valid untuk '{name}'." for name in counts.loc[invalid, 'name']]
+    duplicated = counts['key'].duplicated(keep=False)
+    errors += [f"Bahan '{name}' muncul lebih dari sekali." for name in counts.loc[duplicated, 'name'].drop_duplicates()]
+
+    ingredients = get_df("""SELECT i.id AS ingredient_id, i.name AS system_name, i.unit, IFNULL(s.stock, 0) AS system_qty, IFNULL(i.cost_per_unit, 0) AS unit_cost
+        FROM ingredients i LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id""", (OUTLET_ID,))
+    ingredients['key'] = ingredients['system_name'].str.strip().str.lower()
+    merged = counts[~invalid & ~duplicated].merge(ingredients, on='key', how='left')
+    unknown = merged['ingredient_id'].isna()
+    errors += [f"Bahan '{name}' tidak ditemukan di sistem." for name in merged.loc[unknown, 'name']]
+
+    result = merged[~unknown].copy()
+    result['ingredient_id'] = result['ingredient_id'].astype(int)
+    result['variance'] = result['counted_qty'] - result['system_qty']
+    result['variance_value'] = result['variance'] * result['unit_cost']
+    return result[['ingredient_id', 'system_name', 'unit', 'system_qty', 'counted_qty', 'variance', 'unit_cost', 'variance_value']], errors
+
+def post_stock_opname(result, employee_id=None, notes=None):
+    """Posting hasil compare_counts: mutasi 'Opname' untuk setiap selisih + jurnal selisih persediaan.
+
+    Stok sistem dibaca ulang di dalam transaksi posting, sehingga penjualan/penerimaan sejak pratinjau ikut
+    diperhitungkan dan stok akhir sama dengan hasil hitung fisik. Mengembalikan (berhasil, pesan).
+    """
+    counted_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        ingredient_ids = result['ingredient_id'].tolist()
+        c.execute(f"SELECT ingredient_id, stock FROM outlet_stock WHERE outlet_id = ? AND ingredient_id IN ({', '.join('?' * len(ingredient_ids))})",
+                  (OUTLET_ID, *ingredient_ids))
+        result = result.assign(system_qty=result['ingredient_id'].map(dict(c.fetchall())).fillna(0.0))
+        result['variance'] = result['counted_qty'] - result['system_qty']
+        changed = result[result['variance'].abs() > 1e-9]
+        gains = changed[changed['variance'] > 0]
+        gain_value = to_rupiah((gains['variance'] * gains['unit_cost']).sum())
+        c.execute("INSERT INTO stock_opnames (counted_at, employee_id, items_counted, gain_value, loss_value, notes) VALUES (?, ?, ?, ?, 0, ?)",
+                  (counted_at, employee_id, len(result), gain_value, notes))
+        opname_id = c.lastrowid
+        c.executemany("INSERT INTO stock_opname_items (opname_id, ingredient_id, system_qty, counted_qty, variance, unit_cost) VALUES (?, ?, ?, ?, ?, ?)",
+                      [(opname_id, *row) for row in result[['ingredient_id', 'system_qty', 'counted_qty', 'variance', 'unit_cost']].itertuples(index=False)])
+        # Selisih kurang dibiayai FIFO (nilai kembalian), selisih lebih menjadi lot baru seharga HPP bahan
+        loss_value = to_rupiah(post_stock_movements(c, list(changed[['ingredient_id', 'variance']].itertuples(index=False, name=None)), 'Opname', opname_id, counted_at))
+        c.execute("UPDATE stock_opnames SET loss_value = ? WHERE id = ?", (loss_value, opname_id))
+
+        c.execute("SELECT account_name, id FROM accounts WHERE account_name IN ('Persediaan Bahan Baku', ?, ?)", (GAIN_ACCOUNT, LOSS_ACCOUNT))
+        account_ids = dict(c.fetchall())
+        journal_entries = []
+        if gain_value > 0:
+            journal_entries += [{'account_id': account_ids['Persediaan Bahan Baku'], 'debit': gain_value}, {'account_id': account_ids[GAIN_ACCOUNT], 'kredit': gain_value}]
+        if loss_value > 0:
+            journal_entries += [{'account_id': account_ids[LOSS_ACCOUNT], 'debit': loss_value}, {'account_id': account_ids['Persediaan Bahan Baku'], 'kredit': loss_value}]
+        if journal_entries:
+            success_journal, msg_journal, _ = create_journal_entry(counted_at, f"Selisih Stok Opname #{opname_id}", journal_entries, conn=conn)
+            if not success_journal:
+                raise ValueError(msg_journal)
+
+        conn.commit()
+        return True, f"Stok opname #{opname_id} diposting: {len(changed)} bahan disesuaikan (lebih Rp {gain_value:,.0f}, kurang Rp {loss_value:,.0f})."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal memposting stok opname: {e}"
+    finally:
+        conn.close()
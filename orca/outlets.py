@@ -0,0 +1,74 @@
+"""Outlet (cabang): daftar outlet, transfer stok antar outlet, dan eksekusi laporan per outlet secara paralel.
+
+Setiap terminal tercatat di satu outlet (config.OUTLET_ID). Laporan konsolidasi dihitung per outlet
+(setiap outlet memakai indeks yang diawali outlet_id) di thread terpisah dengan koneksi masing-masing,
+lalu hasil parsialnya dijumlahkan.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from orca.config import OUTLET_WORKERS
+from orca.db import get_connection, run_query
+from orca.inventory import post_stock_movements, get_outlet_stock
+
+
+def get_outlets(active_only=True):
+    """{outlet_id: nama} urut id."""
+    return dict(run_query("SELECT id, name FROM outlets" + (" WHERE IFNULL(is_active, 1) = 1" if active_only else "") + " ORDER BY id", fetch='all'))
+
+def map_outlets(fn, outlet_ids, *args):
+    """Jalankan fn(outlet_id, *args) untuk setiap outlet secara paralel. Mengembalikan {outlet_id: hasil}.
+
+    SQLite melepas GIL selama query berjalan, jadi query baca per outlet benar-benar berjalan bersamaan.
+    """
+    outlet_ids = list(outlet_ids)
+    if len(outlet_ids) <= 1:
+        return {outlet_id: fn(outlet_id, *args) for outlet_id in outlet_ids}
+    # Thread pekerja ikut konteks sesi Streamlit (instrumentasi query membaca menu aktif)
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=min(len(outlet_ids), OUTLET_WORKERS), initializer=lambda: add_script_run_ctx(ctx=ctx) if ctx else None) as pool:
+        futures = {outlet_id: pool.submit(fn, outlet_id, *args) for outlet_id in outlet_ids}
+        return {outlet_id: future.result() for outlet_id, future in futures.items()}
+
+def add_outlet(name, address=None):
+    """Tambah outlet baru. Mengembalikan (berhasil, pesan)."""
+    if not name:
+        return False, "Nama outlet tidak boleh kosong."
+    try:
+        run_query("INSERT INTO outlets (name, address) VALUES (?, ?)", (name, address))
+        return True, f"Outlet '{name}' ditambahkan."
+    except Exception as e:
+        return False, f"Gagal menambahkan outlet: {e}"
+
+def transfer_stock(lines, from_outlet, to_outlet):
+    """Pindahkan stok [(ingredient_id, qty), ...] antar outlet dengan biaya lot FIFO asal.
+
+    Total stok perusahaan tidak berubah sehingga tidak ada jurnal. Mengembalikan (berhasil, pesan).
+    """
+    if from_outlet == to_outlet:
+        return False, "Outlet asal dan tujuan harus berbeda."
+    lines = [(ingredient_id, qty) for ingredient_id, qty in lines if qty > 0]
+    if not lines:
+        return False, "Tidak ada bahan yang dipindahkan."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        stock = get_outlet_stock(c, [ingredient_id for ingredient_id, _ in lines], from_outlet)
+        short = [ingredient_id for ingredient_id, qty in lines if stock[ingredient_id] < qty]
+        if short:
+            c.execute(f"SELECT name FROM ingredients WHERE id IN ({', '.join('?' * len(short))})", short)
+            raise ValueError(f"Stok outlet asal tidak cukup: {', '.join(row[0] for row in c.fetchall())}")
+        moved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Per bahan agar biaya FIFO tiap bahan di outlet asal menjadi harga lot di outlet tujuan
+        unit_costs = {ingredient_id: post_stock_movements(c, [(ingredient_id, -qty)], 'Transfer Keluar', to_outlet, moved_at, outlet_id=from_outlet) / qty
+                      for ingredient_id, qty in lines}
+        post_stock_movements(c, lines, 'Transfer Masuk', from_outlet, moved_at, unit_costs=unit_costs, outlet_id=to_outlet)
+        conn.commit()
+        return True, f"{len(lines)} bahan dipindahkan."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal memindahkan stok: {e}"
+    finally:
+        conn.close()
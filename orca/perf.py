@@ -0,0 +1,134 @@
+"""Instrumentasi performa: ring buffer sampel query & rerun, serta cursor ber-timer."""
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import streamlit as st
+
+from orca.config import DB, PERF_BUFFER_SIZE
+
+
+class PerfRecorder:
+    """Ring buffer bersama (semua sesi) untuk sampel query dan waktu rerun per menu."""
+    def __init__(self, maxlen=PERF_BUFFER_SIZE):
+        self.queries = deque(maxlen=maxlen)
+        self.reruns = deque(maxlen=maxlen)
+        self.examples = {} # fingerprint -> (sql, params) terakhir, untuk EXPLAIN QUERY PLAN
+        self.pending = [] # sampel yang belum ditulis ke database (jika persist aktif)
+        self.persist = False
+        self.lock = threading.Lock()
+
+    def add_query(self, sample, sql, params):
+        self.queries.append(sample)
+        self.examples[sample['fingerprint']] = (sql, tuple(params) if isinstance(params, (list, tuple)) else params)
+        if self.persist:
+            with self.lock:
+                self.pending.append(sample)
+
+    def add_rerun(self, sample):
+        self.reruns.append(sample)
+        if self.persist:
+            with self.lock:
+                self.pending.append(sample)
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+        if not pending:
+            return
+        rows = [(s['kind'], s['menu'], s.get('fingerprint'), s['duration_ms'], s.get('rows'), s['recorded_at']) for s in pending]
+        conn = sqlite3.connect(DB) # Koneksi tanpa instrumentasi agar tidak merekam dirinya sendiri
+        try:
+            conn.executemany("INSERT INTO perf_samples (kind, menu, fingerprint, duration_ms, rows, recorded_at) VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+        except sqlite3.Error:
+            pass # Persistensi bersifat opsional, jangan ganggu aplikasi
+        finally:
+            conn.close()
+
+    def clear(self):
+        self.queries.clear(); self.reruns.clear(); self.examples.clear()
+        with self.lock:
+            self.pending = []
+
+@st.cache_resource
+def get_perf_recorder():
+    return PerfRecorder()
+
+def sql_fingerprint(query):
+    """Menormalkan SQL: literal diganti '?', daftar IN diringkas, spasi dirapikan."""
+    q = re.sub(r"(?<!AS )'(?:[^']|'')*'", "?", query, flags=re.IGNORECASE)
+    q = re.sub(r"\b\d+(?:\.\d+)?\b", "?", q)
+    q = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?, ...)", q)
+    return re.sub(r"\s+", " ", q).strip()
+
+def current_perf_menu():
+    if st.session_state.get('logged_in'):
+        return st.session_state.get('main_menu', '-')
+    return 'Login'
+
+def record_query(sql, params, duration, rows):
+    sample = {
+        'kind': 'query', 'menu': current_perf_menu(), 'fingerprint': sql_fingerprint(sql),
+        'duration_ms': duration * 1000, 'rows': rows, 'recorded_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    get_perf_recorder().add_query(sample, sql, params)
+    return sample
+
+def record_rerun(duration):
+    get_perf_recorder().add_rerun({
+        'kind': 'rerun', 'menu': current_perf_menu(), 'duration_ms': duration * 1000,
+        'recorded_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    })
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor yang mencatat durasi eksekusi + fetch dan jumlah baris ke PerfRecorder."""
+    _perf_sample = None
+
+    def execute(self, sql, params=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, params)
+        finally:
+            self._perf_sample = record_query(sql, params, time.perf_counter() - started, self.rowcount if self.rowcount >= 0 else 0)
+
+    def executemany(self, sql, seq_of_params):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_params)
+        finally:
+            self._perf_sample = record_query(sql, (), time.perf_counter() - started, self.rowcount if self.rowcount >= 0 else 0)
+
+    def _track_fetch(self, started, rows):
+        if self._perf_sample is not None:
+            self._perf_sample['duration_ms'] += (time.perf_counter() - started) * 1000
+            self._perf_sample['rows'] += rows
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._track_fetch(started, 1 if row is not None else 0)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._track_fetch(started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._track_fetch(started, len(rows))
+        return rows
+
+class TimedConnection(sqlite3.Connection):
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, params=()):
+        return self.cursor().execute(sql, params)
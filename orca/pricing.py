@@ -0,0 +1,62 @@
+"""Ubah harga massal berbasis aturan: persentase atau target margin dari HPP, dengan pembulatan.
+
+Harga baru dan margin dihitung untuk seluruh katalog sekaligus dengan operasi kolom numpy/pandas
+(pratinjau), lalu disimpan dengan satu executemany dalam satu transaksi.
+"""
+import numpy as np
+
+from orca.bom import get_standard_costs
+from orca.db import get_connection, get_df
+
+PRICING_RULES = ["Persentase", "Target Margin"]
+ROUNDING_STEPS = {"Tanpa pembulatan": 0, "Rp 100": 100, "Rp 500": 500, "Rp 1.000": 1000}
+ROUNDING_MODES = {"Ke atas": np.ceil, "Terdekat": lambda x: np.floor(x + 0.5), "Ke bawah": np.floor} # Terdekat: setengah ke atas, bukan pembulatan bankir
+
+
+def preview_prices(rule, value, rounding_step=0, rounding_mode="Ke atas", name_filter="", active_only=True):
+    """Pratinjau harga baru untuk produk yang cocok dengan filter nama.
+
+    rule 'Persentase': harga x (1 + value/100); rule 'Target Margin': HPP / (1 - value/100).
+    Mengembalikan DataFrame (id, Nama Produk, HPP, Harga Lama, Margin Lama %, Harga Baru, Margin Baru %, Selisih).
+    """
+    df = get_df("SELECT id, name AS 'Nama Produk', price AS 'Harga Lama' FROM products" + (" WHERE IFNULL(is_active, 1) = 1" if active_only else "") + " ORDER BY name")
+    if name_filter:
+        df = df[df['Nama Produk'].str.contains(name_filter, case=False, regex=False)]
+    standard_costs = get_standard_costs()
+    df['HPP'] = df['id'].map(standard_costs).fillna(0.0)
+
+    if rule == "Persentase":
+        new_price = df['Harga Lama'] * (1 + value / 100)
+    else:
+        if not 0 <= value < 100:
+            raise ValueError("Target margin harus antara 0% dan 100%.")
+        # Produk tanpa HPP (belum ada resep) tidak diubah
+        new_price = (df['HPP'] / (1 - value / 100)).where(df['HPP'] > 0, df['Harga Lama'])
+    if rounding_step:
+        new_price = ROUNDING_MODES[rounding_mode](new_price / rounding_step) * rounding_step
+    # Harga disimpan sebagai rupiah bulat, dibulatkan setengah ke atas seperti to_rupiah
+    df['Harga Baru'] = np.floor(new_price.clip(lower=0).fillna(0) + 0.5).astype('int64')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['Margin Lama %'] = np.where(df['Harga Lama'] > 0, (df['Harga Lama'] - df['HPP']) / df['Harga Lama'] * 100, np.nan)
+        df['Margin Baru %'] = np.where(df['Harga Baru'] > 0, (df['Harga Baru'] - df['HPP']) / df['Harga Baru'] * 100, np.nan)
+    df['Selisih'] = df['Harga Baru'] - df['Harga Lama']
+    return df[['id', 'Nama Produk', 'HPP', 'Harga Lama', 'Margin Lama %', 'Harga Baru', 'Margin Baru %', 'Selisih']]
+
+def apply_prices(preview):
+    """Simpan Harga Baru dari pratinjau (hanya yang berubah) dalam satu transaksi. Mengembalikan (berhasil, pesan)."""
+    changed = preview[(preview['Selisih'].abs() > 1e-9) & (preview['Harga Baru'] > 0)]
+    if changed.empty:
+        return True, "Tidak ada harga yang berubah."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.executemany("UPDATE products SET price = ? WHERE id = ?", list(zip(changed['Harga Baru'].tolist(), changed['id'].tolist())))
+        conn.commit()
+        return True, f"Harga {len(changed)} produk diperbarui."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal memperbarui harga: {e}"
+    finally:
+        conn.close()
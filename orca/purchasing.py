@@ -0,0 +1,137 @@
+"""Pembelian bahan: purchase order (PO) dan penerimaan barang dari pemasok.
+
+Penerimaan barang memperbarui stok (lewat buku mutasi), HPP rata-rata bergerak
+(moving average) per bahan, status PO, jurnal Persediaan Bahan Baku / Utang Usaha, dan
+tagihan terbuka pemasok (orca/subledgers.py) dalam satu transaksi database. Semua baris ditulis dengan executemany dan data bahan
+dibaca dengan satu query, bukan satu round trip per baris faktur.
+"""
+from datetime import datetime
+
+from orca.db import get_connection
+from orca.money import to_rupiah
+from orca.accounting import create_journal_entry
+from orca.inventory import post_stock_movements
+from orca.subledgers import post_open_item
+
+
+def _merge_lines(lines):
+    """[(ingredient_id, qty, unit_cost), ...] -> {ingredient_id: (qty, unit_cost)}; baris bahan yang sama digabung (harga rata-rata)."""
+    merged = {}
+    for ingredient_id, qty, unit_cost in lines:
+        if not ingredient_id or not qty or qty <= 0:
+            continue
+        old_qty, old_cost = merged.get(ingredient_id, (0, 0))
+        total_qty = old_qty + qty
+        merged[ingredient_id] = (total_qty, (old_qty * old_cost + qty * (unit_cost or 0)) / total_qty)
+    return merged
+
+def _account_id(c, account_name):
+    c.execute("SELECT id FROM accounts WHERE account_name = ?", (account_name,))
+    row = c.fetchone()
+    if not row:
+        raise ValueError(f"Akun '{account_name}' tidak ditemukan.")
+    return row[0]
+
+def create_purchase_order(supplier_id, order_date, lines, notes=None, employee_id=None):
+    """Buat PO. Mengembalikan (berhasil, pesan, po_id)."""
+    merged = _merge_lines(lines)
+    if not merged:
+        return False, "PO harus berisi minimal satu bahan dengan jumlah > 0.", None
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("INSERT INTO purchase_orders (supplier_id, order_date, status, notes, employee_id) VALUES (?, ?, 'Dipesan', ?, ?)",
+                  (supplier_id, order_date, notes, employee_id))
+        po_id = c.lastrowid
+        c.executemany("INSERT INTO purchase_order_items (po_id, ingredient_id, qty_ordered, unit_cost) VALUES (?, ?, ?, ?)",
+                      [(po_id, ingredient_id, qty, unit_cost) for ingredient_id, (qty, unit_cost) in merged.items()])
+        conn.commit()
+        return True, f"PO #{po_id} berhasil dibuat ({len(merged)} bahan).", po_id
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal membuat PO: {e}", None
+    finally:
+        conn.close()
+
+def cancel_purchase_order(po_id):
+    """Batalkan PO yang belum diterima sama sekali. Mengembalikan (berhasil, pesan)."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("UPDATE purchase_orders SET status = 'Dibatalkan' WHERE id = ? AND status = 'Dipesan'", (po_id,))
+        conn.commit()
+        if c.rowcount == 0:
+            return False, "Hanya PO berstatus 'Dipesan' (belum ada penerimaan) yang bisa dibatalkan."
+        return True, f"PO #{po_id} dibatalkan."
+    finally:
+        conn.close()
+
+def receive_goods(supplier_id, receipt_date, lines, po_id=None, invoice_no=None, employee_id=None, due_date=None):
+    """Posting penerimaan barang [(ingredient_id, qty, unit_cost), ...]; due_date = jatuh tempo tagihan
+    (bawaan: tanggal terima + PAYMENT_TERM_DAYS).
+
+    Mengembalikan (berhasil, pesan, receipt_id).
+    """
+    merged = _merge_lines(lines)
+    if not merged:
+        return False, "Tidak ada baris penerimaan dengan jumlah > 0.", None
+    ingredient_ids = list(merged)
+    total_amount = to_rupiah(sum(qty * unit_cost for qty, unit_cost in merged.values()))
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        placeholders = ', '.join('?' * len(ingredient_ids))
+        c.execute(f"SELECT id, IFNULL(stock, 0), IFNULL(cost_per_unit, 0) FROM ingredients WHERE id IN ({placeholders})", ingredient_ids)
+        current = {ingredient_id: (stock, cost) for ingredient_id, stock, cost in c.fetchall()}
+        missing = set(ingredient_ids) - set(current)
+        if missing:
+            raise ValueError(f"Bahan dengan ID {sorted(missing)} tidak ditemukan.")
+
+        c.execute("INSERT INTO goods_receipts (po_id, supplier_id, receipt_date, invoice_no, total_amount, employee_id) VALUES (?, ?, ?, ?, ?, ?)",
+                  (po_id, supplier_id, receipt_date, invoice_no, total_amount, employee_id))
+        receipt_id = c.lastrowid
+        c.executemany("INSERT INTO goods_receipt_items (receipt_id, ingredient_id, qty, unit_cost) VALUES (?, ?, ?, ?)",
+                      [(receipt_id, ingredient_id, qty, unit_cost) for ingredient_id, (qty, unit_cost) in merged.items()])
+
+        # HPP rata-rata bergerak: stok negatif (terjual sebelum dicatat masuk) dianggap nol
+        new_costs = []
+        for ingredient_id, (qty, unit_cost) in merged.items():
+            stock, cost = current[ingredient_id]
+            on_hand = max(stock, 0)
+            new_costs.append(((on_hand * cost + qty * unit_cost) / (on_hand + qty), ingredient_id))
+        c.executemany("UPDATE ingredients SET cost_per_unit = ? WHERE id = ?", new_costs)
+        moved_at = f"{receipt_date} {datetime.now().strftime('%H:%M:%S')}"
+        post_stock_movements(c, [(ingredient_id, qty) for ingredient_id, (qty, _) in merged.items()], 'Penerimaan', receipt_id, moved_at,
+                             unit_costs={ingredient_id: unit_cost for ingredient_id, (_, unit_cost) in merged.items()})
+
+        if po_id:
+            c.executemany("UPDATE purchase_order_items SET qty_received = qty_received + ? WHERE po_id = ? AND ingredient_id = ?",
+                          [(qty, po_id, ingredient_id) for ingredient_id, (qty, _) in merged.items()])
+            c.execute("""UPDATE purchase_orders SET status = CASE
+                    WHEN (SELECT COUNT(*) FROM purchase_order_items WHERE po_id = ?1 AND qty_received < qty_ordered) = 0 THEN 'Diterima'
+                    ELSE 'Sebagian Diterima' END
+                WHERE id = ?1""", (po_id,))
+
+        if total_amount > 0:
+            success_journal, msg_journal, journal_entry_id = create_journal_entry(
+                receipt_date,
+                f"Penerimaan Barang #{receipt_id}" + (f" (Faktur {invoice_no})" if invoice_no else ""),
+                [{'account_id': _account_id(c, 'Persediaan Bahan Baku'), 'debit': total_amount},
+                 {'account_id': _account_id(c, 'Utang Usaha'), 'kredit': total_amount}],
+                conn=conn
+            )
+            if not success_journal:
+                raise ValueError(msg_journal)
+            if supplier_id:
+                post_open_item(c, 'Utang', supplier_id, invoice_no or f"GR-{receipt_id}", receipt_date, due_date, total_amount,
+                               f"Penerimaan Barang #{receipt_id}", journal_entry_id, receipt_id)
+
+        conn.commit()
+        return True, f"Penerimaan #{receipt_id} diposting: {len(merged)} bahan, total Rp {total_amount:,.0f}.", receipt_id
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal memposting penerimaan: {e}", None
+    finally:
+        conn.close()
@@ -0,0 +1,24 @@
+"""Pembuatan struk PDF (FPDF hanya dimuat saat struk dibutuhkan)."""
+import pandas as pd
+from fpdf import FPDF
+
+from orca.db import get_connection
+
+
+def generate_receipt_pdf(transaction_id):
+    conn = get_connection()
+    transaction = pd.read_sql_query("SELECT * FROM transactions WHERE id = ?", conn, params=(transaction_id,)).iloc[0]
+    items_df = pd.read_sql_query("SELECT p.name || IFNULL(' (' || ti.options_label || ')', '') AS name, ti.quantity, ti.price_per_unit FROM transaction_items ti JOIN products p ON ti.product_id = p.id WHERE ti.transaction_id = ?", conn, params=(transaction_id,))
+    conn.close()
+    pdf = FPDF(); pdf.add_page(); pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, 'Orca Cafe', 0, 1, 'C'); pdf.set_font("Arial", '', 10) # Mengganti nama cafe
+    pdf.cell(0, 5, 'Struk Pembayaran', 0, 1, 'C'); pdf.ln(5); pdf.set_font("Arial", '', 12)
+    pdf.cell(0, 8, f"No. Transaksi: {transaction['id']}", 0, 1)
+    pdf.cell(0, 8, f"Tanggal: {transaction['transaction_date']}", 0, 1); pdf.ln(5); pdf.set_font("Arial", 'B', 12)
+    pdf.cell(100, 10, 'Produk', 1); pdf.cell(30, 10, 'Qty', 1); pdf.cell(50, 10, 'Subtotal', 1, 1); pdf.set_font("Arial", '', 12)
+    for _, item in items_df.iterrows():
+        pdf.cell(100, 10, item['name'], 1); pdf.cell(30, 10, str(item['quantity']), 1); pdf.cell(50, 10, f"Rp {item['quantity'] * item['price_per_unit']:,.0f}", 1, 1)
+    pdf.ln(10); pdf.set_font("Arial", 'B', 14)
+    pdf.cell(130, 10, 'Total', 1); pdf.cell(50, 10, f"Rp {transaction['total_amount']:,.0f}", 1, 1)
+    pdf.cell(130, 10, 'Metode Bayar', 1); pdf.cell(50, 10, transaction['payment_method'], 1, 1)
+    return bytes(pdf.output())
@@ -0,0 +1,179 @@
+"""Rekonsiliasi rekening koran bank / laporan settlement QRIS terhadap akun Bank di buku besar.
+
+Baris mutasi dicocokkan dengan journal_items akun Bank yang belum direkonsiliasi, berdasarkan nilai bruto
+(jumlah + biaya, dalam sen) dan jendela tanggal: tanggal buku <= tanggal mutasi <= tanggal buku + N hari.
+Pencocokan memakai join berbasis hash/urutan dari pandas, bukan loop bersarang:
+- 1:1: join hash pada (nilai, urutan ke-n nilai itu menurut tanggal), lalu merge_asof (join terurut per nilai)
+  untuk sisanya; baris buku yang diklaim dua mutasi hanya diberikan ke mutasi pertama dan sisanya diulang.
+- Settlement gabungan: baris buku dijumlahkan per (hari, metode bayar) - dicocokkan sebelum 1:1 - dan per hari
+  (setelah 1:1), lalu jumlahnya dicocokkan dengan mutasi dengan cara yang sama (mis. batch EDC harian dipotong MDR).
+Biaya (MDR/administrasi) mutasi yang cocok dijurnal Beban Administrasi Bank / Bank saat rekonsiliasi disimpan.
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from orca.accounting import create_journal_entry
+from orca.db import get_connection, get_df
+from orca.importer import iter_import_chunks
+from orca.money import to_rupiah
+
+BANK_ACCOUNT = "Bank"
+FEE_ACCOUNT = "Beban Administrasi Bank"
+# Kolom file -> kolom internal; Biaya & Referensi opsional. Tanpa 'Jumlah', dipakai Kredit - Debit (sisi bank).
+STATEMENT_COLUMNS = {'Tanggal': 'line_date', 'Keterangan': 'description', 'Jumlah': 'amount', 'Biaya': 'fee', 'Referensi': 'ref'}
+
+
+def statement_template():
+    """Template CSV mutasi bank (Jumlah positif = uang masuk, negatif = uang keluar)."""
+    return pd.DataFrame(columns=list(STATEMENT_COLUMNS)).to_csv(index=False).encode('utf-8')
+
+def parse_amounts(values):
+    """Teks nominal -> float. Mendukung '1.250.000,50', '1,250,000.50', 'Rp 15.000', dan '(15.000)' untuk negatif."""
+    text = values.astype('string').str.strip()
+    negative = text.str.startswith('(') | text.str.startswith('-')
+    text = text.str.replace(r'[^\d,.]', '', regex=True)
+    # Format Indonesia: titik sebagai pemisah ribuan, koma sebagai desimal
+    indonesian = text.str.fullmatch(r'\d{1,3}(\.\d{3})+(,\d+)?|\d+,\d{1,2}').fillna(False)
+    text = text.where(~indonesian, text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False))
+    text = text.where(indonesian, text.str.replace(',', '', regex=False))
+    amounts = pd.to_numeric(text, errors='coerce')
+    return amounts.where(~negative.fillna(False), -amounts)
+
+def read_statement(uploaded_file):
+    """Baca file mutasi (CSV/XLSX). Mengembalikan (DataFrame line_date, description, ref, amount, fee, row; daftar kesalahan)."""
+    chunks, errors = [], []
+    for chunk in iter_import_chunks(uploaded_file):
+        columns = {str(col).strip().lower(): col for col in chunk.columns}
+        if 'jumlah' not in columns and not {'kredit', 'debit'} <= set(columns):
+            raise ValueError("Kolom wajib tidak ditemukan: Jumlah (atau Kredit dan Debit).")
+        if 'tanggal' not in columns:
+            raise ValueError("Kolom wajib tidak ditemukan: Tanggal.")
+        if 'jumlah' in columns:
+            amount = parse_amounts(chunk[columns['jumlah']])
+        else:
+            amount = parse_amounts(chunk[columns['kredit']]).fillna(0) - parse_amounts(chunk[columns['debit']]).fillna(0)
+        rows = pd.DataFrame({
+            'line_date': pd.to_datetime(chunk[columns['tanggal']], dayfirst=True, errors='coerce').dt.normalize(),
+            'description': chunk[columns['keterangan']].astype('string') if 'keterangan' in columns else pd.NA,
+            'ref': chunk[columns['referensi']].astype('string') if 'referensi' in columns else pd.NA,
+            'amount': amount,
+            'fee': parse_amounts(chunk[columns['biaya']]).fillna(0).abs() if 'biaya' in columns else 0.0,
+            'row': chunk.index + 2, # Baris 1 = header
+        })
+        invalid = rows['line_date'].isna() | rows['amount'].isna() | (rows['amount'] == 0)
+        errors += [f"Baris {row}: tanggal atau jumlah tidak valid." for row in rows.loc[invalid, 'row']]
+        chunks.append(rows[~invalid])
+    statement = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=['line_date', 'description', 'ref', 'amount', 'fee', 'row'])
+    return statement.reset_index(drop=True), errors
+
+def get_unreconciled_bank_items(start_date, end_date):
+    """Baris akun Bank yang belum direkonsiliasi dalam rentang tanggal (jalur indeks buku besar per akun).
+    Jurnal yang sudah dibalik beserta jurnal pembaliknya tidak ikut: keduanya saling meniadakan di buku."""
+    return get_df("""
+        SELECT ji.id, ji.entry_date, ji.debit - ji.kredit AS amount, IFNULL(t.payment_method, '') AS method, je.description
+        FROM journal_items ji
+        JOIN journal_entries je ON je.id = ji.journal_entry_id
+        LEFT JOIN transactions t ON t.id = je.transaction_id
+        WHERE ji.account_id = (SELECT id FROM accounts WHERE account_name = ?) AND ji.entry_date >= ? AND ji.entry_date <= ?
+            AND je.reversed_by IS NULL AND je.reversal_of IS NULL
+            AND NOT EXISTS (SELECT 1 FROM bank_reconciliations br WHERE br.journal_item_id = ji.id)
+        ORDER BY ji.entry_date, ji.id
+    """, (BANK_ACCOUNT, start_date, f"{end_date} 23:59:59"))
+
+def _pair(lines, candidates, window_days):
+    """Pasangkan 1:1 mutasi (id, day, key) dengan kandidat buku (id, day, key): key sama dan
+    0 <= day mutasi - day buku <= window_days. Mengembalikan DataFrame (line_id, candidate_id)."""
+    found = []
+    # Join hash: mutasi ke-n bernilai X dipasangkan dengan baris buku ke-n bernilai X (keduanya urut tanggal)
+    left = lines.sort_values(['day', 'id']).assign(n=lambda df: df.groupby('key').cumcount())
+    right = candidates.sort_values(['day', 'id']).assign(n=lambda df: df.groupby('key').cumcount())
+    joined = left.merge(right, on=['key', 'n'], suffixes=('', '_book'))
+    lag = (joined['day'] - joined['day_book']).dt.days
+    joined = joined[(lag >= 0) & (lag <= window_days)]
+    found.append(pd.DataFrame({'line_id': joined['id'].to_numpy(), 'candidate_id': joined['id_book'].to_numpy()}))
+    left = lines[~lines['id'].isin(joined['id'])]
+    right = candidates[~candidates['id'].isin(joined['id_book'])]
+    # Sisanya (pola tidak sejajar): join terurut per nilai ke baris buku terdekat sebelum tanggal mutasi
+    while not left.empty and not right.empty:
+        nearest = pd.merge_asof(left.sort_values('day'), right.rename(columns={'id': 'candidate_id', 'day': 'day_book'}).sort_values('day_book'),
+                                left_on='day', right_on='day_book', by='key', direction='backward', tolerance=pd.Timedelta(days=window_days))
+        nearest = nearest.dropna(subset=['candidate_id']).drop_duplicates('candidate_id')
+        if nearest.empty:
+            break
+        found.append(pd.DataFrame({'line_id': nearest['id'].to_numpy(), 'candidate_id': nearest['candidate_id'].astype('int64').to_numpy()}))
+        left = left[~left['id'].isin(nearest['id'])]
+        right = right[~right['id'].isin(nearest['candidate_id'])]
+    return pd.concat(found, ignore_index=True)
+
+def match_statement(statement, book, window_days=3):
+    """Cocokkan mutasi dengan baris buku akun Bank.
+
+    Mengembalikan DataFrame pasangan (line, journal_item_id, match_type '1:1'/'Gabungan'); satu mutasi gabungan
+    punya beberapa baris. Mutasi/baris buku yang tidak muncul di hasil berarti belum cocok.
+    """
+    lines = pd.DataFrame({'id': statement.index, 'day': statement['line_date'],
+                          'key': ((statement['amount'] + statement['fee']) * 100).round().astype('int64')})
+    remaining = pd.DataFrame({'id': book['id'], 'day': pd.to_datetime(book['entry_date'].str[:10]),
+                              'key': (book['amount'] * 100).round().astype('int64'), 'method': book['method']})
+    matches = []
+    # Settlement per (hari, metode bayar) dicocokkan lebih dulu: penjualan kartu yang kebetulan bernilai sama dengan
+    # mutasi QRIS tidak boleh diambil pencocokan 1:1 dan merusak jumlah batch EDC-nya
+    for group_keys in (['day', 'method'], None, ['day']):
+        if lines.empty or remaining.empty:
+            break
+        if group_keys is None:
+            paired = _pair(lines, remaining[['id', 'day', 'key']], window_days)
+            members = pd.DataFrame({'line_id': paired['line_id'], 'id': paired['candidate_id']})
+        else:
+            groups = remaining.groupby(group_keys, sort=False)
+            group_ids = groups.ngroup()
+            batches = groups.agg(day=('day', 'first'), key=('key', 'sum'), size=('id', 'size')).reset_index(drop=True)
+            batches = batches[batches['size'] > 1].rename_axis('id').reset_index()
+            if batches.empty:
+                continue
+            paired = _pair(lines, batches[['id', 'day', 'key']], window_days)
+            members = remaining.assign(group=group_ids).merge(paired, left_on='group', right_on='candidate_id')
+        matches.append(pd.DataFrame({'line': members['line_id'], 'journal_item_id': members['id'], 'match_type': '1:1' if group_keys is None else 'Gabungan'}))
+        lines = lines[~lines['id'].isin(paired['line_id'])]
+        remaining = remaining[~remaining['id'].isin(members['id'])]
+    return pd.concat(matches, ignore_index=True) if matches else pd.DataFrame(columns=['line', 'journal_item_id', 'match_type'])
+
+def save_reconciliation(statement, matches):
+    """Simpan semua baris mutasi beserta pasangannya, lalu jurnal biaya mutasi yang cocok
+    (Beban Administrasi Bank / Bank). Mengembalikan (berhasil, pesan)."""
+    if statement.empty:
+        return False, "Tidak ada baris mutasi untuk disimpan."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT IFNULL(MAX(id), 0) FROM bank_statement_lines")
+        first_id = c.fetchone()[0] + 1
+        imported_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        c.executemany("INSERT INTO bank_statement_lines (id, line_date, description, ref, amount, fee, imported_at) VALUES (?, ?, ?, ?, ?, ?, ?)", [
+            (first_id + i, line_date.strftime('%Y-%m-%d'), None if pd.isna(description) else description, None if pd.isna(ref) else ref, to_rupiah(amount), to_rupiah(fee), imported_at)
+            for i, (line_date, description, ref, amount, fee) in enumerate(zip(statement['line_date'], statement['description'], statement['ref'], statement['amount'], statement['fee']))])
+        c.executemany("INSERT INTO bank_reconciliations (statement_line_id, journal_item_id) VALUES (?, ?)",
+                      [(first_id + int(line), int(journal_item_id)) for line, journal_item_id in zip(matches['line'], matches['journal_item_id'])])
+        matched = statement.loc[matches['line'].unique()]
+        total_fee = sum(to_rupiah(fee) for fee in matched['fee']) # Sama dengan jumlah biaya yang disimpan per baris
+        if total_fee > 0:
+            c.execute("SELECT account_name, id FROM accounts WHERE account_name IN (?, ?)", (FEE_ACCOUNT, BANK_ACCOUNT))
+            account_ids = dict(c.fetchall())
+            success_journal, msg_journal, journal_entry_id = create_journal_entry(
+                matched['line_date'].max().strftime('%Y-%m-%d'), f"Biaya Bank/MDR Rekonsiliasi ({len(matched)} mutasi)",
+                [{'account_id': account_ids[FEE_ACCOUNT], 'debit': total_fee}, {'account_id': account_ids[BANK_ACCOUNT], 'kredit': total_fee}], conn=conn)
+            if not success_journal:
+                raise ValueError(msg_journal)
+            # Baris Bank jurnal biaya ikut tercocokkan: biayanya sudah tercermin di nilai bersih mutasi
+            c.execute("""INSERT INTO bank_reconciliations (statement_line_id, journal_item_id)
+                SELECT ?, id FROM journal_items WHERE journal_entry_id = ? AND account_id = ?""",
+                      (first_id + int(matched['line_date'].idxmax()), journal_entry_id, account_ids[BANK_ACCOUNT]))
+        conn.commit()
+        return True, f"{len(statement)} mutasi disimpan, {len(matched)} cocok" + (f"; biaya Rp {total_fee:,.0f} dijurnal." if total_fee > 0 else ".")
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menyimpan rekonsiliasi: {e}"
+    finally:
+        conn.close()
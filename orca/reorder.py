@@ -0,0 +1,95 @@
+"""Laju pemakaian bahan, titik pesan ulang (reorder point), dan hari ketersediaan stok.
+
+Pemakaian harian per bahan = qty terjual per produk x BOM rata (perkalian matriks), lalu
+diproyeksikan dengan exponential smoothing terpisah untuk setiap hari dalam seminggu
+(Senin ramai != Sabtu ramai). Semua bahan dihitung sekaligus sebagai matriks hari x bahan.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from orca.config import (OUTLET_ID, REORDER_HISTORY_DAYS, REORDER_LEAD_TIME_DAYS, REORDER_SAFETY_Z,
+                         REORDER_SMOOTHING_ALPHA, REORDER_HORIZON_DAYS)
+from orca.bom import get_flat_bom
+from orca.db import get_df
+
+
+def daily_usage_matrix(as_of, history_days=REORDER_HISTORY_DAYS, outlet_id=OUTLET_ID):
+    """Matriks pemakaian satu outlet (baris = tanggal, kolom = ingredient_id) dari hari penjualan pertama s/d kemarin.
+
+    SQL cukup menjumlah qty terjual per produk per hari; perkalian dengan resep dilakukan
+    sebagai satu perkalian matriks (hari x produk) @ (produk x bahan).
+    """
+    start = as_of - timedelta(days=history_days)
+    sold = get_df("""
+        SELECT date(t.transaction_date) AS day, ti.product_id, SUM(ti.quantity) AS qty
+        FROM transactions t JOIN transaction_items ti ON ti.transaction_id = t.id
+        WHERE t.outlet_id = ? AND t.transaction_date >= ? AND t.transaction_date < ? AND t.voided_at IS NULL
+        GROUP BY day, ti.product_id
+    """, (outlet_id, start.isoformat(), as_of.isoformat()))
+    # BOM rata: bahan baku di dalam bahan setengah jadi ikut terhitung kebutuhannya
+    recipes = pd.DataFrame([(product_id, ingredient_id, qty) for product_id, needs in get_flat_bom().gross.items() for ingredient_id, qty in needs.items()],
+                           columns=['product_id', 'ingredient_id', 'qty_per_unit'])
+    if sold.empty or recipes.empty:
+        return pd.DataFrame(dtype=float)
+    sold['day'] = pd.to_datetime(sold['day'])
+    sold_matrix = sold.pivot_table(index='day', columns='product_id', values='qty', aggfunc='sum', fill_value=0)
+    recipe_matrix = recipes.pivot_table(index='product_id', columns='ingredient_id', values='qty_per_unit', aggfunc='sum', fill_value=0)
+    recipe_matrix = recipe_matrix.reindex(sold_matrix.columns, fill_value=0) # Produk tanpa resep tidak memakai bahan
+    matrix = pd.DataFrame(sold_matrix.to_numpy(dtype=float) @ recipe_matrix.to_numpy(dtype=float), index=sold_matrix.index, columns=recipe_matrix.columns)
+    # Hari tanpa penjualan = pemakaian 0 (bukan data hilang)
+    days = pd.date_range(matrix.index.min(), as_of - timedelta(days=1), freq='D')
+    return matrix.reindex(days).fillna(0.0)
+
+def forecast_usage(matrix, as_of, alpha=REORDER_SMOOTHING_ALPHA, horizon=REORDER_HORIZON_DAYS):
+    """Proyeksi pemakaian harian `horizon` hari ke depan (baris = tanggal, kolom = ingredient_id)."""
+    future_days = pd.date_range(as_of, periods=horizon, freq='D')
+    if matrix.empty:
+        return pd.DataFrame(index=future_days, dtype=float)
+    # Nilai EWMA terakhir untuk tiap hari dalam seminggu, semua bahan sekaligus
+    by_weekday = matrix.groupby(matrix.index.dayofweek).apply(lambda rows: rows.ewm(alpha=alpha).mean().iloc[-1])
+    by_weekday = by_weekday.reindex(range(7)).fillna(matrix.mean()) # Riwayat < 7 hari: pakai rata-rata
+    return pd.DataFrame(by_weekday.loc[future_days.dayofweek].to_numpy(), index=future_days, columns=matrix.columns)
+
+@st.cache_data(max_entries=2, show_spinner="Menghitung laju pemakaian bahan...")
+def get_usage_forecast(as_of_iso, outlet_id=OUTLET_ID):
+    """Proyeksi pemakaian + simpangan baku harian; dihitung sekali per tanggal & outlet (perhitungan 'malam hari')."""
+    as_of = date.fromisoformat(as_of_iso)
+    matrix = daily_usage_matrix(as_of, outlet_id=outlet_id)
+    return forecast_usage(matrix, as_of), matrix.std().fillna(0.0)
+
+def build_reorder_plan(forecast, usage_std, ingredients, lead_time_days=REORDER_LEAD_TIME_DAYS, safety_z=REORDER_SAFETY_Z):
+    """Titik pesan ulang & hari ketersediaan untuk setiap bahan (ingredients: id, name, unit, stock)."""
+    ids = ingredients['id'].to_numpy()
+    stock = ingredients['stock'].fillna(0.0).to_numpy(dtype=float)
+    daily = forecast.reindex(columns=ids, fill_value=0.0).to_numpy(dtype=float) # hari x bahan
+    std = usage_std.reindex(ids, fill_value=0.0).to_numpy(dtype=float)
+
+    lead_demand = daily[:lead_time_days].sum(axis=0)
+    reorder_point = lead_demand + safety_z * std * np.sqrt(lead_time_days)
+    avg_daily = daily.mean(axis=0) if len(daily) else np.zeros(len(ids))
+    # Hari ketersediaan: berapa hari proyeksi yang masih tertutup stok; di luar horizon pakai rata-rata
+    covered_days = (daily.cumsum(axis=0) <= stock).sum(axis=0).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        days_of_cover = np.where(covered_days >= len(daily), stock / avg_daily, covered_days)
+    days_of_cover = np.where(avg_daily > 0, days_of_cover, np.nan) # Tidak pernah dipakai -> tak terhingga
+
+    return pd.DataFrame({
+        'id': ids,
+        'Nama': ingredients['name'].to_numpy(),
+        'Unit': ingredients['unit'].to_numpy(),
+        'Stok': stock,
+        'Pemakaian/Hari': avg_daily,
+        'Titik Pesan Ulang': reorder_point,
+        'Hari Ketersediaan': days_of_cover,
+        'Perlu Pesan': (avg_daily > 0) & (stock <= reorder_point) | (stock <= 0),
+    })
+
+def get_reorder_plan(lead_time_days=REORDER_LEAD_TIME_DAYS, safety_z=REORDER_SAFETY_Z, outlet_id=OUTLET_ID):
+    """Rencana pesan ulang hari ini untuk satu outlet: proyeksi dari cache harian, stok selalu yang terkini."""
+    forecast, usage_std = get_usage_forecast(date.today().isoformat(), outlet_id)
+    ingredients = get_df("""SELECT i.id, i.name, i.unit, s.stock FROM ingredients i
+        LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id ORDER BY i.name""", (outlet_id,))
+    return build_reorder_plan(forecast, usage_std, ingredients, lead_time_days, safety_z)
@@ -0,0 +1,186 @@
+"""Logika bisnis penjualan: proses transaksi atomik dan pembatalan (void dengan jurnal pembalik)."""
+from datetime import datetime
+
+from orca.config import OUTLET_ID, SALES_POSTING_MODE, TERMINAL_ID
+from orca.db import get_connection, get_df
+from orca.accounting import create_journal_entry, reverse_journal_entries
+from orca.costing import restore_consumptions
+from orca.inventory import post_stock_movements, get_outlet_stock
+from orca.money import to_rupiah
+from orca.shifts import add_to_shift, find_open_shift_id
+from orca.variants import get_variant_catalog
+
+# Metode bayar -> akun kas/bank yang didebit
+PAYMENT_ACCOUNTS = {'Cash': 'Kas', 'Qris': 'Bank', 'Card': 'Bank'}
+
+
+def sales_journal_lines(c, payment_method, amount, cogs):
+    """Baris jurnal penjualan: kas/bank vs pendapatan, dan HPP vs persediaan (biaya lot FIFO)."""
+    if payment_method not in PAYMENT_ACCOUNTS:
+        raise ValueError(f"Metode pembayaran '{payment_method}' belum punya akun kas/bank.")
+    c.execute("SELECT account_name, id FROM accounts WHERE account_name IN (?, 'Pendapatan Penjualan', 'Harga Pokok Penjualan', 'Persediaan Bahan Baku')",
+              (PAYMENT_ACCOUNTS[payment_method],))
+    account_ids = dict(c.fetchall())
+    lines = [{'account_id': account_ids[PAYMENT_ACCOUNTS[payment_method]], 'debit': amount},
+             {'account_id': account_ids['Pendapatan Penjualan'], 'kredit': amount}]
+    if cogs > 0:
+        lines += [{'account_id': account_ids['Harga Pokok Penjualan'], 'debit': cogs},
+                  {'account_id': account_ids['Persediaan Bahan Baku'], 'kredit': cogs}]
+    return lines
+
+def process_atomic_sale(cart, payment_method, employee_id, cash_received=0, outlet_id=OUTLET_ID, terminal=TERMINAL_ID):
+    """Proses penjualan dari Cart di satu outlet dalam satu transaksi database; harga memakai snapshot di keranjang.
+    Penjualan ikut menambah total berjalan shift yang sedang buka di terminal ini (jika ada)."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        lines = cart.items()
+        if not lines:
+            raise ValueError("Keranjang kosong.")
+        # Kebutuhan bahan dari resep efektif per varian (sudah dihitung di memori) + tambahan, dijumlahkan lintas baris
+        catalog = get_variant_catalog()
+        required, product_names = {}, {}
+        for _, product_id, option_ids, name, _, qty in lines:
+            for ing_id, qty_per_unit in catalog.needs(product_id, option_ids).items():
+                required[ing_id] = required.get(ing_id, 0) + qty_per_unit * qty
+                product_names.setdefault(ing_id, []).append(name)
+        c.execute("BEGIN TRANSACTION")
+        # Satu query stok (hanya partisi outlet ini) untuk seluruh keranjang
+        stock = get_outlet_stock(c, required, outlet_id)
+        short_ids = [ing_id for ing_id, qty_needed in required.items() if stock[ing_id] < qty_needed]
+        insufficient_items = []
+        if short_ids:
+            c.execute(f"SELECT id, name FROM ingredients WHERE id IN ({', '.join('?' * len(short_ids))})", short_ids)
+            insufficient_items = [f"{ing_name} untuk {', '.join(product_names[ing_id])}" for ing_id, ing_name in c.fetchall()]
+        if insufficient_items: 
+            raise ValueError(f"Stok tidak cukup: {', '.join(insufficient_items)}")
+        total_amount = cart.total
+        shift_id = find_open_shift_id(c, terminal, outlet_id)
+        c.execute("INSERT INTO transactions (transaction_date, total_amount, payment_method, employee_id, outlet_id, shift_id) VALUES (?, ?, ?, ?, ?, ?)",
+                  (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), total_amount, payment_method, employee_id, outlet_id, shift_id))
+        transaction_id = c.lastrowid
+        if shift_id:
+            add_to_shift(c, shift_id, payment_method, total_amount)
+        c.executemany("INSERT INTO transaction_items (transaction_id, product_id, quantity, price_per_unit, option_ids, options_label) VALUES (?, ?, ?, ?, ?, ?)",
+                      [(transaction_id, product_id, qty, price, ','.join(map(str, option_ids)) or None, catalog.label(option_ids) or None) for _, product_id, option_ids, _, price, qty in lines])
+        # HPP penjualan = biaya lot FIFO yang terpakai, dibulatkan ke rupiah
+        total_modal_sale = to_rupiah(post_stock_movements(c, [(ing_id, -qty_needed) for ing_id, qty_needed in required.items()], 'Penjualan', transaction_id, outlet_id=outlet_id))
+        
+        sale_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if SALES_POSTING_MODE == 'harian':
+            # Ditampung dulu; jurnal ringkasan dibuat saat tutup harian (post_daily_sales)
+            if payment_method not in PAYMENT_ACCOUNTS:
+                raise ValueError(f"Metode pembayaran '{payment_method}' belum punya akun kas/bank.")
+            c.execute("INSERT INTO sales_accruals (transaction_id, outlet_id, sale_date, payment_method, amount, cogs) VALUES (?, ?, ?, ?, ?, ?)",
+                      (transaction_id, outlet_id, sale_time[:10], payment_method, total_amount, total_modal_sale))
+        else:
+            success_journal, msg_journal, _ = create_journal_entry(
+                sale_time,
+                f"Penjualan Transaksi #{transaction_id}",
+                sales_journal_lines(c, payment_method, total_amount, total_modal_sale),
+                transaction_id=transaction_id,
+                conn=conn, # Jurnal ikut transaksi penjualan ini (koneksi terpisah akan terkunci)
+                outlet_id=outlet_id
+            )
+            if not success_journal:
+                raise ValueError(f"Gagal membuat jurnal penjualan: {msg_journal}")
+
+        conn.commit()
+        change = cash_received - total_amount if payment_method == 'Cash' and cash_received > 0 else 0
+        return True, "Pesanan berhasil diproses!", transaction_id, change
+    except Exception as e:
+        conn.rollback()
+        return False, str(e), None, 0
+    finally: conn.close()
+
+def void_transaction(transaction_id, reason="Dibatalkan", terminal=TERMINAL_ID):
+    """Batalkan (void) penjualan tanpa menghapus apa pun: stok dikembalikan lewat mutasi 'Pembatalan', jurnalnya
+    dibalik dengan jurnal pembalik, dan transaksi ditandai voided_at. Mengembalikan (berhasil, pesan).
+
+    Pembatalan dicatat di shift penjualannya jika masih buka; jika sudah ditutup, sebagai pengembalian dari
+    shift yang sedang buka di terminal ini."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("""SELECT IFNULL(t.outlet_id, 1), t.voided_at, t.payment_method, t.total_amount, s.id FROM transactions t
+            LEFT JOIN shifts s ON s.id = t.shift_id AND s.closed_at IS NULL WHERE t.id = ?""", (transaction_id,))
+        row = c.fetchone()
+        if not row:
+            raise ValueError(f"Transaksi #{transaction_id} tidak ditemukan.")
+        if row[1]:
+            raise ValueError(f"Transaksi #{transaction_id} sudah dibatalkan pada {row[1]}.")
+        outlet_id, _, payment_method, total_amount, shift_id = row # Stok kembali ke outlet tempat penjualan terjadi
+        shift_id = shift_id or find_open_shift_id(c, terminal, outlet_id)
+        if shift_id:
+            add_to_shift(c, shift_id, payment_method, total_amount, voided=True)
+        voided_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Kembalikan persis mutasi penjualannya; transaksi lama (sebelum ada buku mutasi) dihitung dari resep
+        c.execute("SELECT ingredient_id, -SUM(qty_delta) FROM stock_movements WHERE reason = 'Penjualan' AND ref_id = ? GROUP BY ingredient_id", (transaction_id,))
+        returned = c.fetchall()
+        if not returned:
+            c.execute("""SELECT r.ingredient_id, SUM(r.qty_per_unit * ti.quantity) FROM transaction_items ti
+                JOIN recipes r ON r.product_id = ti.product_id WHERE ti.transaction_id = ? GROUP BY r.ingredient_id""", (transaction_id,))
+            returned = c.fetchall()
+        # Qty dikembalikan ke lot asalnya; penjualan tanpa catatan FIFO mendapat lot baru
+        lots_restored = restore_consumptions(c, 'Penjualan', transaction_id, voided_at, outlet_id)
+        post_stock_movements(c, returned, 'Pembatalan', transaction_id, fifo=not lots_restored, outlet_id=outlet_id)
+        c.execute("UPDATE transactions SET voided_at = ? WHERE id = ?", (voided_at, transaction_id))
+        c.execute("SELECT id FROM journal_entries WHERE transaction_id = ?", (transaction_id,))
+        reverse_journal_entries(conn, [journal_entry_id for journal_entry_id, in c.fetchall()], voided_at, reason)
+        # Mode harian: penjualan yang belum dijurnal cukup dikeluarkan dari antrean posting; yang sudah masuk
+        # jurnal ringkasan dibalik sebesar porsinya (jurnal ringkasan tidak diubah)
+        c.execute("SELECT payment_method, amount, cogs, journal_entry_id, sale_date FROM sales_accruals WHERE transaction_id = ?", (transaction_id,))
+        accrual = c.fetchone()
+        if accrual:
+            payment_method, amount, cogs, journal_entry_id, sale_date = accrual
+            if journal_entry_id:
+                reversal = [{'account_id': line['account_id'], 'debit': line.get('kredit', 0), 'kredit': line.get('debit', 0)} for line in sales_journal_lines(c, payment_method, amount, cogs)]
+                success_journal, msg_journal, _ = create_journal_entry(voided_at, f"Pembatalan Transaksi #{transaction_id} (ringkasan {sale_date})",
+                                                                    reversal, conn=conn, outlet_id=outlet_id)
+                if not success_journal:
+                    raise ValueError(msg_journal)
+            else:
+                c.execute("DELETE FROM sales_accruals WHERE transaction_id = ?", (transaction_id,))
+        conn.commit()
+        return True, f"Transaksi #{transaction_id} dibatalkan, stok dikembalikan dan jurnal dibalik."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal membatalkan transaksi: {e}"
+    finally: conn.close()
+
+def get_pending_sales(through_date=None):
+    """Ringkasan penjualan yang belum dijurnal per hari, outlet, dan metode bayar."""
+    return get_df("""
+        SELECT sale_date AS 'Tanggal', outlet_id AS 'Outlet', payment_method AS 'Metode', COUNT(*) AS 'Transaksi',
+            SUM(amount) AS 'Penjualan', SUM(cogs) AS 'HPP'
+        FROM sales_accruals WHERE journal_entry_id IS NULL AND (? IS NULL OR sale_date <= ?)
+        GROUP BY sale_date, outlet_id, payment_method ORDER BY sale_date, outlet_id, payment_method
+    """, (through_date, through_date))
+
+def post_daily_sales(through_date):
+    """Tutup harian: posting satu jurnal ringkasan per (hari, outlet, metode bayar) untuk penjualan s/d through_date.
+
+    Mengembalikan (berhasil, pesan).
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("""SELECT sale_date, outlet_id, payment_method, SUM(amount), SUM(cogs), COUNT(*) FROM sales_accruals
+            WHERE journal_entry_id IS NULL AND sale_date <= ? GROUP BY sale_date, outlet_id, payment_method""", (through_date,))
+        groups = c.fetchall()
+        for sale_date, outlet_id, payment_method, amount, cogs, count in groups:
+            success_journal, msg_journal, journal_entry_id = create_journal_entry(sale_date, f"Ringkasan Penjualan {sale_date} ({payment_method}, {count} transaksi)",
+                                                                sales_journal_lines(c, payment_method, amount, cogs), conn=conn, outlet_id=outlet_id)
+            if not success_journal:
+                raise ValueError(msg_journal)
+            c.execute("""UPDATE sales_accruals SET journal_entry_id = ?
+                WHERE journal_entry_id IS NULL AND sale_date = ? AND outlet_id = ? AND payment_method = ?""", (journal_entry_id, sale_date, outlet_id, payment_method))
+        conn.commit()
+        return True, f"{len(groups)} jurnal ringkasan penjualan diposting." if groups else "Tidak ada penjualan yang perlu diposting."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal posting ringkasan penjualan: {e}"
+    finally:
+        conn.close()
@@ -0,0 +1,730 @@
+"""Migrasi skema dan data awal database."""
+import bcrypt
+import streamlit as st
+
+from orca.config import PAYMENT_TERM_DAYS
+from orca.db import get_connection
+from orca.money import convert_money_columns
+
+
+def update_db_schema(conn):
+    """Memeriksa dan memperbarui skema database jika diperlukan."""
+    c = conn.cursor()
+
+    # Employees table updates
+    c.execute("PRAGMA table_info(employees)")
+    emp_columns = {info[1] for info in c.fetchall()}
+    if 'password' not in emp_columns: 
+        c.execute("ALTER TABLE employees ADD COLUMN password TEXT")
+    if 'role' not in emp_columns: 
+        c.execute("ALTER TABLE employees ADD COLUMN role TEXT")
+    if 'is_active' not in emp_columns: 
+        c.execute("ALTER TABLE employees ADD COLUMN is_active BOOLEAN DEFAULT 1")
+    if 'hourly_wage' in emp_columns:
+         c.execute("ALTER TABLE employees RENAME TO employees_old")
+         c.execute("""CREATE TABLE employees (
+             id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, wage_amount REAL, 
+             wage_period TEXT, password TEXT, role TEXT, is_active BOOLEAN DEFAULT 1
+         )""")
+         c.execute("INSERT INTO employees (id, name, wage_amount, wage_period, is_active) SELECT id, name, hourly_wage, 'Per Jam', 1 FROM employees_old")
+         c.execute("DROP TABLE employees_old")
+         st.toast("Skema database karyawan telah diperbarui.")
+
+    # Expenses table updates
+    c.execute("PRAGMA table_info(expenses)")
+    exp_columns = {info[1] for info in c.fetchall()}
+    if 'category' not in exp_columns:
+        c.execute("ALTER TABLE expenses ADD COLUMN category TEXT DEFAULT 'Lainnya'")
+        st.toast("Skema database pengeluaran telah diperbarui.")
+    # NEW: Add account_id to expenses for accounting integration
+    if 'account_id' not in exp_columns:
+        c.execute("ALTER TABLE expenses ADD COLUMN account_id INTEGER")
+        st.toast("Skema database pengeluaran telah diperbarui dengan account_id.")
+
+    # Ingredients table updates: bahan setengah jadi (punya resep sendiri, dibuat per batch)
+    c.execute("PRAGMA table_info(ingredients)")
+    ing_columns = {info[1] for info in c.fetchall()}
+    if 'is_intermediate' not in ing_columns:
+        c.execute("ALTER TABLE ingredients ADD COLUMN is_intermediate INTEGER DEFAULT 0")
+    if 'batch_yield' not in ing_columns:
+        c.execute("ALTER TABLE ingredients ADD COLUMN batch_yield REAL DEFAULT 1.0") # Hasil per 1 batch produksi (dalam satuan bahan)
+
+    # Products & transaction items updates: produk dasar dengan varian/tambahan (lihat orca/variants.py)
+    c.execute("PRAGMA table_info(products)")
+    prod_columns = {info[1] for info in c.fetchall()}
+    if 'is_active' not in prod_columns:
+        c.execute("ALTER TABLE products ADD COLUMN is_active INTEGER DEFAULT 1") # 0 = disembunyikan dari katalog kasir, riwayat tetap utuh
+    c.execute("PRAGMA table_info(transaction_items)")
+    item_columns = {info[1] for info in c.fetchall()}
+    if 'option_ids' not in item_columns:
+        c.execute("ALTER TABLE transaction_items ADD COLUMN option_ids TEXT") # Id opsi dipisah koma, mis. "3,7"
+    if 'options_label' not in item_columns:
+        c.execute("ALTER TABLE transaction_items ADD COLUMN options_label TEXT")
+
+    # Multi-outlet: data operasional per outlet (cabang); data lama menjadi milik outlet 1
+    for table in ('transactions', 'expenses', 'attendance', 'journal_entries', 'stock_movements', 'inventory_lots'):
+        c.execute(f"PRAGMA table_info({table})")
+        if 'outlet_id' not in {info[1] for info in c.fetchall()}:
+            c.execute(f"ALTER TABLE {table} ADD COLUMN outlet_id INTEGER DEFAULT 1")
+
+    # Penjualan dicatat ke shift kasir yang sedang buka di terminalnya (lihat orca/shifts.py)
+    c.execute("PRAGMA table_info(transactions)")
+    if 'shift_id' not in {info[1] for info in c.fetchall()}:
+        c.execute("ALTER TABLE transactions ADD COLUMN shift_id INTEGER")
+
+    # Pembatalan (void) tidak menghapus baris: transaksi/pengeluaran diberi waktu batal, jurnalnya dibalik
+    for table in ('transactions', 'expenses'):
+        c.execute(f"PRAGMA table_info({table})")
+        if 'voided_at' not in {info[1] for info in c.fetchall()}:
+            c.execute(f"ALTER TABLE {table} ADD COLUMN voided_at TEXT")
+    c.execute("PRAGMA table_info(journal_entries)")
+    je_columns = {info[1] for info in c.fetchall()}
+    if 'reversal_of' not in je_columns:
+        c.execute("ALTER TABLE journal_entries ADD COLUMN reversal_of INTEGER") # Jurnal pembalik: id jurnal asli
+    if 'reversed_by' not in je_columns:
+        c.execute("ALTER TABLE journal_entries ADD COLUMN reversed_by INTEGER") # Jurnal asli: id jurnal pembaliknya
+
+    # Buku besar: tanggal jurnal disalin ke setiap baris agar (akun, tanggal) bisa diindeks bersama
+    c.execute("PRAGMA table_info(journal_items)")
+    if 'entry_date' not in {info[1] for info in c.fetchall()}:
+        c.execute("ALTER TABLE journal_items ADD COLUMN entry_date TEXT")
+        c.execute("UPDATE journal_items SET entry_date = (SELECT entry_date FROM journal_entries WHERE id = journal_items.journal_entry_id)")
+
+    # Nilai uang: REAL -> rupiah bulat INTEGER (lihat orca/money.py)
+    if convert_money_columns(c):
+        st.toast("Nilai uang telah dikonversi ke rupiah bulat.")
+
+    conn.commit()
+
+def insert_initial_data(conn):
+    """Membuat akun default jika belum ada."""
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM employees WHERE name = 'admin'")
+    if c.fetchone()[0] == 0:
+        st.info("Akun admin tidak ditemukan, membuat akun default...")
+        initial_users = [
+            ('admin', bcrypt.hashpw('admin'.encode('utf8'), bcrypt.gensalt()), 'Admin', 0, 'Per Bulan', 1),
+            ('operator', bcrypt.hashpw('operator'.encode('utf8'), bcrypt.gensalt()), 'Operator', 0, 'Per Jam', 1)
+        ]
+        c.executemany("INSERT INTO employees (name, password, role, wage_amount, wage_period, is_active) VALUES (?, ?, ?, ?, ?, ?)", initial_users)
+        conn.commit()
+        st.success("Akun awal (admin/admin, operator/operator) berhasil dibuat.")
+        st.rerun()
+
+def insert_initial_products(conn):
+    """Memasukkan daftar produk awal jika tabel produk kosong."""
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM products")
+    if c.fetchone()[0] == 0:
+        st.info("Daftar produk tidak ditemukan, menambahkan produk awal...")
+        products = [
+            # Existing products
+            ("Espresso", 10000), ("Americano", 11000), ("Orange Americano", 14000),
+            ("Lemon Americano", 14000), ("Cocof (BN Signature)", 15000), ("Coffee Latte", 15000),
+            ("Cappuccino", 15000), ("Spanish Latte", 16000), ("Caramel Latte", 16000),
+            ("Vanilla Latte", 16000), ("Hazelnut Latte", 16000), ("Butterscotch Latte", 16000),
+            ("Tiramisu Latte", 16000), ("Mocca Latte", 16000), ("Coffee Chocolate", 18000),
+            ("Taro Coffee Latte", 18000), ("Coffee Gula Aren", 18000), ("Lychee Coffee", 20000),
+            ("Markisa Coffee", 20000), ("Raspberry Latte", 20000), ("Strawberry Latte", 20000),
+            ("Manggo Latte", 20000), ("Bubblegum Latte", 20000),
+            ("Lemon Tea", 10000), ("Lychee Tea", 10000), ("Milk Tea", 12000),
+            ("Green Tea", 14000), ("Thai Tea", 14000), ("Melon Susu", 14000),
+            ("Manggo Susu", 15000), ("Mocca Susu", 15000), ("Orange Susu", 15000),
+            ("Taro Susu", 15000), ("Coklat Susu", 15000), ("Vanilla Susu", 15000),
+            ("Strawberry Susu", 15000), ("Matcha Susu", 18000), ("Blueberry Susu", 18000),
+            ("Bubblegum Susu", 18000), ("Raspberry Susu", 18000), ("Grenadine Susu", 14000),
+            ("Banana Susu", 16000),
+            ("Melon Soda", 10000), ("Manggo Soda", 12000), ("Orange Soda", 12000),
+            ("Strawberry Soda", 12000), ("Bluesky Soda", 14000), ("Banana Soda", 16000),
+            ("Grenadine Soda", 14000), ("Blueberry Soda", 16000), ("Coffee Bear", 16000),
+            ("Mocca Soda", 16000), ("Raspberry Soda", 16000), ("Coffee Soda", 17000),
+            ("Strawberry Coffee Soda", 18000), ("Melon Blue Sky", 18000), ("Blue Manggo Soda", 18000),
+            ("Nasi Goreng Kampung", 10000), ("Nasi Goreng Biasa", 10000), ("Nasi Goreng Ayam", 18000),
+            ("Nasi Ayam Sambal Matah", 13000), ("Nasi Ayam Penyet", 13000), ("Nasi Ayam Teriyaki", 15000),
+            ("Mie Goreng", 12000), ("Mie Rebus", 12000), ("Mie Nyemek", 12000), ("Bihun Goreng", 12000),
+            ("Burger Telur", 10000), ("Burger Ayam", 12000), ("Burger Telur + Keju", 13000),
+            ("Burger Telur + Ayam", 15000), ("Burger Ayam + Telur + Keju", 18000),
+            ("Roti Bakar Coklat", 10000), ("Roti Bakar Strawberry", 10000), ("Roti Bakar Srikaya", 10000),
+            ("Roti Bakar Coklat Keju", 12000),
+            ("Kentang Goreng", 12000), ("Nugget", 12000), ("Sosis", 12000),
+            ("Mix Platter Jumbo", 35000), ("Tahu/Tempe", 5000),
+            ("Double Shoot", 3000), ("Yakult", 3000), ("Mineral Water", 4000),
+            ("Mineral Water Gelas", 500), ("Nasi Putih", 3000), ("Le Mineralle", 4000),
+            
+            # New products
+            # ☕ SIGNATURE
+            ("Kopi Aceh Panas", 7000),
+            ("Kopi Aceh Dingin", 8000),
+            ("Butterscotch Panas", 13000),
+            ("Butterscotch Dingin", 14000),
+            ("Kopi Aren Panas", 13000),
+            ("Kopi Aren Dingin", 14000),
+            
+            # ☕ COFFEE
+            ("Americano Panas", 9000),
+            ("Americano Dingin", 10000),
+            ("Espresso Panas", 8000),
+            ("Espresso Dingin", 9000),
+            ("Caramel Panas", 13000),
+            ("Caramel Dingin", 14000),
+            ("Cappucino Panas", 12000),
+            ("Cappucino Dingin", 13000),
+            ("Spanish Panas", 11000),
+            ("Spanish Dingin", 12000),
+            
+            # 🍹 MOCKTAIL
+            ("Blue Sky", 14000),
+            ("Mango Soda", 12000),
+            ("Green Apple", 14000),
+            ("Cotton Candy", 14000),
+            
+            # 🥤 NON COFFEE
+            ("Matcha Panas", 11000),
+            ("Matcha Dingin", 13000),
+            ("Coklat Panas", 11000),
+            ("Coklat Dingin", 13000),
+            ("Red Velvet Panas", 11000),
+            ("Red Velvet Dingin", 12000),
+            ("Strawberry Panas", 11000),
+            ("Strawberry Dingin", 12000),
+            ("Lemon Tea Panas", 9000),
+            ("Lemon Tea Dingin", 10000),
+            ("Orange Milk Panas", 12000),
+            ("Orange Milk Dingin", 14000),
+            ("Mango Milk Panas", 12000),
+            ("Mango Milk Dingin", 13000),
+            
+            # 🥡 SACHET
+            ("Cappucino Sachet Panas", 6000),
+            ("Cappucino Sachet Dingin", 7000),
+            ("Milo Panas", 6000),
+            ("Milo Dingin", 7000),
+            ("Beng-beng Panas", 6000),
+            ("Beng-beng Dingin", 7000),
+            ("Chocolatos Panas", 6000),
+            ("Chocolatos Dingin", 7000),
+            ("Teh Tarik Panas", 6000),
+            ("Teh Tarik Dingin", 7000),
+            ("Nutrisari Panas", 6000),
+            ("Nutrisari Dingin", 7000),
+            ("Kukubima Susu Panas", 6000),
+            ("Kukubima Susu Dingin", 7000),
+            ("Extra Joss Susu Panas", 6000),
+            ("Extra Joss Susu Dingin", 7000)
+        ]
+        c.executemany("INSERT INTO products (name, price) VALUES (?, ?) ON CONFLICT(name) DO NOTHING", products)
+        conn.commit()
+        st.success("Daftar produk awal berhasil ditambahkan.")
+        st.rerun()
+
+# NEW: Insert initial Chart of Accounts
+def insert_initial_accounts(conn):
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM accounts")
+    if c.fetchone()[0] == 0:
+        st.info("Daftar akun tidak ditemukan, menambahkan akun standar...")
+        initial_accounts = [
+            (1000, 'Kas', 'Aset', 'Debit'),
+            (1010, 'Bank', 'Aset', 'Debit'),
+            (1020, 'Piutang Usaha', 'Aset', 'Debit'),
+            (1030, 'Persediaan Bahan Baku', 'Aset', 'Debit'),
+            (1040, 'Aktiva Tetap', 'Aset', 'Debit'),
+            (2000, 'Utang Usaha', 'Liabilitas', 'Kredit'),
+            (2010, 'Utang Gaji', 'Liabilitas', 'Kredit'),
+            (3000, 'Modal Pemilik', 'Ekuitas', 'Kredit'),
+            (3010, 'Laba Ditahan', 'Ekuitas', 'Kredit'),
+            (4000, 'Pendapatan Penjualan', 'Pendapatan', 'Kredit'),
+            (5000, 'Harga Pokok Penjualan', 'Beban', 'Debit'),
+            (6000, 'Beban Gaji', 'Beban', 'Debit'),
+            (6010, 'Beban Listrik & Air', 'Beban', 'Debit'),
+            (6020, 'Beban Sewa', 'Beban', 'Debit'),
+            (6030, 'Beban Lain-lain', 'Beban', 'Debit'),
+            (7000, 'Pendapatan Lain-lain', 'Pendapatan', 'Kredit')
+        ]
+        c.executemany("INSERT INTO accounts (account_code, account_name, account_type, normal_balance) VALUES (?, ?, ?, ?)", initial_accounts)
+        conn.commit()
+        st.success("Daftar akun awal berhasil ditambahkan.")
+        st.rerun()
+    # Akun yang ditambahkan setelah daftar awal (juga untuk database lama)
+    c.executemany("INSERT OR IGNORE INTO accounts (account_code, account_name, account_type, normal_balance) VALUES (?, ?, ?, ?)", [
+        (1050, 'Akumulasi Penyusutan', 'Aset', 'Kredit'), # Akun kontra aset
+        (6040, 'Beban Penyusutan', 'Beban', 'Debit'),
+        (6050, 'Beban Administrasi Bank', 'Beban', 'Debit'), # Biaya transfer & MDR QRIS/kartu (lihat orca/reconciliation.py)
+    ])
+    conn.commit()
+
+
+# Tabel FTS5 (external content) -> (tabel sumber, kolom yang diindeks)
+FTS_SOURCES = {
+    'expenses_fts': ('expenses', ['description', 'category']),
+    'journal_fts': ('journal_entries', ['description']),
+    'customers_fts': ('customers', ['name', 'address', 'phone', 'email']),
+    'suppliers_fts': ('suppliers', ['name', 'address', 'phone', 'email']),
+}
+# Teks pencarian transaksi: id, waktu, metode bayar, kasir, dan nama produk yang dibeli
+TRANSACTION_SEARCH_BODY = """t.id || ' ' || IFNULL(t.transaction_date, '') || ' ' || IFNULL(t.payment_method, '') || ' ' ||
+    IFNULL((SELECT name FROM employees WHERE id = t.employee_id), '') || ' ' ||
+    IFNULL((SELECT group_concat(p.name, ' ') FROM transaction_items ti JOIN products p ON p.id = ti.product_id WHERE ti.transaction_id = t.id), '')"""
+
+def create_search_tables(c):
+    """Membuat indeks full-text (FTS5) beserta trigger sinkronisasinya; data lama diindeks sekali saat tabel dibuat."""
+    c.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE '%_fts'")
+    existing = {row[0] for row in c.fetchall()}
+    for fts, (source, columns) in FTS_SOURCES.items():
+        cols = ', '.join(columns)
+        new_vals = ', '.join(f'new.{col}' for col in columns)
+        old_vals = ', '.join(f'old.{col}' for col in columns)
+        c.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{source}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+        c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_vals});
+        END""")
+        c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+        END""")
+        c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {source} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+            INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_vals});
+        END""")
+        if fts not in existing:
+            c.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    c.execute("CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(body, tokenize='unicode61 remove_diacritics 2')")
+    for name, event in (('transactions_fts_ai', 'AFTER INSERT ON transactions'), ('transactions_fts_items_ai', 'AFTER INSERT ON transaction_items')):
+        ref = 'new.id' if name == 'transactions_fts_ai' else 'new.transaction_id'
+        c.execute(f"""CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN
+            INSERT OR REPLACE INTO transactions_fts(rowid, body) SELECT t.id, {TRANSACTION_SEARCH_BODY} FROM transactions t WHERE t.id = {ref};
+        END""")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN
+        DELETE FROM transactions_fts WHERE rowid = old.id;
+    END""")
+    if 'transactions_fts' not in existing:
+        c.execute(f"INSERT INTO transactions_fts(rowid, body) SELECT t.id, {TRANSACTION_SEARCH_BODY} FROM transactions t")
+
+def init_db():
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, wage_amount REAL, 
+        wage_period TEXT, password TEXT, role TEXT, is_active BOOLEAN DEFAULT 1
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS ingredients (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, unit TEXT,
+        cost_per_unit REAL, stock REAL, pack_weight REAL DEFAULT 0.0, pack_price REAL DEFAULT 0.0
+    )""")
+    c.execute("CREATE TABLE IF NOT EXISTS products (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, price REAL)")
+    c.execute("""CREATE TABLE IF NOT EXISTS recipes (
+        product_id INTEGER, ingredient_id INTEGER, qty_per_unit REAL, PRIMARY KEY (product_id, ingredient_id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, transaction_date TEXT, total_amount INTEGER, 
+        payment_method TEXT, employee_id INTEGER
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS transaction_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, transaction_id INTEGER, product_id INTEGER, 
+        quantity INTEGER, price_per_unit INTEGER
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS expenses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT, category TEXT, 
+        description TEXT, amount INTEGER, payment_method TEXT, account_id INTEGER
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS attendance (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, employee_id INTEGER, check_in TEXT, check_out TEXT
+    )""")
+    # NEW TABLES FOR ACCOUNTING AND ERP FEATURES
+    c.execute("""CREATE TABLE IF NOT EXISTS accounts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_code INTEGER UNIQUE,
+        account_name TEXT UNIQUE,
+        account_type TEXT, -- e.g., Aset, Liabilitas, Ekuitas, Pendapatan, Beban
+        normal_balance TEXT -- e.g., Debit, Kredit
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS journal_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        entry_date TEXT,
+        description TEXT,
+        transaction_id INTEGER, -- Link to transactions table
+        expense_id INTEGER, -- Link to expenses table
+        FOREIGN KEY (transaction_id) REFERENCES transactions(id),
+        FOREIGN KEY (expense_id) REFERENCES expenses(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS journal_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        journal_entry_id INTEGER,
+        account_id INTEGER,
+        debit INTEGER DEFAULT 0, -- rupiah bulat, lihat orca/money.py
+        kredit INTEGER DEFAULT 0,
+        entry_date TEXT, -- salinan journal_entries.entry_date untuk indeks buku besar
+        FOREIGN KEY (journal_entry_id) REFERENCES journal_entries(id),
+        FOREIGN KEY (account_id) REFERENCES accounts(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS customers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,
+        address TEXT,
+        phone TEXT,
+        email TEXT
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS suppliers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,
+        address TEXT,
+        phone TEXT,
+        email TEXT
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS fixed_assets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        asset_name TEXT,
+        acquisition_date TEXT,
+        acquisition_cost REAL,
+        useful_life_years INTEGER,
+        salvage_value REAL,
+        depreciation_method TEXT, -- e.g., Straight-line
+        current_book_value REAL
+    )""")
+    # Sampel instrumentasi performa (hanya diisi jika persistensi diaktifkan di menu Performa)
+    c.execute("""CREATE TABLE IF NOT EXISTS perf_samples (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT, -- 'query' atau 'rerun'
+        menu TEXT,
+        fingerprint TEXT,
+        duration_ms REAL,
+        rows INTEGER,
+        recorded_at TEXT
+    )""")
+    # Buku mutasi stok (append-only); saldo berjalan tetap di ingredients.stock, lihat orca/inventory.py
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stock_movements'")
+    stock_movements_exists = c.fetchone() is not None
+    c.execute("""CREATE TABLE IF NOT EXISTS stock_movements (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ingredient_id INTEGER,
+        qty_delta REAL,
+        reason TEXT, -- Penjualan, Pembatalan, Stok Awal, Penyesuaian, Saldo Awal, ...
+        ref_id INTEGER, -- mis. ID transaksi
+        moved_at TEXT
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_stock_movements_ingredient_time ON stock_movements (ingredient_id, moved_at)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_stock_movements_ref ON stock_movements (reason, ref_id)")
+    if not stock_movements_exists: # Saldo yang sudah ada menjadi mutasi pembuka agar invarian SUM(qty_delta) == stock terpenuhi
+        c.execute("""INSERT INTO stock_movements (ingredient_id, qty_delta, reason, moved_at)
+            SELECT id, stock, 'Saldo Awal', datetime('now', 'localtime') FROM ingredients WHERE IFNULL(stock, 0) != 0""")
+    # Pembelian: purchase order ke pemasok dan penerimaan barang (lihat orca/purchasing.py)
+    c.execute("""CREATE TABLE IF NOT EXISTS purchase_orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        supplier_id INTEGER,
+        order_date TEXT,
+        status TEXT DEFAULT 'Dipesan', -- Dipesan, Sebagian Diterima, Diterima, Dibatalkan
+        notes TEXT,
+        employee_id INTEGER,
+        FOREIGN KEY (supplier_id) REFERENCES suppliers(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS purchase_order_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        po_id INTEGER,
+        ingredient_id INTEGER,
+        qty_ordered REAL,
+        unit_cost REAL,
+        qty_received REAL DEFAULT 0.0,
+        FOREIGN KEY (po_id) REFERENCES purchase_orders(id),
+        FOREIGN KEY (ingredient_id) REFERENCES ingredients(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS goods_receipts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        po_id INTEGER, -- boleh kosong (pembelian tanpa PO)
+        supplier_id INTEGER,
+        receipt_date TEXT,
+        invoice_no TEXT,
+        total_amount INTEGER,
+        employee_id INTEGER,
+        FOREIGN KEY (po_id) REFERENCES purchase_orders(id),
+        FOREIGN KEY (supplier_id) REFERENCES suppliers(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS goods_receipt_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        receipt_id INTEGER,
+        ingredient_id INTEGER,
+        qty REAL,
+        unit_cost REAL,
+        FOREIGN KEY (receipt_id) REFERENCES goods_receipts(id),
+        FOREIGN KEY (ingredient_id) REFERENCES ingredients(id)
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_purchase_order_items_po ON purchase_order_items (po_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_goods_receipt_items_receipt ON goods_receipt_items (receipt_id)")
+    # Lot FIFO per bahan + catatan konsumsinya (untuk memulihkan lot saat pembatalan), lihat orca/costing.py
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'inventory_lots'")
+    inventory_lots_exists = c.fetchone() is not None
+    c.execute("""CREATE TABLE IF NOT EXISTS inventory_lots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ingredient_id INTEGER,
+        received_at TEXT,
+        qty_received REAL,
+        qty_remaining REAL,
+        unit_cost REAL,
+        source TEXT, -- Penerimaan, Saldo Awal, Stok Awal, Penyesuaian, Pembatalan, ...
+        ref_id INTEGER
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS lot_consumptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lot_id INTEGER, -- NULL jika tidak tertutup lot (dibiayai HPP bahan)
+        ingredient_id INTEGER,
+        qty REAL,
+        unit_cost REAL,
+        reason TEXT,
+        ref_id INTEGER
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_lot_consumptions_ref ON lot_consumptions (reason, ref_id)")
+    if not inventory_lots_exists: # Stok yang sudah ada menjadi satu lot pembuka per bahan dengan HPP saat ini
+        c.execute("""INSERT INTO inventory_lots (ingredient_id, received_at, qty_received, qty_remaining, unit_cost, source)
+            SELECT id, datetime('now', 'localtime'), stock, stock, IFNULL(cost_per_unit, 0), 'Saldo Awal' FROM ingredients WHERE stock > 0""")
+    # Resep bahan setengah jadi (per batch) dan riwayat produksi batch, lihat orca/bom.py
+    c.execute("""CREATE TABLE IF NOT EXISTS sub_recipes (
+        parent_id INTEGER, ingredient_id INTEGER, qty_per_batch REAL, PRIMARY KEY (parent_id, ingredient_id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS production_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ingredient_id INTEGER, -- bahan setengah jadi yang dibuat
+        batches REAL,
+        qty_produced REAL,
+        total_cost INTEGER,
+        produced_at TEXT,
+        employee_id INTEGER
+    )""")
+    # Stok opname (hitung fisik) beserta selisih per bahan, lihat orca/opname.py
+    c.execute("""CREATE TABLE IF NOT EXISTS stock_opnames (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        counted_at TEXT,
+        employee_id INTEGER,
+        items_counted INTEGER,
+        gain_value INTEGER, -- nilai selisih lebih (rupiah, sama dengan jurnalnya)
+        loss_value INTEGER, -- nilai selisih kurang (biaya FIFO, rupiah)
+        notes TEXT
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS stock_opname_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        opname_id INTEGER,
+        ingredient_id INTEGER,
+        system_qty REAL,
+        counted_qty REAL,
+        variance REAL,
+        unit_cost REAL,
+        FOREIGN KEY (opname_id) REFERENCES stock_opnames(id)
+    )""")
+    # Varian (mis. Suhu: Panas/Dingin, Ukuran) dan tambahan (mis. Double Shoot) per produk dasar.
+    # Varian: pilih tepat satu per grup; tambahan: boleh lebih dari satu. Keduanya membawa selisih harga dan selisih resep.
+    c.execute("""CREATE TABLE IF NOT EXISTS product_options (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER,
+        group_name TEXT,
+        name TEXT,
+        price_delta REAL DEFAULT 0,
+        is_modifier INTEGER DEFAULT 0,
+        sort_order INTEGER DEFAULT 0,
+        UNIQUE (product_id, group_name, name),
+        FOREIGN KEY (product_id) REFERENCES products(id)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS option_recipe_deltas (
+        option_id INTEGER,
+        ingredient_id INTEGER,
+        qty_delta REAL, -- boleh negatif, mis. ukuran kecil mengurangi susu
+        PRIMARY KEY (option_id, ingredient_id),
+        FOREIGN KEY (option_id) REFERENCES product_options(id)
+    )""")
+    # Pesanan yang ditahan (open bill) per terminal kasir; isi keranjang disimpan sebagai JSON
+    c.execute("""CREATE TABLE IF NOT EXISTS parked_orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        terminal TEXT,
+        label TEXT,
+        employee_id INTEGER,
+        cart_json TEXT,
+        total_amount INTEGER,
+        created_at TEXT
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_parked_orders_terminal ON parked_orders (terminal, id)")
+    # Outlet (cabang) dan saldo stok per outlet; ingredients.stock tetap total semua outlet
+    c.execute("""CREATE TABLE IF NOT EXISTS outlets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,
+        address TEXT,
+        is_active INTEGER DEFAULT 1
+    )""")
+    c.execute("INSERT OR IGNORE INTO outlets (id, name) VALUES (1, 'Orca Cafe')")
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'outlet_stock'")
+    outlet_stock_exists = c.fetchone() is not None
+    c.execute("""CREATE TABLE IF NOT EXISTS outlet_stock (
+        outlet_id INTEGER,
+        ingredient_id INTEGER,
+        stock REAL DEFAULT 0,
+        PRIMARY KEY (outlet_id, ingredient_id)
+    )""")
+    if not outlet_stock_exists: # Stok yang sudah ada milik outlet pertama
+        c.execute("INSERT INTO outlet_stock (outlet_id, ingredient_id, stock) SELECT 1, id, stock FROM ingredients WHERE IFNULL(stock, 0) != 0")
+    # Penyusutan aktiva yang sudah dijurnal, per aset per bulan ('YYYY-MM')
+    c.execute("""CREATE TABLE IF NOT EXISTS depreciation_postings (
+        asset_id INTEGER,
+        period TEXT,
+        amount INTEGER,
+        journal_entry_id INTEGER,
+        PRIMARY KEY (asset_id, period)
+    )""")
+    # Penjualan yang belum dijurnal (mode posting harian); journal_entry_id terisi setelah tutup harian
+    c.execute("""CREATE TABLE IF NOT EXISTS sales_accruals (
+        transaction_id INTEGER PRIMARY KEY,
+        outlet_id INTEGER,
+        sale_date TEXT,
+        payment_method TEXT,
+        amount INTEGER,
+        cogs INTEGER,
+        journal_entry_id INTEGER
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sales_accruals_pending ON sales_accruals (sale_date, outlet_id, payment_method) WHERE journal_entry_id IS NULL")
+    # Buku pembantu piutang/utang: satu baris per faktur pelanggan / tagihan pemasok, lihat orca/subledgers.py
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'open_items'")
+    open_items_exists = c.fetchone() is not None
+    c.execute("""CREATE TABLE IF NOT EXISTS open_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT, -- 'Piutang' (party = customers.id) atau 'Utang' (party = suppliers.id)
+        party_id INTEGER,
+        doc_no TEXT,
+        doc_date TEXT,
+        due_date TEXT,
+        description TEXT,
+        amount INTEGER,
+        paid_amount INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'Terbuka', -- 'Terbuka' / 'Lunas'
+        journal_entry_id INTEGER,
+        receipt_id INTEGER, -- penerimaan barang asal tagihan pemasok
+        FOREIGN KEY (journal_entry_id) REFERENCES journal_entries(id)
+    )""")
+    # Faktur terbuka per pihak urut jatuh tempo (alokasi pembayaran); kolom sisanya ikut agar umur dihitung dari indeks saja
+    c.execute("CREATE INDEX IF NOT EXISTS idx_open_items_party ON open_items (kind, status, party_id, due_date, doc_date, amount, paid_amount)")
+    if not open_items_exists: # Penerimaan barang lama sudah dijurnal ke Utang Usaha; jadikan tagihan terbuka
+        c.execute("""INSERT INTO open_items (kind, party_id, doc_no, doc_date, due_date, description, amount, receipt_id)
+            SELECT 'Utang', supplier_id, IFNULL(invoice_no, 'GR-' || id), receipt_date, date(receipt_date, ?), 'Penerimaan Barang #' || id, CAST(ROUND(total_amount) AS INTEGER), id
+            FROM goods_receipts WHERE supplier_id IS NOT NULL AND total_amount > 0""", (f"+{PAYMENT_TERM_DAYS} days",))
+    c.execute("""CREATE TABLE IF NOT EXISTS payments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT,
+        party_id INTEGER,
+        payment_date TEXT,
+        amount INTEGER,
+        account_id INTEGER, -- akun kas/bank
+        notes TEXT,
+        journal_entry_id INTEGER
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS payment_allocations (
+        payment_id INTEGER,
+        open_item_id INTEGER,
+        amount INTEGER,
+        PRIMARY KEY (payment_id, open_item_id)
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_payment_allocations_item ON payment_allocations (open_item_id)")
+    # Rekonsiliasi bank: baris rekening koran/settlement yang diimpor dan pasangannya di akun Bank
+    c.execute("""CREATE TABLE IF NOT EXISTS bank_statement_lines (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        line_date TEXT,
+        description TEXT,
+        ref TEXT,
+        amount INTEGER, -- bersih, positif = uang masuk
+        fee INTEGER DEFAULT 0, -- biaya/MDR yang dipotong bank
+        imported_at TEXT
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS bank_reconciliations (
+        statement_line_id INTEGER,
+        journal_item_id INTEGER,
+        PRIMARY KEY (statement_line_id, journal_item_id)
+    )""")
+    c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_bank_reconciliations_item ON bank_reconciliations (journal_item_id)")
+    # Shift kasir per terminal dengan total berjalan per metode bayar dan kas masuk/keluar, lihat orca/shifts.py
+    c.execute("""CREATE TABLE IF NOT EXISTS shifts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        outlet_id INTEGER,
+        terminal TEXT,
+        employee_id INTEGER,
+        opened_at TEXT,
+        opening_float INTEGER DEFAULT 0, -- modal awal laci
+        cash_in INTEGER DEFAULT 0, -- total kas masuk di luar penjualan
+        cash_out INTEGER DEFAULT 0, -- total kas keluar di luar penjualan
+        closed_at TEXT,
+        closed_by INTEGER,
+        counted_cash INTEGER,
+        expected_cash INTEGER,
+        variance INTEGER, -- kas dihitung - kas seharusnya
+        notes TEXT,
+        journal_entry_id INTEGER -- jurnal selisih kas
+    )""")
+    c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_shifts_open ON shifts (outlet_id, terminal) WHERE closed_at IS NULL") # Satu shift buka per terminal
+    c.execute("""CREATE TABLE IF NOT EXISTS shift_totals (
+        shift_id INTEGER,
+        payment_method TEXT,
+        sales_count INTEGER DEFAULT 0,
+        sales_amount INTEGER DEFAULT 0,
+        void_count INTEGER DEFAULT 0,
+        void_amount INTEGER DEFAULT 0,
+        PRIMARY KEY (shift_id, payment_method)
+    )""")
+    c.execute("""CREATE TABLE IF NOT EXISTS shift_cash_movements (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        shift_id INTEGER,
+        moved_at TEXT,
+        kind TEXT, -- 'Masuk' / 'Keluar'
+        amount INTEGER,
+        reason TEXT,
+        employee_id INTEGER,
+        FOREIGN KEY (shift_id) REFERENCES shifts(id)
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_shift_cash_movements_shift ON shift_cash_movements (shift_id)")
+    # Penghitung perubahan per tabel (dinaikkan oleh trigger), dipakai untuk invalidasi cache/indeks di memori
+    c.execute("CREATE TABLE IF NOT EXISTS change_counters (name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)")
+    # UPDATE hanya dihitung untuk kolom yang dipakai cache-nya: stok bahan berubah di setiap penjualan/penerimaan
+    # dan nilai buku aset di setiap posting penyusutan, keduanya tidak boleh membatalkan cache
+    counted_columns = {'products': None, 'ingredients': 'name, unit', 'accounts': None,
+                       'fixed_assets': 'acquisition_date, acquisition_cost, useful_life_years, salvage_value, depreciation_method'}
+    for table, columns in counted_columns.items():
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            trigger_event = f"UPDATE OF {columns}" if event == 'UPDATE' and columns else event
+            c.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (f"{table}_{event.lower()}_counter",))
+            row = c.fetchone()
+            if row and f"AFTER {trigger_event} ON" not in row[0]: # Trigger lama dengan kolom berbeda dibuat ulang
+                c.execute(f"DROP TRIGGER {table}_{event.lower()}_counter")
+            c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_counter AFTER {trigger_event} ON {table} BEGIN
+                INSERT INTO change_counters (name, version) VALUES ('{table}', 1)
+                ON CONFLICT(name) DO UPDATE SET version = version + 1;
+            END""")
+
+    # Indeks untuk join item per transaksi (detail, trigger pencarian, laju pemakaian) dan filter tanggal
+    c.execute("CREATE INDEX IF NOT EXISTS idx_transaction_items_transaction ON transaction_items (transaction_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (transaction_date)")
+
+    create_search_tables(c)
+    update_db_schema(conn)
+    # Indeks per outlet (outlet_id di depan): jalur kasir & laporan per outlet hanya membaca partisinya sendiri
+    c.execute("CREATE INDEX IF NOT EXISTS idx_transactions_outlet_date ON transactions (outlet_id, transaction_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_expenses_outlet_date ON expenses (outlet_id, date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_attendance_outlet_check_in ON attendance (outlet_id, check_in)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_journal_entries_outlet_date ON journal_entries (outlet_id, entry_date)")
+    # Jurnal milik satu transaksi/pengeluaran (pembatalan & pembalikan jurnal)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_journal_entries_transaction ON journal_entries (transaction_id) WHERE transaction_id IS NOT NULL")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_journal_entries_expense ON journal_entries (expense_id) WHERE expense_id IS NOT NULL")
+    # Buku besar per akun: urutan (tanggal, jurnal, baris) langsung dari indeks; debit/kredit ikut (covering)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_journal_items_ledger ON journal_items (account_id, entry_date, journal_entry_id, debit, kredit)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_stock_movements_outlet ON stock_movements (outlet_id, ingredient_id, moved_at)")
+    c.execute("DROP INDEX IF EXISTS idx_inventory_lots_open") # Digantikan indeks lot terbuka per outlet
+    c.execute("CREATE INDEX IF NOT EXISTS idx_inventory_lots_outlet_open ON inventory_lots (outlet_id, ingredient_id, id) WHERE qty_remaining > 0")
+    # Versi struktur resep (BOM): berubah jika resep, resep setengah jadi, hasil batch, atau opsi produk berubah
+    bom_triggers = {
+        'recipes': ('INSERT', 'UPDATE', 'DELETE'),
+        'sub_recipes': ('INSERT', 'UPDATE', 'DELETE'),
+        'product_options': ('INSERT', 'UPDATE', 'DELETE'),
+        'option_recipe_deltas': ('INSERT', 'UPDATE', 'DELETE'),
+        'ingredients': ('UPDATE OF is_intermediate, batch_yield', 'DELETE'),
+    }
+    for table, events in bom_triggers.items():
+        for event in events:
+            c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_{event.split()[0].lower()}_bom_counter AFTER {event} ON {table} BEGIN
+                INSERT INTO change_counters (name, version) VALUES ('bom', 1)
+                ON CONFLICT(name) DO UPDATE SET version = version + 1;
+            END""")
+    conn.commit()
+    insert_initial_data(conn)
+    insert_initial_products(conn) 
+    insert_initial_accounts(conn) # NEW: Insert initial accounts
+    conn.close()
@@ -0,0 +1,113 @@
+"""Indeks pencarian di memori untuk katalog produk dan bahan.
+
+Setiap nama dinormalisasi (huruf kecil, tanpa aksen) lalu diindeks dengan tiga cara:
+awalan tiap kata, trigram (untuk potongan kata & salah ketik), dan kode singkat dari
+huruf awal tiap kata (mis. "kad" -> Kopi Aren Dingin). Indeks dibangun ulang hanya saat
+versi tabel di change_counters berubah.
+"""
+import unicodedata
+from collections import Counter, defaultdict
+
+import streamlit as st
+
+from orca.db import run_query, get_change_version
+
+MIN_TRIGRAM_SIMILARITY = 0.5 # Porsi trigram query yang harus ada di nama
+FUZZY_FALLBACK_MIN = 10 # Pencarian trigram hanya dijalankan jika hasil awalan/kode lebih sedikit dari ini
+
+
+def normalize(text):
+    """Huruf kecil tanpa aksen; karakter selain huruf/angka dijadikan spasi."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    return ' '.join(''.join(ch if ch.isalnum() else ' ' for ch in text).split())
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def short_code(normalized_name):
+    return ''.join(word[0] for word in normalized_name.split())
+
+
+class SearchIndex:
+    """Indeks prefix + trigram + kode singkat atas baris (id, name, ...)."""
+    def __init__(self, rows):
+        self.rows = {}
+        self.names = {}
+        self.prefixes = defaultdict(set)
+        self.grams = defaultdict(set)
+        self.codes = defaultdict(set)
+        for row in rows:
+            item_id, norm = row[0], normalize(row[1])
+            self.rows[item_id] = row
+            self.names[item_id] = norm
+            for word in set(norm.split()):
+                for end in range(1, len(word) + 1):
+                    self.prefixes[word[:end]].add(item_id)
+            for gram in trigrams(norm):
+                self.grams[gram].add(item_id)
+            if norm:
+                self.codes[short_code(norm)].add(item_id)
+        self.sorted_ids = sorted(self.rows, key=lambda i: (self.names[i], i))
+        # Urutan sekunder saat skor sama: nama terpendek dulu, lalu alfabetis
+        self.rank = {item_id: pos for pos, item_id in enumerate(sorted(self.rows, key=lambda i: (len(self.names[i]), self.names[i], i)))}
+
+    def search(self, query, limit=None):
+        """Id yang cocok, diurutkan dari skor tertinggi. Query kosong = semua id urut nama."""
+        q = normalize(query)
+        if not q:
+            return self.sorted_ids[:limit]
+        scores = {}
+
+        # Semua kata di query cocok sebagai awalan kata di nama
+        hits = None
+        for token in q.split():
+            postings = self.prefixes.get(token, set())
+            hits = postings if hits is None else hits & postings
+            if not hits:
+                break
+        for item_id in hits or ():
+            name = self.names[item_id]
+            scores[item_id] = 100 if name == q else (90 if name.startswith(q) else 80)
+
+        # Kode singkat (huruf awal tiap kata)
+        for item_id in self.codes.get(q.replace(' ', ''), ()):
+            scores[item_id] = max(scores.get(item_id, 0), 85)
+
+        # Trigram: potongan di tengah kata dan salah ketik
+        if len(q) >= 3 and len(scores) < FUZZY_FALLBACK_MIN:
+            query_grams = trigrams(q)
+            counts = Counter()
+            for gram in query_grams:
+                counts.update(self.grams.get(gram, ()))
+            for item_id, shared in counts.items():
+                if item_id in scores:
+                    continue
+                if q in self.names[item_id]:
+                    scores[item_id] = 70
+                else:
+                    similarity = shared / len(query_grams)
+                    if similarity >= MIN_TRIGRAM_SIMILARITY:
+                        scores[item_id] = 40 + 20 * similarity
+
+        rank = self.rank
+        ranked = sorted((-score, rank[item_id], item_id) for item_id, score in scores.items())
+        return [item_id for _, _, item_id in ranked[:limit]]
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _product_index(version, active_only):
+    return SearchIndex(run_query("SELECT id, name, price FROM products" + (" WHERE IFNULL(is_active, 1) = 1" if active_only else ""), fetch='all'))
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _ingredient_index(version):
+    return SearchIndex(run_query("SELECT id, name, unit FROM ingredients", fetch='all'))
+
+def get_product_index(active_only=False):
+    """Indeks katalog produk; dibangun ulang otomatis setelah produk berubah. active_only untuk katalog kasir."""
+    return _product_index(get_change_version('products'), active_only)
+
+def get_ingredient_index():
+    """Indeks daftar bahan; dibangun ulang otomatis setelah bahan berubah."""
+    return _ingredient_index(get_change_version('ingredients'))
@@ -0,0 +1,157 @@
+"""Shift kasir: modal awal laci, total berjalan per metode bayar, kas masuk/keluar, dan tutup shift (Z-report).
+
+Setiap penjualan dan pembatalan menambah total berjalan shift_totals (satu UPSERT per baris (shift, metode))
+di dalam transaksi database yang sama, sehingga kas seharusnya di laci dihitung dari beberapa baris itu
+tanpa memindai tabel transactions.
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from orca.accounting import create_journal_entry
+from orca.config import OUTLET_ID, TERMINAL_ID
+from orca.db import get_connection, get_df
+from orca.money import to_rupiah
+
+CASH_METHOD = 'Cash'
+OVER_ACCOUNT = "Pendapatan Lain-lain" # Kas lebih saat tutup shift
+SHORT_ACCOUNT = "Beban Lain-lain" # Kas kurang saat tutup shift
+
+
+def find_open_shift_id(c, terminal=TERMINAL_ID, outlet_id=OUTLET_ID):
+    """Id shift yang sedang buka di terminal ini (lewat indeks shift terbuka), atau None."""
+    c.execute("SELECT id FROM shifts WHERE outlet_id = ? AND terminal = ? AND closed_at IS NULL", (outlet_id, terminal))
+    row = c.fetchone()
+    return row[0] if row else None
+
+def add_to_shift(c, shift_id, payment_method, amount, voided=False):
+    """Tambahkan satu penjualan (atau pembatalan) ke total berjalan shift, di dalam transaksi pemanggil."""
+    count_col, amount_col = ('void_count', 'void_amount') if voided else ('sales_count', 'sales_amount')
+    c.execute(f"""INSERT INTO shift_totals (shift_id, payment_method, {count_col}, {amount_col}) VALUES (?, ?, 1, ?)
+        ON CONFLICT(shift_id, payment_method) DO UPDATE SET {count_col} = {count_col} + 1, {amount_col} = {amount_col} + excluded.{amount_col}""",
+              (shift_id, payment_method, amount))
+
+def get_open_shift(terminal=TERMINAL_ID, outlet_id=OUTLET_ID):
+    """Shift yang sedang buka di terminal ini sebagai dict (beserta nama kasir), atau None."""
+    df = get_df("""SELECT s.*, e.name AS employee_name FROM shifts s LEFT JOIN employees e ON e.id = s.employee_id
+        WHERE s.outlet_id = ? AND s.terminal = ? AND s.closed_at IS NULL""", (outlet_id, terminal))
+    return df.iloc[0].to_dict() if not df.empty else None
+
+def open_shift(employee_id, opening_float, terminal=TERMINAL_ID, outlet_id=OUTLET_ID):
+    """Buka shift dengan modal awal laci. Mengembalikan (berhasil, pesan)."""
+    opening_float = to_rupiah(opening_float)
+    if opening_float < 0:
+        return False, "Modal awal tidak boleh negatif."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        if find_open_shift_id(c, terminal, outlet_id):
+            raise ValueError(f"Masih ada shift yang buka di {terminal}. Tutup shift tersebut terlebih dahulu.")
+        c.execute("INSERT INTO shifts (outlet_id, terminal, employee_id, opened_at, opening_float) VALUES (?, ?, ?, ?, ?)",
+                  (outlet_id, terminal, employee_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), opening_float))
+        shift_id = c.lastrowid
+        conn.commit()
+        return True, f"Shift #{shift_id} dibuka di {terminal} dengan modal awal Rp {opening_float:,.0f}."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal membuka shift: {e}"
+    finally:
+        conn.close()
+
+def record_cash_movement(shift_id, kind, amount, reason, employee_id):
+    """Catat kas masuk/keluar laci di luar penjualan (mis. tambah uang kembalian, setor ke brankas). Mengembalikan (berhasil, pesan)."""
+    amount = to_rupiah(amount)
+    if kind not in ('Masuk', 'Keluar'):
+        return False, f"Jenis kas '{kind}' tidak dikenal."
+    if amount <= 0:
+        return False, "Jumlah harus lebih dari 0."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT closed_at FROM shifts WHERE id = ?", (shift_id,))
+        row = c.fetchone()
+        if not row or row[0]:
+            raise ValueError(f"Shift #{shift_id} tidak sedang buka.")
+        c.execute("INSERT INTO shift_cash_movements (shift_id, moved_at, kind, amount, reason, employee_id) VALUES (?, ?, ?, ?, ?, ?)",
+                  (shift_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), kind, amount, reason, employee_id))
+        column = 'cash_in' if kind == 'Masuk' else 'cash_out'
+        c.execute(f"UPDATE shifts SET {column} = {column} + ? WHERE id = ?", (amount, shift_id))
+        conn.commit()
+        return True, f"Kas {kind.lower()} Rp {amount:,.0f} dicatat."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal mencatat kas: {e}"
+    finally:
+        conn.close()
+
+def _shift_report(c, shift_id):
+    c.execute("SELECT opening_float, cash_in, cash_out FROM shifts WHERE id = ?", (shift_id,))
+    row = c.fetchone()
+    if not row:
+        raise ValueError(f"Shift #{shift_id} tidak ditemukan.")
+    opening_float, cash_in, cash_out = row
+    c.execute("SELECT payment_method, sales_count, sales_amount, void_count, void_amount FROM shift_totals WHERE shift_id = ? ORDER BY payment_method", (shift_id,))
+    totals = pd.DataFrame(c.fetchall(), columns=['Metode', 'Transaksi', 'Penjualan', 'Batal', 'Nilai Batal'])
+    totals['Bersih'] = totals['Penjualan'] - totals['Nilai Batal']
+    cash_net = int(totals.loc[totals['Metode'] == CASH_METHOD, 'Bersih'].sum())
+    return totals, opening_float + cash_net + cash_in - cash_out
+
+def get_shift_report(shift_id):
+    """Ringkasan shift (X/Z-report) dari total berjalan: (dict shift, DataFrame per metode bayar, kas seharusnya)."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        totals, expected_cash = _shift_report(c, shift_id)
+    finally:
+        conn.close()
+    shift = get_df("""SELECT s.*, e.name AS employee_name, ec.name AS closed_by_name FROM shifts s
+        LEFT JOIN employees e ON e.id = s.employee_id LEFT JOIN employees ec ON ec.id = s.closed_by WHERE s.id = ?""", (shift_id,)).iloc[0].to_dict()
+    return shift, totals, expected_cash
+
+def close_shift(shift_id, counted_cash, employee_id, notes=None):
+    """Tutup shift dengan hasil hitung fisik laci. Selisih (hitung - seharusnya) dijurnal sebagai kas lebih/kurang.
+
+    Mengembalikan (berhasil, pesan).
+    """
+    counted_cash = to_rupiah(counted_cash)
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("SELECT closed_at, outlet_id FROM shifts WHERE id = ?", (shift_id,))
+        row = c.fetchone()
+        if not row:
+            raise ValueError(f"Shift #{shift_id} tidak ditemukan.")
+        if row[0]:
+            raise ValueError(f"Shift #{shift_id} sudah ditutup pada {row[0]}.")
+        _, expected_cash = _shift_report(c, shift_id)
+        variance = counted_cash - expected_cash
+        closed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        journal_entry_id = None
+        if variance:
+            c.execute("SELECT account_name, id FROM accounts WHERE account_name IN ('Kas', ?, ?)", (OVER_ACCOUNT, SHORT_ACCOUNT))
+            account_ids = dict(c.fetchall())
+            if variance > 0:
+                lines = [{'account_id': account_ids['Kas'], 'debit': variance}, {'account_id': account_ids[OVER_ACCOUNT], 'kredit': variance}]
+            else:
+                lines = [{'account_id': account_ids[SHORT_ACCOUNT], 'debit': -variance}, {'account_id': account_ids['Kas'], 'kredit': -variance}]
+            success_journal, msg_journal, journal_entry_id = create_journal_entry(closed_at, f"Selisih Kas Shift #{shift_id} ({'lebih' if variance > 0 else 'kurang'})", lines, conn=conn, outlet_id=row[1])
+            if not success_journal:
+                raise ValueError(msg_journal)
+        c.execute("""UPDATE shifts SET closed_at = ?, closed_by = ?, counted_cash = ?, expected_cash = ?, variance = ?, notes = ?, journal_entry_id = ?
+            WHERE id = ?""", (closed_at, employee_id, counted_cash, expected_cash, variance, notes, journal_entry_id, shift_id))
+        conn.commit()
+        return True, f"Shift #{shift_id} ditutup. Kas seharusnya Rp {expected_cash:,.0f}, dihitung Rp {counted_cash:,.0f}, selisih Rp {variance:+,.0f}."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menutup shift: {e}"
+    finally:
+        conn.close()
+
+def get_shifts(limit=100, outlet_id=OUTLET_ID):
+    """Daftar shift terbaru di outlet ini."""
+    return get_df("""SELECT s.id AS 'ID', s.terminal AS 'Terminal', e.name AS 'Kasir', s.opened_at AS 'Dibuka', s.closed_at AS 'Ditutup',
+            s.opening_float AS 'Modal Awal', s.expected_cash AS 'Kas Seharusnya', s.counted_cash AS 'Kas Dihitung', s.variance AS 'Selisih'
+        FROM shifts s LEFT JOIN employees e ON e.id = s.employee_id WHERE s.outlet_id = ? ORDER BY s.id DESC LIMIT ?""", (outlet_id, limit))
@@ -0,0 +1,108 @@
+"""Laporan keuangan komparatif (Laba Rugi & Neraca) untuk banyak periode sekaligus.
+
+Semua kolom periode dihitung dalam satu query: setiap periode menjadi sepasang SUM(CASE WHEN ...) (mutasi
+dalam periode untuk Laba Rugi, saldo kumulatif s/d akhir periode untuk Neraca), dikelompokkan per akun.
+Susunan laporan mengikuti account_type di daftar akun, jadi akun baru otomatis muncul.
+"""
+import numpy as np
+import pandas as pd
+
+from orca.db import get_connection
+from orca.outlets import map_outlets
+
+PERIOD_MODES = ["Per Tanggal", "Bulanan", "Kuartalan", "Tahunan"]
+BALANCE_TYPES = ['Aset', 'Liabilitas', 'Ekuitas'] # Neraca: saldo s/d akhir periode
+
+
+def build_periods(mode, end_date, count=1):
+    """Daftar periode [(label, awal 'YYYY-MM-DD' atau None, akhir 'YYYY-MM-DD')], terlama lebih dulu.
+
+    'Per Tanggal' = satu periode dari awal pembukuan s/d end_date; Bulanan/Kuartalan/Tahunan = `count`
+    periode kalender yang berakhir pada periode berisi end_date (periode terakhir dipotong di end_date).
+    """
+    if mode == "Per Tanggal":
+        return [(f"s/d {end_date.strftime('%d %b %Y')}", None, end_date.isoformat())]
+    freq, label = {"Bulanan": ('M', '%b %Y'), "Kuartalan": ('Q', None), "Tahunan": ('Y', '%Y')}[mode]
+    periods = []
+    for period in pd.period_range(end=pd.Period(end_date, freq), periods=count, freq=freq):
+        end = min(period.end_time.date(), end_date)
+        periods.append((str(period).replace('Q', ' Q') if label is None else period.strftime(label), period.start_time.date().isoformat(), end.isoformat()))
+    return periods
+
+def get_statement_balances(periods, outlet_id=None):
+    """Mutasi dan saldo setiap akun untuk semua periode dalam satu query agregasi bersyarat.
+
+    Mengembalikan DataFrame per akun (id, account_code, account_name, account_type, normal_balance) dengan
+    kolom 'mutasi_<i>' (mutasi dalam periode) dan 'saldo_<i>' (saldo s/d akhir periode), bertanda sesuai saldo normal.
+    """
+    columns, params = [], []
+    for i, (_, start, end) in enumerate(periods):
+        # Jurnal penjualan menyimpan jam, jadi akhir periode mencakup seluruh hari terakhir
+        columns.append(f"SUM(CASE WHEN ji.entry_date >= ? AND ji.entry_date <= ? THEN ji.debit - ji.kredit ELSE 0 END) AS mutasi_{i}")
+        columns.append(f"SUM(CASE WHEN ji.entry_date <= ? THEN ji.debit - ji.kredit ELSE 0 END) AS saldo_{i}")
+        params += [start or '', f"{end} 23:59:59", f"{end} 23:59:59"]
+    last_end = max(end for _, _, end in periods)
+    query = f"""
+        SELECT a.id, a.account_code, a.account_name, a.account_type, a.normal_balance, {', '.join(columns)}
+        FROM accounts a
+        LEFT JOIN journal_items ji ON ji.account_id = a.id AND ji.entry_date <= ?
+            AND (? IS NULL OR ji.journal_entry_id IN (SELECT id FROM journal_entries WHERE outlet_id = ?))
+        GROUP BY a.id ORDER BY a.account_code
+    """
+    conn = get_connection()
+    df = pd.read_sql_query(query, conn, params=(*params, f"{last_end} 23:59:59", outlet_id, outlet_id))
+    conn.close()
+    amounts = [col for col in df.columns if col.startswith(('mutasi_', 'saldo_'))]
+    # Debit/kredit berupa rupiah bulat (orca/money.py), jadi jumlahnya eksak dan tetap bilangan bulat
+    df[amounts] = df[amounts].fillna(0).astype('int64').mul(df['normal_balance'].map({'Debit': 1, 'Kredit': -1}).fillna(1).astype('int64'), axis=0)
+    return df
+
+def get_consolidated_statement_balances(periods, outlet_ids):
+    """Seperti get_statement_balances, untuk beberapa outlet: parsial per outlet dihitung paralel lalu dijumlahkan."""
+    if len(outlet_ids) == 1:
+        return get_statement_balances(periods, outlet_ids[0])
+    partials = list(map_outlets(lambda outlet_id: get_statement_balances(periods, outlet_id), outlet_ids).values())
+    total = partials[0].copy()
+    amounts = [col for col in total.columns if col.startswith(('mutasi_', 'saldo_'))]
+    for partial in partials[1:]:
+        total[amounts] += partial[amounts].to_numpy()
+    return total
+
+def _section(balances, account_type, prefix, labels, sign=None):
+    """Baris akun satu kelompok beserta barisan totalnya."""
+    group = balances[balances['account_type'] == account_type]
+    values = group[[f"{prefix}_{i}" for i in range(len(labels))]].to_numpy()
+    if sign is not None: # Akun kontra (mis. Akumulasi Penyusutan) mengurangi total kelompoknya
+        values = values * np.where(group['normal_balance'] == sign, 1, -1)[:, None]
+    rows = pd.DataFrame(values, columns=labels, index=[f"   {code} - {name}" for code, name in zip(group['account_code'], group['account_name'])])
+    return rows, pd.Series(values.sum(axis=0), index=labels)
+
+def income_statement(balances, periods):
+    """Laba Rugi: satu baris per akun Pendapatan/Beban, subtotal, dan Laba Bersih per kolom periode."""
+    labels = [label for label, _, _ in periods]
+    income_rows, income_total = _section(balances, 'Pendapatan', 'mutasi', labels)
+    expense_rows, expense_total = _section(balances, 'Beban', 'mutasi', labels)
+    return pd.concat([
+        pd.DataFrame([[None] * len(labels)], columns=labels, index=["Pendapatan"]), income_rows, income_total.rename("Total Pendapatan").to_frame().T,
+        pd.DataFrame([[None] * len(labels)], columns=labels, index=["Beban"]), expense_rows, expense_total.rename("Total Beban").to_frame().T,
+        (income_total - expense_total).rename("Laba Bersih").to_frame().T,
+    ])
+
+def balance_sheet(balances, periods):
+    """Neraca per akhir setiap periode. Laba berjalan (Pendapatan - Beban kumulatif) masuk ke Ekuitas.
+
+    Mengembalikan (DataFrame laporan, Series selisih Aset - (Liabilitas + Ekuitas) per kolom).
+    """
+    labels = [label for label, _, _ in periods]
+    sections, totals = [], {}
+    for account_type in BALANCE_TYPES:
+        rows, totals[account_type] = _section(balances, account_type, 'saldo', labels, sign='Debit' if account_type == 'Aset' else 'Kredit')
+        if account_type == 'Ekuitas':
+            _, income = _section(balances, 'Pendapatan', 'saldo', labels)
+            _, expense = _section(balances, 'Beban', 'saldo', labels)
+            rows = pd.concat([rows, (income - expense).rename("   Laba Berjalan").to_frame().T])
+            totals[account_type] = totals[account_type] + income - expense
+        sections += [pd.DataFrame([[None] * len(labels)], columns=labels, index=[account_type]), rows, totals[account_type].rename(f"Total {account_type}").to_frame().T]
+    liabilities_equity = totals['Liabilitas'] + totals['Ekuitas']
+    sections.append(liabilities_equity.rename("Total Liabilitas + Ekuitas").to_frame().T)
+    return pd.concat(sections), totals['Aset'] - liabilities_equity
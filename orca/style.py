@@ -0,0 +1,210 @@
+"""Tema visual aplikasi (Biru Muda)."""
+
+# --- PERUBAHAN: Injeksi CSS untuk tema Biru Muda dan perbaikan input/select ---
+CUSTOM_CSS = """
+    <style>
+        /* Color Palette (Biru Muda) */
+        :root {
+            --primary-color: #87CEEB; /* Light Sky Blue */
+            --secondary-color: #ADD8E6; /* Light Blue */
+            --background-color: #E0FFFF; /* Light Cyan */
+            --text-color: #2F4F4F; /* Dark Slate Gray */
+            --widget-background: #F0F8FF; /* Alice Blue */
+            --accent-color: #4682B4; /* Steel Blue for highlights */
+        }
+
+        /* General Body */
+        body {
+            color: var(--text-color);
+            background-color: var(--background-color);
+        }
+
+        /* Sidebar */
+        .st-emotion-cache-16txtl3 { /* Target the sidebar container */
+            background-color: var(--widget-background);
+            border-right: 1px solid rgba(0, 0, 0, 0.1); /* Subtle border */
+        }
+        .st-emotion-cache-16txtl3 .stButton > button { /* Sidebar buttons */
+            background-color: var(--widget-background);
+            color: var(--text-color);
+            border: 1px solid var(--primary-color);
+        }
+        .st-emotion-cache-16txtl3 .stButton > button:hover {
+            background-color: var(--primary-color);
+            color: white;
+        }
+
+
+        /* Main Content */
+        .st-emotion-cache-1y4p8pa { /* Target the main content container */
+            background-color: var(--background-color);
+        }
+
+        /* Tombol Utama */
+        .stButton>button {
+            background-color: var(--primary-color);
+            color: white;
+            border: 2px solid var(--primary-color);
+            font-weight: bold;
+            padding: 0.5rem 1rem;
+            border-radius: 8px;
+            transition: all 0.2s ease-in-out;
+        }
+        .stButton>button:hover {
+            background-color: var(--secondary-color);
+            color: white;
+            border: 2px solid var(--secondary-color);
+            transform: translateY(-2px);
+        }
+        
+        /* Tombol Hapus & Aksi Berbahaya */
+        .stButton>button[kind="primary"] { /* Streamlit's primary button */
+            background-color: #DC143C; /* Crimson */
+            color: white;
+            border: none;
+        }
+         .stButton>button[kind="primary"]:hover {
+            background-color: #B22222; /* FireBrick */
+            color: white;
+        }
+
+        /* Header dan Subheader */
+        h1, h2, h3, h4, h5, h6 {
+            color: var(--accent-color); /* Menggunakan accent-color untuk header */
+            font-weight: bold;
+            margin-top: 1.5rem;
+            margin-bottom: 1rem;
+        }
+        h1 { font-size: 2.5rem; }
+        h2 { font-size: 2rem; }
+        h3 { font-size: 1.75rem; }
+
+        /* Widget Styling - Perbaikan untuk input dan selectbox */
+        .stTextInput>div>div>input, 
+        .stNumberInput>div>div>input, 
+        .stTextArea>div>div>textarea {
+            background-color: var(--widget-background);
+            color: var(--text-color);
+            border: 1px solid rgba(0, 0, 0, 0.2);
+            border-radius: 5px;
+            padding: 0.5rem 1rem; /* Menambah padding horizontal */
+            line-height: 1.5; /* Menyesuaikan tinggi baris */
+            min-height: 38px; /* Menjamin tinggi minimum */
+        }
+        
+        /* Styling untuk Selectbox */
+        .stSelectbox>div>div { /* Container utama selectbox */
+            background-color: var(--widget-background);
+            color: var(--text-color);
+            border: 1px solid rgba(0, 0, 0, 0.2);
+            border-radius: 5px;
+            padding: 0.25rem 1rem; /* Padding lebih kecil untuk selectbox */
+            min-height: 38px; /* Menjamin tinggi minimum */
+            display: flex;
+            align-items: center; /* Pusatkan teks secara vertikal */
+        }
+
+        .stSelectbox>div>div:focus {
+            border-color: var(--primary-color);
+            box-shadow: 0 0 0 0.2rem rgba(135, 206, 235, 0.25);
+        }
+
+        /* Styling untuk opsi dropdown (saat dibuka) */
+        .stSelectbox div[role="listbox"] {
+            background-color: var(--widget-background);
+            color: var(--text-color);
+            border: 1px solid rgba(0, 0, 0, 0.2);
+            border-radius: 5px;
+        }
+
+        .stSelectbox div[role="option"] {
+            padding: 0.5rem 1rem;
+            color: var(--text-color);
+        }
+
+        .stSelectbox div[role="option"]:hover {
+            background-color: var(--secondary-color);
+            color: white;
+        }
+
+        /* Metric Styling */
+        .st-emotion-cache-1g6gooi { /* Target the metric container */
+            background-color: var(--widget-background);
+            border-radius: 10px;
+            padding: 1rem;
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+            text-align: center;
+        }
+        .st-emotion-cache-1g6gooi > div > div:first-child { /* Metric label */
+            color: var(--text-color);
+            font-size: 0.9rem;
+            opacity: 0.8;
+        }
+        .st-emotion-cache-1g6gooi > div > div:last-child { /* Metric value */
+            color: var(--accent-color); /* Menggunakan accent-color untuk nilai metric */
+            font-size: 1.8rem;
+            font-weight: bold;
+        }
+
+        /* Expander Styling */
+        .st-emotion-cache-p5m000 { /* Expander header */
+            background-color: var(--widget-background);
+            border-radius: 8px;
+            padding: 0.8rem;
+            margin-bottom: 0.5rem;
+            border: 1px solid rgba(0, 0, 0, 0.1);
+        }
+        .st-emotion-cache-p5m000:hover {
+            background-color: rgba(240, 248, 255, 0.8);
+        }
+
+        /* Tabs Styling */
+        .stTabs [data-baseweb="tab-list"] {
+            gap: 10px;
+        }
+        .stTabs [data-baseweb="tab"] {
+            height: 50px;
+            white-space: nowrap;
+            background-color: var(--widget-background);
+            border-radius: 8px 8px 0 0;
+            gap: 10px;
+            padding-left: 20px;
+            padding-right: 20px;
+            color: var(--text-color);
+            font-weight: bold;
+        }
+        .stTabs [data-baseweb="tab"]:hover {
+            background-color: rgba(240, 248, 255, 0.8);
+        }
+        .stTabs [data-baseweb="tab"][aria-selected="true"] {
+            background-color: var(--primary-color);
+            color: white;
+            border-bottom: 3px solid var(--primary-color);
+        }
+
+        /* Dataframe Styling */
+        .st-emotion-cache-1r4qj8v { /* Dataframe container */
+            border: 1px solid rgba(0, 0, 0, 0.1);
+            border-radius: 8px;
+            overflow: hidden;
+        }
+        .st-emotion-cache-1r4qj8v table {
+            background-color: var(--widget-background);
+            color: var(--text-color);
+        }
+        .st-emotion-cache-1r4qj8v th {
+            background-color: var(--primary-color);
+            color: white;
+            font-weight: bold;
+        }
+        .st-emotion-cache-1r4qj8v tr:nth-child(even) {
+            background-color: rgba(240, 248, 255, 0.8);
+        }
+        /* Memastikan teks di dalam sel dataframe tidak terpotong secara vertikal */
+        .st-emotion-cache-1r4qj8v td {
+            white-space: normal !important; /* Izinkan teks untuk wrap */
+            word-break: break-word; /* Pecah kata jika terlalu panjang */
+            padding: 8px 10px; /* Sesuaikan padding */
+        }
+    </style>
+"""
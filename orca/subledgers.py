@@ -0,0 +1,163 @@
+"""Buku pembantu piutang (pelanggan) dan utang (pemasok): faktur terbuka, pembayaran, dan umur piutang/utang.
+
+Setiap faktur/tagihan adalah satu baris open_items yang terhubung ke jurnalnya (Piutang Usaha / Utang Usaha).
+Pembayaran dialokasikan ke faktur terbuka (bawaan: jatuh tempo terlama lebih dulu) dan dijurnal ke kas/bank.
+Umur dihitung dari hari lewat jatuh tempo; pengelompokan dan penjumlahan per pihak dilakukan dengan numpy
+(searchsorted + bincount), bukan per baris.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from orca.accounting import create_journal_entry
+from orca.config import AGING_BUCKETS, PAYMENT_TERM_DAYS
+from orca.db import get_connection, get_df
+from orca.money import to_rupiah
+
+KINDS = ["Piutang", "Utang"]
+CONTROL_ACCOUNTS = {'Piutang': 'Piutang Usaha', 'Utang': 'Utang Usaha'}
+PARTY_TABLES = {'Piutang': 'customers', 'Utang': 'suppliers'}
+AGING_LIMITS = [30, 60, 90] # Batas atas (hari lewat jatuh tempo) kelompok umur, sejajar dengan AGING_BUCKETS
+
+
+def default_due_date(doc_date):
+    """Jatuh tempo bawaan 'YYYY-MM-DD' = tanggal dokumen + PAYMENT_TERM_DAYS."""
+    return (date.fromisoformat(doc_date) + timedelta(days=PAYMENT_TERM_DAYS)).isoformat()
+
+def _account_id(c, account_name):
+    c.execute("SELECT id FROM accounts WHERE account_name = ?", (account_name,))
+    row = c.fetchone()
+    if not row:
+        raise ValueError(f"Akun '{account_name}' tidak ditemukan.")
+    return row[0]
+
+def post_open_item(c, kind, party_id, doc_no, doc_date, due_date, amount, description=None, journal_entry_id=None, receipt_id=None):
+    """Catat faktur/tagihan terbuka di dalam transaksi pemanggil (jurnalnya dibuat pemanggil). Mengembalikan id baris."""
+    c.execute("""INSERT INTO open_items (kind, party_id, doc_no, doc_date, due_date, description, amount, journal_entry_id, receipt_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", (kind, party_id, doc_no, doc_date, due_date or default_due_date(doc_date), description, amount, journal_entry_id, receipt_id))
+    return c.lastrowid
+
+def create_invoice(kind, party_id, doc_date, amount, counter_account_id, description, doc_no=None, due_date=None):
+    """Faktur pelanggan (Piutang: D Piutang Usaha / K akun lawan, mis. pendapatan) atau tagihan pemasok
+    (Utang: D akun lawan, mis. beban / K Utang Usaha). Mengembalikan (berhasil, pesan, id)."""
+    amount = to_rupiah(amount) # Sama dengan nilai di jurnal
+    if amount <= 0:
+        return False, "Nilai faktur harus lebih dari 0.", None
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        label = 'Faktur' if kind == 'Piutang' else 'Tagihan'
+        control = {'account_id': _account_id(c, CONTROL_ACCOUNTS[kind])}
+        counter = {'account_id': counter_account_id}
+        if kind == 'Piutang':
+            lines = [{**control, 'debit': amount}, {**counter, 'kredit': amount}]
+        else:
+            lines = [{**counter, 'debit': amount}, {**control, 'kredit': amount}]
+        success_journal, msg_journal, journal_entry_id = create_journal_entry(doc_date, " - ".join(filter(None, [label, doc_no, description])), lines, conn=conn)
+        if not success_journal:
+            raise ValueError(msg_journal)
+        item_id = post_open_item(c, kind, party_id, doc_no, doc_date, due_date, amount, description, journal_entry_id)
+        if not doc_no:
+            c.execute("UPDATE open_items SET doc_no = ? WHERE id = ?", (f"{'INV' if kind == 'Piutang' else 'BILL'}-{item_id}", item_id))
+        conn.commit()
+        return True, f"{label} #{item_id} dicatat (Rp {amount:,.0f}).", item_id
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal mencatat faktur: {e}", None
+    finally:
+        conn.close()
+
+def record_payment(kind, party_id, payment_date, amount, cash_account, open_item_ids=None, notes=None):
+    """Terima pembayaran pelanggan / bayar pemasok dan alokasikan ke faktur terbuka pihak tersebut.
+
+    open_item_ids membatasi faktur yang dilunasi (urutan tetap jatuh tempo terlama lebih dulu).
+    Jurnal: Piutang = D kas/bank / K Piutang Usaha; Utang = D Utang Usaha / K kas/bank. Mengembalikan (berhasil, pesan).
+    """
+    amount = to_rupiah(amount) # Sama dengan nilai di jurnal
+    if amount <= 0:
+        return False, "Jumlah pembayaran harus lebih dari 0."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("""SELECT id, amount - paid_amount FROM open_items
+            WHERE kind = ? AND party_id = ? AND status = 'Terbuka' ORDER BY due_date, id""", (kind, party_id))
+        open_items = [(item_id, outstanding) for item_id, outstanding in c.fetchall() if open_item_ids is None or item_id in open_item_ids]
+        outstanding_total = sum(outstanding for _, outstanding in open_items)
+        if amount > outstanding_total:
+            raise ValueError(f"Pembayaran Rp {amount:,.0f} melebihi sisa faktur terpilih Rp {outstanding_total:,.0f}.")
+        allocations, remaining = [], amount
+        for item_id, outstanding in open_items:
+            if remaining <= 0:
+                break
+            allocated = min(outstanding, remaining)
+            allocations.append((item_id, allocated))
+            remaining -= allocated
+
+        control_id, cash_id = _account_id(c, CONTROL_ACCOUNTS[kind]), _account_id(c, cash_account)
+        debit_id, kredit_id = (cash_id, control_id) if kind == 'Piutang' else (control_id, cash_id)
+        success_journal, msg_journal, journal_entry_id = create_journal_entry(payment_date, f"{'Penerimaan Piutang' if kind == 'Piutang' else 'Pembayaran Utang'} ({len(allocations)} faktur)",
+                                                            [{'account_id': debit_id, 'debit': amount}, {'account_id': kredit_id, 'kredit': amount}], conn=conn)
+        if not success_journal:
+            raise ValueError(msg_journal)
+        c.execute("""INSERT INTO payments (kind, party_id, payment_date, amount, account_id, notes, journal_entry_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)""", (kind, party_id, payment_date, amount, cash_id, notes, journal_entry_id))
+        payment_id = c.lastrowid
+        c.executemany("INSERT INTO payment_allocations (payment_id, open_item_id, amount) VALUES (?, ?, ?)",
+                      [(payment_id, item_id, allocated) for item_id, allocated in allocations])
+        c.executemany("""UPDATE open_items SET paid_amount = paid_amount + ?1,
+                status = CASE WHEN amount - paid_amount - ?1 <= 0 THEN 'Lunas' ELSE 'Terbuka' END
+            WHERE id = ?2""", [(allocated, item_id) for item_id, allocated in allocations])
+        conn.commit()
+        return True, f"Pembayaran Rp {amount:,.0f} dialokasikan ke {len(allocations)} faktur."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal mencatat pembayaran: {e}"
+    finally:
+        conn.close()
+
+def get_open_items(kind, party_id=None, limit=1000):
+    """Faktur terbuka (satu pihak atau semua), jatuh tempo terlama lebih dulu."""
+    return get_df(f"""
+        SELECT oi.id, p.name AS party_name, oi.doc_no, oi.doc_date, oi.due_date, oi.description, oi.amount, oi.paid_amount,
+            oi.amount - oi.paid_amount AS outstanding
+        FROM open_items oi LEFT JOIN {PARTY_TABLES[kind]} p ON p.id = oi.party_id
+        WHERE oi.kind = ? AND oi.status = 'Terbuka' AND (? IS NULL OR oi.party_id = ?)
+        ORDER BY oi.due_date, oi.id LIMIT ?
+    """, (kind, party_id, party_id, limit))
+
+def age_open_items(party_ids, due_dates, outstanding, as_of):
+    """Kelompokkan sisa faktur menurut hari lewat jatuh tempo per pihak (vektor numpy).
+
+    Faktur yang belum jatuh tempo masuk kelompok pertama. Mengembalikan (party_ids unik, matriks pihak x AGING_BUCKETS).
+    """
+    days_overdue = (np.datetime64(as_of, 'D') - np.asarray(due_dates, dtype='datetime64[D]')).astype(np.int64)
+    buckets = np.searchsorted(AGING_LIMITS, days_overdue, side='left')
+    codes, parties = pd.factorize(np.asarray(party_ids))
+    matrix = np.bincount(codes * len(AGING_BUCKETS) + buckets, weights=outstanding, minlength=len(parties) * len(AGING_BUCKETS))
+    return parties, matrix.reshape(len(parties), len(AGING_BUCKETS))
+
+def get_aging(kind, as_of):
+    """Laporan umur piutang/utang per pihak per tanggal as_of ('YYYY-MM-DD'): kolom AGING_BUCKETS + 'Total'.
+    Faktur bertanggal setelah as_of tidak ikut; sisa faktur adalah sisa saat ini.
+
+    Sisa faktur sudah dijumlahkan per (pihak, jatuh tempo) di SQL, jadi yang dibawa ke Python hanya satu baris
+    per tanggal jatuh tempo per pihak.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""SELECT party_id, due_date, SUM(amount - paid_amount) FROM open_items
+        WHERE kind = ? AND status = 'Terbuka' AND doc_date <= ? GROUP BY party_id, due_date""", (kind, as_of))
+    rows = c.fetchall()
+    c.execute(f"SELECT id, name FROM {PARTY_TABLES[kind]}")
+    names = dict(c.fetchall())
+    conn.close()
+    if not rows:
+        return pd.DataFrame(columns=[*AGING_BUCKETS, 'Total'])
+    party_ids, due_dates, outstanding = zip(*rows)
+    parties, matrix = age_open_items(party_ids, due_dates, np.array(outstanding, dtype=float), as_of)
+    aging = pd.DataFrame(matrix.round().astype('int64'), columns=AGING_BUCKETS, index=[names.get(party_id, f"#{party_id}") for party_id in parties])
+    aging['Total'] = aging.sum(axis=1)
+    return aging.sort_values('Total', ascending=False)
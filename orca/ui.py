@@ -0,0 +1,14 @@
+"""Komponen UI bersama untuk halaman menu."""
+import streamlit as st
+
+
+def lazy_tabs(labels, key):
+    """Pengganti st.tabs: hanya sub-menu yang dipilih yang dijalankan.
+
+    st.tabs mengeksekusi isi semua tab (termasuk query-nya) di setiap rerun,
+    sedangkan selector ini membuat halaman cukup merender satu sub-menu.
+    """
+    # Default lewat session_state agar sub-menu juga bisa dipilih dari halaman lain (mis. Pencarian)
+    st.session_state.setdefault(key, labels[0])
+    selected = st.segmented_control("Sub-menu", labels, key=key, label_visibility="collapsed")
+    return selected if selected in labels else labels[0]
@@ -0,0 +1,175 @@
+"""Varian dan tambahan (modifier) produk beserta BOM efektif per varian.
+
+Produk dasar (mis. "Kopi Aren") punya grup varian (Suhu: Panas/Dingin, Ukuran: Reguler/Large; pilih satu per grup)
+dan tambahan (mis. Double Shoot; boleh lebih dari satu). Setiap opsi membawa selisih harga dan selisih resep.
+Resep efektif untuk setiap kombinasi varian dihitung sekali per versi struktur resep (change_counters 'bom'),
+sehingga kasir cukup mencari satu dict per baris keranjang; tambahan dijumlahkan di atasnya.
+"""
+from itertools import product as combinations
+
+import streamlit as st
+
+from orca.db import get_connection, run_query, get_change_version
+
+
+class VariantCatalog:
+    """Opsi per produk dan resep efektif per (product_id, kombinasi varian)."""
+
+    def __init__(self, options, deltas, recipes):
+        self.options = {} # option_id -> (product_id, group_name, name, price_delta, is_modifier)
+        self.groups = {} # product_id -> [(group_name, is_modifier, [option_id, ...])] sesuai urutan tampil
+        for option_id, product_id, group_name, name, price_delta, is_modifier in options:
+            self.options[option_id] = (product_id, group_name, name, price_delta or 0, bool(is_modifier))
+            groups = self.groups.setdefault(product_id, [])
+            if not groups or groups[-1][0] != group_name:
+                groups.append((group_name, bool(is_modifier), []))
+            groups[-1][2].append(option_id)
+        self.deltas = {}
+        for option_id, ingredient_id, qty_delta in deltas:
+            self.deltas.setdefault(option_id, {})[ingredient_id] = qty_delta
+        base = {}
+        for product_id, ingredient_id, qty_per_unit in recipes:
+            base.setdefault(product_id, {})[ingredient_id] = qty_per_unit
+        # Semua kombinasi varian (tanpa tambahan); produk tanpa grup varian cukup punya kunci ()
+        self.boms = {}
+        for product_id in set(base) | set(self.groups):
+            axes = [ids for _, is_modifier, ids in self.groups.get(product_id, []) if not is_modifier]
+            for combo in combinations(*axes):
+                self.boms[(product_id, tuple(sorted(combo)))] = self._apply(base.get(product_id, {}), combo)
+
+    def _apply(self, bom, option_ids):
+        """Resep + selisih resep opsi; jumlah yang menjadi <= 0 dibuang."""
+        if not option_ids:
+            return bom
+        bom = dict(bom)
+        for option_id in option_ids:
+            for ingredient_id, qty_delta in self.deltas.get(option_id, {}).items():
+                bom[ingredient_id] = bom.get(ingredient_id, 0) + qty_delta
+        return {ingredient_id: qty for ingredient_id, qty in bom.items() if qty > 1e-9}
+
+    def has_options(self, product_id):
+        return product_id in self.groups
+
+    def check(self, product_id, option_ids):
+        """Pastikan semua opsi masih ada dan milik produk ini."""
+        for option_id in option_ids:
+            if self.options.get(option_id, (None,))[0] != product_id:
+                raise ValueError("Opsi produk di keranjang sudah tidak tersedia. Hapus item lalu tambahkan kembali.")
+
+    def needs(self, product_id, option_ids=()):
+        """Kebutuhan bahan langsung per 1 unit produk dengan opsi tersebut: {ingredient_id: qty}."""
+        self.check(product_id, option_ids)
+        variant = tuple(sorted(option_id for option_id in option_ids if not self.options[option_id][4]))
+        bom = self.boms.get((product_id, variant))
+        if bom is None: # Kombinasi tidak lengkap (mis. keranjang lama): hitung langsung
+            bom = self._apply(self.boms.get((product_id, ()), {}), variant)
+        return self._apply(bom, [option_id for option_id in option_ids if self.options[option_id][4]])
+
+    def price_delta(self, option_ids):
+        return sum(self.options[option_id][3] for option_id in option_ids)
+
+    def label(self, option_ids):
+        """Label opsi untuk keranjang/struk, mis. "Dingin, Large, +Double Shoot"."""
+        return ', '.join(f"+{self.options[option_id][2]}" if self.options[option_id][4] else self.options[option_id][2] for option_id in option_ids)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _variant_catalog(version):
+    return VariantCatalog(
+        run_query("SELECT id, product_id, group_name, name, price_delta, is_modifier FROM product_options ORDER BY product_id, is_modifier, group_name, sort_order, id", fetch='all'),
+        run_query("SELECT option_id, ingredient_id, qty_delta FROM option_recipe_deltas", fetch='all'),
+        run_query("SELECT product_id, ingredient_id, qty_per_unit FROM recipes", fetch='all'),
+    )
+
+def get_variant_catalog():
+    """Katalog varian yang di-memo; dibangun ulang hanya jika resep atau opsi produk berubah."""
+    return _variant_catalog(get_change_version('bom'))
+
+def add_option(product_ids, group_name, name, price_delta, is_modifier, recipe_deltas):
+    """Tambahkan satu opsi ke satu atau beberapa produk sekaligus.
+
+    recipe_deltas: [(ingredient_id, qty_delta)]. Mengembalikan (berhasil, pesan).
+    """
+    if not product_ids or not group_name or not name:
+        return False, "Produk, nama grup, dan nama opsi wajib diisi."
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        for product_id in product_ids:
+            c.execute("SELECT IFNULL(MAX(sort_order), 0) + 1 FROM product_options WHERE product_id = ? AND group_name = ?", (product_id, group_name))
+            c.execute("INSERT INTO product_options (product_id, group_name, name, price_delta, is_modifier, sort_order) VALUES (?, ?, ?, ?, ?, ?)",
+                      (product_id, group_name, name, price_delta, int(is_modifier), c.fetchone()[0]))
+            option_id = c.lastrowid
+            c.executemany("INSERT INTO option_recipe_deltas (option_id, ingredient_id, qty_delta) VALUES (?, ?, ?)",
+                          [(option_id, ingredient_id, qty_delta) for ingredient_id, qty_delta in recipe_deltas if qty_delta])
+        conn.commit()
+        return True, f"Opsi '{group_name}: {name}' ditambahkan ke {len(product_ids)} produk."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menambahkan opsi: {e}"
+    finally:
+        conn.close()
+
+def delete_option(option_id):
+    """Hapus opsi beserta selisih resepnya. Transaksi lama tetap menyimpan label opsinya."""
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute("DELETE FROM option_recipe_deltas WHERE option_id = ?", (option_id,))
+        c.execute("DELETE FROM product_options WHERE id = ?", (option_id,))
+        conn.commit()
+        return True, "Opsi dihapus."
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menghapus opsi: {e}"
+    finally:
+        conn.close()
+
+def merge_temperature_pairs(hot_suffix=" Panas", iced_suffix=" Dingin", group_name="Suhu"):
+    """Gabungkan pasangan produk "<X> Panas" / "<X> Dingin" menjadi produk dasar "<X>" dengan varian Suhu.
+
+    Harga dasar dan resep diambil dari versi panas; versi dingin menjadi selisih harga & resep.
+    Produk lama dinonaktifkan (bukan dihapus) agar riwayat transaksi tetap utuh. Mengembalikan (berhasil, pesan).
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute("BEGIN TRANSACTION")
+        c.execute(f"""SELECT hot.id, iced.id, substr(hot.name, 1, length(hot.name) - {len(hot_suffix)}), hot.price, iced.price
+            FROM products hot JOIN products iced ON iced.name = substr(hot.name, 1, length(hot.name) - {len(hot_suffix)}) || ?
+            WHERE hot.name LIKE ? AND IFNULL(hot.is_active, 1) = 1 AND IFNULL(iced.is_active, 1) = 1""", (iced_suffix, f"%{hot_suffix}"))
+        pairs = c.fetchall()
+        c.execute("SELECT name FROM products")
+        existing = {row[0] for row in c.fetchall()}
+        merged, skipped = [], []
+        for hot_id, iced_id, base_name, hot_price, iced_price in pairs:
+            if base_name in existing:
+                skipped.append(base_name)
+                continue
+            c.execute("INSERT INTO products (name, price, is_active) VALUES (?, ?, 1)", (base_name, hot_price))
+            base_id = c.lastrowid
+            c.execute("INSERT INTO recipes (product_id, ingredient_id, qty_per_unit) SELECT ?, ingredient_id, qty_per_unit FROM recipes WHERE product_id = ?", (base_id, hot_id))
+            for name, price_delta, sort_order in ((hot_suffix.strip(), 0, 1), (iced_suffix.strip(), iced_price - hot_price, 2)):
+                c.execute("INSERT INTO product_options (product_id, group_name, name, price_delta, is_modifier, sort_order) VALUES (?, ?, ?, ?, 0, ?)",
+                          (base_id, group_name, name, price_delta, sort_order))
+            iced_option_id = c.lastrowid
+            # Selisih resep dingin terhadap panas (bahan yang hanya ada di salah satu ikut dihitung)
+            c.execute("""INSERT INTO option_recipe_deltas (option_id, ingredient_id, qty_delta)
+                SELECT ?, ingredient_id, SUM(qty) FROM (
+                    SELECT ingredient_id, qty_per_unit AS qty FROM recipes WHERE product_id = ?
+                    UNION ALL SELECT ingredient_id, -qty_per_unit FROM recipes WHERE product_id = ?
+                ) GROUP BY ingredient_id HAVING ABS(SUM(qty)) > 1e-9""", (iced_option_id, iced_id, hot_id))
+            c.execute("UPDATE products SET is_active = 0 WHERE id IN (?, ?)", (hot_id, iced_id))
+            merged.append(base_name)
+        conn.commit()
+        message = f"{len(merged)} pasangan digabung menjadi produk dengan varian {group_name}."
+        if skipped:
+            message += f" Dilewati karena nama dasar sudah dipakai: {', '.join(skipped)}."
+        return True, message
+    except Exception as e:
+        conn.rollback()
+        return False, f"Gagal menggabungkan varian: {e}"
+    finally:
+        conn.close()
@@ -0,0 +1,34 @@
+"""Registri halaman menu. Modul halaman baru diimpor saat menu tersebut pertama kali dibuka."""
+import importlib
+
+# Label menu -> nama modul di paket orca.views (urutan = urutan di sidebar)
+PAGES = {
+    "🛒 Kasir": "kasir",
+    "🔎 Pencarian": "pencarian",
+    "📜 Riwayat Transaksi": "riwayat_transaksi",
+    "🧾 Shift Kasir": "shift",
+    "📊 Laporan & Analisa": "laporan", # Menggabungkan Laporan dan Analisa
+    "💰 Harga Pokok Penjualan": "hpp", # Mengganti nama menu HPP
+    "📦 Manajemen Stok Bahan": "stok", # Mengganti nama menu Manajemen Stok
+    "🚚 Pembelian Bahan": "pembelian",
+    "🍔 Manajemen Produk & Resep": "produk", # Mengganti nama menu Manajemen Produk
+    "💸 Catat Pengeluaran": "pengeluaran", # Mengganti nama menu Pengeluaran
+    "👥 Manajemen Karyawan": "karyawan",
+    "📚 Akuntansi": "akuntansi",
+    "📒 Piutang & Utang": "piutang_utang",
+    "👤 Pelanggan & Pemasok": "kontak",
+    "🏢 Aktiva Tetap": "aktiva",
+    "🏪 Outlet": "outlet",
+    "🕒 Riwayat Absensi": "absensi",
+    "⏱️ Performa": "performa",
+    "🗑️ Kelola & Hapus Data": "kelola_data", # Selalu di akhir
+}
+ADMIN_ONLY = {"🕒 Riwayat Absensi", "⏱️ Performa", "🏪 Outlet"}
+
+
+def menu_options(role):
+    return [label for label in PAGES if role == 'Admin' or label not in ADMIN_ONLY]
+
+
+def render_page(menu):
+    importlib.import_module(f"orca.views.{PAGES[menu]}").render()
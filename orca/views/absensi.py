@@ -0,0 +1,52 @@
+"""Halaman Riwayat Absensi (khusus Admin)."""
+import streamlit as st
+from datetime import datetime
+
+from orca.db import run_query, get_df
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("🕒 Riwayat Absensi Karyawan")
+    tab = lazy_tabs(["Daftar Absensi", "✏️ Edit Absensi"], key="absensi_tab")
+    
+    if tab == "Daftar Absensi":
+        st.subheader("Daftar Riwayat Absensi")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        df = get_df("SELECT a.id, e.name AS 'Nama Karyawan', a.check_in AS 'Waktu Check In', a.check_out AS 'Waktu Check Out' FROM attendance a JOIN employees e ON a.employee_id = e.id ORDER BY a.check_in DESC")
+        st.dataframe(df, use_container_width=True, column_config={
+            "ID": st.column_config.Column(width="small"),
+            "Nama Karyawan": st.column_config.Column(width="medium"),
+            "Waktu Check In": st.column_config.Column(width="medium"),
+            "Waktu Check Out": st.column_config.Column(width="medium")
+        })
+    
+    elif tab == "✏️ Edit Absensi":
+        st.subheader("Edit Data Absensi")
+        attendance_df = get_df("SELECT a.id, e.name, a.check_in FROM attendance a JOIN employees e ON a.employee_id = e.id ORDER BY a.check_in DESC")
+        if not attendance_df.empty:
+            attendance_options = {f"ID: {row['id']} - {row['name']} ({row['check_in']})": row['id'] for _, row in attendance_df.iterrows()}
+            selected_att_str = st.selectbox("Pilih absensi untuk diedit", list(attendance_options.keys()), key="edit_att_select")
+            if selected_att_str:
+                att_id = attendance_options[selected_att_str]
+                att_data = run_query("SELECT * FROM attendance WHERE id=?", (att_id,), fetch='one')
+                if att_data:
+                    with st.form("attendance_form"):
+                        check_in_val = datetime.strptime(att_data[2], '%Y-%m-%d %H:%M:%S')
+                        check_out_val = datetime.strptime(att_data[3], '%Y-%m-%d %H:%M:%S') if att_data[3] else None
+                        
+                        st.markdown("Format Waktu: `YYYY-MM-DD HH:MM:SS`")
+                        new_check_in = st.text_input("Waktu Check In", value=check_in_val.strftime('%Y-%m-%d %H:%M:%S'))
+                        new_check_out = st.text_input("Waktu Check Out", value=check_out_val.strftime('%Y-%m-%d %H:%M:%S') if check_out_val else "")
+                        
+                        if st.form_submit_button("Simpan Perubahan"):
+                            try:
+                                # Validate date format
+                                datetime.strptime(new_check_in, '%Y-%m-%d %H:%M:%S')
+                                if new_check_out: datetime.strptime(new_check_out, '%Y-%m-%d %H:%M:%S')
+                                
+                                run_query("UPDATE attendance SET check_in=?, check_out=? WHERE id=?", (new_check_in, new_check_out if new_check_out else None, att_id)); st.success("Data diperbarui!"); st.rerun()
+                            except ValueError:
+                                st.error("Format tanggal/waktu tidak valid. Gunakan format YYYY-MM-DD HH:MM:SS.")
+        else: 
+            st.info("Tidak ada data absensi untuk dikelola.")
@@ -0,0 +1,110 @@
+"""Halaman Manajemen Aktiva Tetap."""
+import streamlit as st
+from datetime import datetime, date
+
+from orca.db import run_query, get_df
+from orca.depreciation import DEPRECIATION_METHODS, get_depreciation_schedule, get_unposted_depreciation, post_depreciation
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("🏢 Manajemen Aktiva Tetap")
+    tab = lazy_tabs(["Daftar Aktiva", "➕ Tambah Aktiva", "✏️ Edit Aktiva", "📉 Penyusutan"], key="aktiva_tab")
+
+    if tab == "Daftar Aktiva":
+        st.subheader("Daftar Aktiva Tetap Saat Ini")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, asset_name AS 'Nama Aset', acquisition_date AS 'Tgl Perolehan', acquisition_cost AS 'Biaya Perolehan', useful_life_years AS 'Umur Ekonomis (Tahun)', salvage_value AS 'Nilai Residu', depreciation_method AS 'Metode Depresiasi', current_book_value AS 'Nilai Buku Saat Ini' FROM fixed_assets").style.format({'Biaya Perolehan': 'Rp {:,.2f}', 'Nilai Residu': 'Rp {:,.2f}', 'Nilai Buku Saat Ini': 'Rp {:,.2f}'}), use_container_width=True, column_config={
+            "Nama Aset": st.column_config.Column(width="medium"),
+            "Tgl Perolehan": st.column_config.Column(width="small"),
+            "Biaya Perolehan": st.column_config.Column(width="small"),
+            "Umur Ekonomis (Tahun)": st.column_config.Column(width="small"),
+            "Nilai Residu": st.column_config.Column(width="small"),
+            "Metode Depresiasi": st.column_config.Column(width="small"),
+            "Nilai Buku Saat Ini": st.column_config.Column(width="small")
+        })
+    
+    elif tab == "➕ Tambah Aktiva":
+        st.subheader("Tambah Aktiva Tetap Baru")
+        with st.form("add_asset_form"):
+            asset_name = st.text_input("Nama Aset", placeholder="Contoh: Mesin Espresso", key="add_asset_name")
+            acquisition_date = st.date_input("Tanggal Perolehan", date.today(), key="add_acquisition_date")
+            acquisition_cost = st.number_input("Biaya Perolehan (Rp)", value=0.01, format="%.2f", min_value=0.01, key="add_acquisition_cost")
+            useful_life_years = st.number_input("Umur Ekonomis (Tahun)", min_value=1, value=5, key="add_useful_life")
+            salvage_value = st.number_input("Nilai Residu (Rp)", value=0.0, format="%.2f", min_value=0.0, key="add_salvage_value")
+            depreciation_method = st.selectbox("Metode Depresiasi", DEPRECIATION_METHODS, key="add_depreciation_method")
+            
+            if st.form_submit_button("Tambah Aktiva"):
+                if asset_name and acquisition_cost > 0:
+                    run_query("INSERT INTO fixed_assets (asset_name, acquisition_date, acquisition_cost, useful_life_years, salvage_value, depreciation_method, current_book_value) VALUES (?, ?, ?, ?, ?, ?, ?)", 
+                              (asset_name, acquisition_date.isoformat(), acquisition_cost, useful_life_years, salvage_value, depreciation_method, acquisition_cost)) # current_book_value = acquisition_cost saat awal
+                    st.success(f"Aktiva '{asset_name}' berhasil ditambahkan."); st.rerun()
+                else:
+                    st.error("Nama Aset dan Biaya Perolehan tidak boleh kosong atau nol.")
+
+    elif tab == "✏️ Edit Aktiva":
+        st.subheader("Edit Aktiva Tetap")
+        assets_df = get_df("SELECT id, asset_name FROM fixed_assets")
+        if not assets_df.empty:
+            asset_options = {row['asset_name']: row['id'] for _, row in assets_df.iterrows()}
+            selected_asset_name = st.selectbox("Pilih Aktiva untuk Diedit", list(asset_options.keys()), key="select_asset_to_edit")
+            selected_asset_id = asset_options[selected_asset_name]
+            asset_data = run_query("SELECT * FROM fixed_assets WHERE id = ?", (selected_asset_id,), fetch='one')
+
+            with st.form("edit_asset_form"):
+                st.info(f"Mengedit aktiva: **{asset_data[1]}**")
+                new_asset_name = st.text_input("Nama Aset", value=asset_data[1], key="edit_asset_name")
+                new_acquisition_date = st.date_input("Tanggal Perolehan", value=datetime.strptime(asset_data[2], '%Y-%m-%d').date(), key="edit_acquisition_date")
+                new_acquisition_cost = st.number_input("Biaya Perolehan (Rp)", value=float(asset_data[3]), format="%.2f", min_value=0.01, key="edit_acquisition_cost")
+                new_useful_life_years = st.number_input("Umur Ekonomis (Tahun)", min_value=1, value=asset_data[4], key="edit_useful_life")
+                new_salvage_value = st.number_input("Nilai Residu (Rp)", value=float(asset_data[5]), format="%.2f", min_value=0.0, key="edit_salvage_value")
+                new_depreciation_method = st.selectbox("Metode Depresiasi", DEPRECIATION_METHODS, index=DEPRECIATION_METHODS.index(asset_data[6]) if asset_data[6] in DEPRECIATION_METHODS else 0, key="edit_depreciation_method")
+                
+                if st.form_submit_button("Simpan Perubahan Aktiva"):
+                    if new_asset_name and new_acquisition_cost > 0:
+                        run_query("UPDATE fixed_assets SET asset_name=?, acquisition_date=?, acquisition_cost=?, useful_life_years=?, salvage_value=?, depreciation_method=? WHERE id=?", 
+                                  (new_asset_name, new_acquisition_date.isoformat(), new_acquisition_cost, new_useful_life_years, new_salvage_value, new_depreciation_method, selected_asset_id))
+                        st.success(f"Aktiva '{new_asset_name}' berhasil diperbarui."); st.rerun()
+                    else:
+                        st.error("Nama Aset dan Biaya Perolehan tidak boleh kosong atau nol.")
+        else:
+            st.info("Tidak ada aktiva tetap untuk diedit.")
+
+    elif tab == "📉 Penyusutan":
+        st.subheader("Penyusutan Aktiva Tetap")
+        schedule = get_depreciation_schedule()
+        if schedule.empty:
+            st.info("Belum ada aktiva tetap.")
+            return
+        assets_df = get_df("SELECT id, asset_name FROM fixed_assets")
+        asset_names = dict(zip(assets_df['id'], assets_df['asset_name']))
+        current_period = date.today().strftime("%Y-%m")
+
+        # Posisi per bulan berjalan: baris jadwal terakhir s/d bulan ini untuk setiap aset
+        to_date = schedule[schedule['period'] <= current_period].groupby('asset_id').tail(1)
+        this_month = schedule[schedule['period'] == current_period].set_index('asset_id')['depreciation']
+        position = to_date.assign(**{'Aset': to_date['asset_id'].map(asset_names), 'Penyusutan Bulan Ini': to_date['asset_id'].map(this_month).fillna(0)})
+        st.dataframe(position[['Aset', 'Penyusutan Bulan Ini', 'accumulated', 'book_value']].rename(columns={'accumulated': 'Akumulasi', 'book_value': 'Nilai Buku'})
+                     .style.format({'Penyusutan Bulan Ini': 'Rp {:,.2f}', 'Akumulasi': 'Rp {:,.2f}', 'Nilai Buku': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+        st.markdown("#### Posting Penyusutan")
+        through_period = st.selectbox("Posting s/d bulan", sorted({p for p in schedule['period'] if p <= current_period}, reverse=True), key="depreciation_through_period")
+        pending = get_unposted_depreciation(through_period) if through_period else schedule.iloc[0:0]
+        if pending.empty:
+            st.info("Semua penyusutan s/d bulan ini sudah diposting.")
+        else:
+            st.dataframe(pending.groupby('period', as_index=False).agg(**{'Aset': ('asset_id', 'nunique'), 'Penyusutan': ('depreciation', 'sum')}).rename(columns={'period': 'Bulan'})
+                         .style.format({'Penyusutan': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
+            if st.button("📒 Posting Penyusutan", key="post_depreciation_btn", type="primary"):
+                success, message = post_depreciation(through_period)
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+        st.markdown("---")
+        st.markdown("#### Jadwal per Aset")
+        asset_id = st.selectbox("Pilih aset", list(asset_names), format_func=asset_names.get, key="depreciation_schedule_asset")
+        st.dataframe(schedule[schedule['asset_id'] == asset_id].drop(columns='asset_id').rename(columns={'period': 'Bulan', 'depreciation': 'Penyusutan', 'accumulated': 'Akumulasi', 'book_value': 'Nilai Buku'})
+                     .style.format({'Penyusutan': 'Rp {:,.2f}', 'Akumulasi': 'Rp {:,.2f}', 'Nilai Buku': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
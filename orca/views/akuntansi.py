@@ -0,0 +1,302 @@
+"""Halaman Modul Akuntansi."""
+import streamlit as st
+from datetime import date, timedelta
+
+from orca.db import run_query, get_df
+from orca.accounting import LEDGER_PAGE_SIZE, create_journal_entry, get_ledger_opening, get_ledger_page, ledger_version
+from orca.config import SALES_POSTING_MODE
+from orca.money import check_money_consistency
+from orca.outlets import get_outlets
+from orca.reconciliation import get_unreconciled_bank_items, match_statement, read_statement, save_reconciliation, statement_template
+from orca.sales import get_pending_sales, post_daily_sales
+from orca.statements import PERIOD_MODES, balance_sheet, build_periods, get_consolidated_statement_balances, income_statement
+from orca.ui import lazy_tabs
+
+
+@st.cache_data(show_spinner="Menghitung laporan keuangan...", max_entries=32)
+def compute_statement_balances(periods, outlet_ids, version):
+    """Mutasi & saldo akun untuk semua periode, satu outlet atau gabungan (dihitung paralel per outlet).
+
+    version (dari ledger_version()) hanya dipakai sebagai kunci cache.
+    """
+    return get_consolidated_statement_balances(periods, outlet_ids)
+
+
+def render():
+    st.header("📚 Modul Akuntansi")
+    tab = lazy_tabs(["Daftar Akun", "Jurnal Umum", "Buku Besar", "Laporan Keuangan", "Tutup Harian", "Rekonsiliasi Bank"], key="akuntansi_tab")
+
+    if tab == "Daftar Akun":
+        st.subheader("Daftar Akun (Chart of Accounts)")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, account_code AS 'Kode Akun', account_name AS 'Nama Akun', account_type AS 'Tipe Akun', normal_balance AS 'Saldo Normal' FROM accounts"), use_container_width=True, column_config={
+            "Kode Akun": st.column_config.Column(width="small"),
+            "Nama Akun": st.column_config.Column(width="medium"),
+            "Tipe Akun": st.column_config.Column(width="small"),
+            "Saldo Normal": st.column_config.Column(width="small")
+        })
+        
+        st.markdown("---")
+        st.subheader("Tambah/Edit Akun")
+        accounts_df = get_df("SELECT id, account_code, account_name FROM accounts")
+        account_options = {f"{row['account_code']} - {row['account_name']}": row['id'] for _, row in accounts_df.iterrows()}
+        
+        edit_mode = st.checkbox("Mode Edit Akun yang Ada?", key="edit_account_mode_checkbox")
+        selected_account_id = None
+        
+        if edit_mode and not accounts_df.empty:
+            selected_account_str = st.selectbox("Pilih Akun untuk Diedit", list(account_options.keys()), key="select_account_to_edit")
+            selected_account_id = account_options[selected_account_str]
+            account_data = run_query("SELECT * FROM accounts WHERE id = ?", (selected_account_id,), fetch='one')
+            
+            with st.form("edit_account_form"):
+                st.info(f"Mengedit akun: **{account_data[2]}**")
+                new_account_code = st.number_input("Kode Akun", value=account_data[1], format="%d", key="edit_acc_code")
+                new_account_name = st.text_input("Nama Akun", value=account_data[2], key="edit_acc_name")
+                new_account_type = st.selectbox("Tipe Akun", ["Aset", "Liabilitas", "Ekuitas", "Pendapatan", "Beban"], index=["Aset", "Liabilitas", "Ekuitas", "Pendapatan", "Beban"].index(account_data[3]), key="edit_acc_type")
+                new_normal_balance = st.selectbox("Saldo Normal", ["Debit", "Kredit"], index=["Debit", "Kredit"].index(account_data[4]), key="edit_normal_balance")
+                if st.form_submit_button("Simpan Perubahan Akun"):
+                    if new_account_name and new_account_code > 0:
+                        run_query("UPDATE accounts SET account_code=?, account_name=?, account_type=?, normal_balance=? WHERE id=?", (new_account_code, new_account_name, new_account_type, new_normal_balance, selected_account_id))
+                        st.success("Akun berhasil diperbarui!"); st.rerun()
+                    else:
+                        st.error("Kode dan Nama Akun tidak boleh kosong atau nol.")
+        else:
+            with st.form("add_account_form"):
+                new_account_code = st.number_input("Kode Akun Baru", value=0, format="%d", key="add_acc_code")
+                new_account_name = st.text_input("Nama Akun Baru", placeholder="Contoh: Beban Gaji Karyawan", key="add_acc_name")
+                new_account_type = st.selectbox("Tipe Akun Baru", ["Aset", "Liabilitas", "Ekuitas", "Pendapatan", "Beban"], key="add_acc_type")
+                new_normal_balance = st.selectbox("Saldo Normal Baru", ["Debit", "Kredit"], key="add_normal_balance")
+                if st.form_submit_button("Tambah Akun Baru"):
+                    if new_account_name and new_account_code > 0:
+                        run_query("INSERT INTO accounts (account_code, account_name, account_type, normal_balance) VALUES (?, ?, ?, ?)", (new_account_code, new_account_name, new_account_type, new_normal_balance))
+                        st.success("Akun baru berhasil ditambahkan!"); st.rerun()
+                    else:
+                        st.error("Kode dan Nama Akun tidak boleh kosong atau nol.")
+
+    elif tab == "Jurnal Umum":
+        st.subheader("Jurnal Umum")
+        
+        st.session_state.setdefault("journal_start_date", date.today().replace(day=1))
+        st.session_state.setdefault("journal_end_date", date.today())
+        col_journal_filter1, col_journal_filter2 = st.columns(2)
+        with col_journal_filter1:
+            journal_start_date = st.date_input("Dari Tanggal Jurnal", key="journal_start_date")
+        with col_journal_filter2:
+            journal_end_date = st.date_input("Sampai Tanggal Jurnal", key="journal_end_date")
+
+        journal_query = f"""
+            SELECT 
+                je.entry_date AS 'Tanggal',
+                je.description AS 'Deskripsi',
+                a.account_code || ' - ' || a.account_name AS 'Akun',
+                ji.debit AS 'Debit',
+                ji.kredit AS 'Kredit'
+            FROM journal_entries je
+            JOIN journal_items ji ON je.id = ji.journal_entry_id
+            JOIN accounts a ON ji.account_id = a.id
+            WHERE je.entry_date BETWEEN ? AND ?
+            ORDER BY je.entry_date DESC, je.id DESC
+        """
+        # Jurnal penjualan menyimpan jam, jadi batas akhir mencakup seluruh hari terakhir
+        journal_params = [journal_start_date.isoformat(), journal_end_date.strftime("%Y-%m-%d 23:59:59")]
+        journal_df = get_df(journal_query, journal_params)
+        
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(journal_df.style.format({'Debit': 'Rp {:,.0f}', 'Kredit': 'Rp {:,.0f}'}), use_container_width=True, column_config={
+            "Tanggal": st.column_config.Column(width="small"),
+            "Deskripsi": st.column_config.Column(width="medium"),
+            "Akun": st.column_config.Column(width="medium"),
+            "Debit": st.column_config.Column(width="small"),
+            "Kredit": st.column_config.Column(width="small")
+        })
+
+        st.markdown("---")
+        st.subheader("Buat Jurnal Manual")
+        st.info("Pastikan total Debit dan Kredit seimbang sebelum posting jurnal.")
+        with st.form("manual_journal_form"):
+            journal_date = st.date_input("Tanggal Jurnal", date.today(), key="manual_journal_date")
+            journal_description = st.text_input("Deskripsi Jurnal", placeholder="Contoh: Penyesuaian Akhir Bulan", key="manual_journal_desc")
+            
+            st.markdown("#### Entri Jurnal:")
+            num_entries = st.number_input("Jumlah Baris Entri", min_value=2, value=2, step=1, key="num_journal_entries")
+            
+            manual_entries = []
+            accounts_for_journal = get_df("SELECT id, account_code, account_name FROM accounts")
+            account_journal_options = {f"{row['account_code']} - {row['account_name']}": row['id'] for _, row in accounts_for_journal.iterrows()}
+
+            if not account_journal_options:
+                st.warning("Tidak ada akun yang tersedia untuk jurnal. Harap tambahkan di menu Akuntansi > Daftar Akun.")
+            else:
+                for i in range(num_entries):
+                    st.markdown(f"**Baris {i+1}**")
+                    col_acc, col_deb, col_kre = st.columns(3)
+                    with col_acc:
+                        selected_acc_name = st.selectbox(f"Akun {i+1}", list(account_journal_options.keys()), key=f"acc_select_{i}")
+                        account_id = account_journal_options[selected_acc_name]
+                    with col_deb:
+                        debit_val = st.number_input(f"Debit {i+1}", value=0, step=1000, key=f"debit_{i}")
+                    with col_kre:
+                        kredit_val = st.number_input(f"Kredit {i+1}", value=0, step=1000, key=f"kredit_{i}")
+                    manual_entries.append({'account_id': account_id, 'debit': debit_val, 'kredit': kredit_val})
+                
+                if st.form_submit_button("Posting Jurnal"):
+                    if journal_description:
+                        success, message, _ = create_journal_entry(journal_date.isoformat(), journal_description, manual_entries)
+                        if success:
+                            st.success(message); st.rerun()
+                        else:
+                            st.error(message)
+                    else:
+                        st.error("Deskripsi jurnal tidak boleh kosong.")
+
+    elif tab == "Buku Besar":
+        st.subheader("Buku Besar per Akun")
+        accounts_df = get_df("SELECT id, account_code, account_name FROM accounts ORDER BY account_code")
+        account_labels = {row['id']: f"{row['account_code']} - {row['account_name']}" for _, row in accounts_df.iterrows()}
+        ledger_account = st.selectbox("Akun", list(account_labels), format_func=account_labels.get, key="ledger_account")
+        col_ledger1, col_ledger2 = st.columns(2)
+        ledger_start = col_ledger1.date_input("Dari Tanggal", date.today().replace(day=1), key="ledger_start")
+        ledger_end = col_ledger2.date_input("Sampai Tanggal", date.today(), key="ledger_end")
+        ledger_params = (ledger_account, ledger_start.isoformat(), ledger_end.strftime("%Y-%m-%d 23:59:59"))
+
+        # Tumpukan halaman: (kunci keyset awal halaman, saldo sebelum halaman); direset jika filter berubah
+        if st.session_state.get('ledger_params') != ledger_params:
+            st.session_state.ledger_params = ledger_params
+            st.session_state.ledger_pages = [((ledger_params[1], 0, 0), get_ledger_opening(ledger_account, ledger_params[1]))]
+        pages = st.session_state.ledger_pages
+        page_key, page_opening = pages[-1]
+        page = get_ledger_page(ledger_account, ledger_params[2], page_key, page_opening, LEDGER_PAGE_SIZE + 1)
+        has_next = len(page) > LEDGER_PAGE_SIZE
+        page = page.head(LEDGER_PAGE_SIZE)
+
+        st.metric("Saldo Awal Periode", f"Rp {pages[0][1]:,.0f}")
+        if page.empty:
+            st.info("Tidak ada posting pada rentang tanggal ini.")
+        else:
+            st.caption(f"Halaman {len(pages)} ({LEDGER_PAGE_SIZE} posting per halaman)")
+            st.dataframe(page.drop(columns='id').style.format({'Debit': 'Rp {:,.0f}', 'Kredit': 'Rp {:,.0f}', 'Saldo': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+        col_prev, col_next = st.columns(2)
+        if col_prev.button("⬅️ Sebelumnya", key="ledger_prev", disabled=len(pages) == 1, use_container_width=True):
+            pages.pop(); st.rerun()
+        if col_next.button("Berikutnya ➡️", key="ledger_next", disabled=not has_next, use_container_width=True):
+            last = page.iloc[-1]
+            pages.append(((last['Tanggal'], int(last['No. Jurnal']), int(last['id'])), float(last['Saldo']))); st.rerun()
+
+    elif tab == "Laporan Keuangan":
+        st.subheader("Laporan Keuangan")
+        report_type = st.selectbox("Pilih Laporan", ["Laba Rugi", "Neraca"], key="financial_report_type")
+        col_report1, col_report2, col_report3 = st.columns(3)
+        period_mode = col_report1.selectbox("Periode", PERIOD_MODES, key="financial_report_mode")
+        report_date = col_report2.date_input("Sampai Tanggal", date.today(), key="financial_report_date")
+        period_count = col_report3.number_input("Jumlah Periode", min_value=1, max_value=36, value=12 if period_mode == "Bulanan" else 4 if period_mode == "Kuartalan" else 2,
+                                                key=f"financial_report_count_{period_mode}", disabled=period_mode == "Per Tanggal")
+        outlets = get_outlets(active_only=False)
+        outlet_choice = st.selectbox("Outlet", ["Semua Outlet (Konsolidasi)", *outlets.values()], key="financial_report_outlet") if len(outlets) > 1 else None
+        outlet_ids = tuple(outlet_id for outlet_id, name in outlets.items() if outlet_choice in (None, "Semua Outlet (Konsolidasi)", name))
+        periods = tuple(build_periods(period_mode, report_date, period_count))
+
+        # Laporan hanya dihitung saat diminta; hasilnya di-cache per periode & versi buku besar
+        if st.button("📊 Buat Laporan", key="generate_financial_report"):
+            st.session_state.financial_report_request = (report_type, periods, outlet_ids)
+        if st.session_state.get('financial_report_request') != (report_type, periods, outlet_ids):
+            st.info("Pilih jenis laporan dan periode, lalu klik **Buat Laporan**.")
+            return
+
+        balances = compute_statement_balances(periods, outlet_ids, ledger_version())
+        pending = get_pending_sales(report_date.isoformat())
+        if not pending.empty:
+            st.warning(f"Ada {pending['Transaksi'].sum()} penjualan (Rp {pending['Penjualan'].sum():,.0f}) yang belum dijurnal. Posting lewat tab **Tutup Harian** agar laporan lengkap.")
+
+        if report_type == "Laba Rugi":
+            st.markdown(f"### Laporan Laba Rugi ({periods[0][0]} - {periods[-1][0]})" if len(periods) > 1 else f"### Laporan Laba Rugi {periods[0][0]}")
+            statement = income_statement(balances, periods)
+        else:
+            st.markdown(f"### Laporan Neraca per akhir periode ({periods[0][0]} - {periods[-1][0]})" if len(periods) > 1 else f"### Laporan Neraca {periods[0][0]}")
+            statement, difference = balance_sheet(balances, periods)
+        st.dataframe(statement.style.format('Rp {:,.0f}', na_rep='').apply(
+            lambda row: ['font-weight: bold'] * len(row) if not row.name.startswith(' ') else [''] * len(row), axis=1), use_container_width=True)
+        if report_type == "Neraca":
+            unbalanced = difference[difference != 0]
+            if unbalanced.empty:
+                st.success("Neraca Seimbang!")
+            else:
+                st.error("Neraca Tidak Seimbang! Selisih: " + ", ".join(f"{label}: Rp {amount:,.0f}" for label, amount in unbalanced.items()))
+
+    elif tab == "Tutup Harian":
+        st.subheader("Tutup Harian: Jurnal Ringkasan Penjualan")
+        st.caption("Mode posting penjualan: " + ("**ringkasan harian** (ORCA_SALES_POSTING=harian)" if SALES_POSTING_MODE == 'harian' else "**per transaksi** (ubah dengan ORCA_SALES_POSTING=harian)"))
+        close_date = st.date_input("Posting penjualan s/d tanggal", date.today(), key="daily_close_date")
+        pending = get_pending_sales(close_date.isoformat())
+        if pending.empty:
+            st.info("Tidak ada penjualan yang menunggu posting.")
+        else:
+            st.dataframe(pending.style.format({'Penjualan': 'Rp {:,.0f}', 'HPP': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+            if st.button("📒 Posting Jurnal Ringkasan", key="post_daily_sales_btn", type="primary"):
+                success, message = post_daily_sales(close_date.isoformat())
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+        st.markdown("---")
+        st.subheader("Pemeriksaan Konsistensi Data")
+        st.caption("Memeriksa nilai uang (rupiah bulat), keseimbangan setiap jurnal, kecocokan total transaksi/pengeluaran dengan item dan jurnalnya, serta total berjalan shift kasir.")
+        if st.button("🔍 Periksa Konsistensi", key="money_consistency_btn"):
+            checks = check_money_consistency()
+            st.dataframe(checks, use_container_width=True, hide_index=True)
+            if checks['Jumlah'].sum() == 0:
+                st.success("Semua pemeriksaan lolos.")
+            else:
+                st.warning(f"{int((checks['Jumlah'] > 0).sum())} pemeriksaan menemukan data yang tidak konsisten.")
+
+    elif tab == "Rekonsiliasi Bank":
+        st.subheader("Rekonsiliasi Bank & Settlement QRIS")
+        st.caption("Unggah rekening koran atau laporan settlement QRIS/EDC. Baris dicocokkan dengan akun Bank menurut nilai bruto (Jumlah + Biaya) "
+                   "dan tanggal, termasuk settlement gabungan harian. Biaya/MDR mutasi yang cocok dijurnal ke Beban Administrasi Bank saat disimpan.")
+        col_template, col_window = st.columns(2)
+        col_template.download_button("📥 Unduh Template Mutasi", statement_template(), "template_mutasi_bank.csv", "text/csv", key="statement_template_btn")
+        window_days = col_window.number_input("Selisih hari maksimum (tanggal buku s/d tanggal mutasi)", min_value=0, max_value=14, value=3, key="reconcile_window")
+        uploaded = st.file_uploader("Unggah mutasi (CSV/XLSX)", type=["csv", "xlsx"], key="statement_upload")
+        if uploaded is None:
+            return
+        try:
+            statement, errors = read_statement(uploaded)
+        except Exception as e:
+            statement, errors = None, [f"Gagal membaca file: {e}"]
+        for error in errors[:20]:
+            st.error(error)
+        if len(errors) > 20:
+            st.error(f"... dan {len(errors) - 20} kesalahan lainnya.")
+        if statement is None or statement.empty:
+            return
+        start, end = statement['line_date'].min().date(), statement['line_date'].max().date()
+        book = get_unreconciled_bank_items((start - timedelta(days=int(window_days))).isoformat(), end.isoformat())
+        matches = match_statement(statement, book, int(window_days))
+        matched_lines = matches.drop_duplicates('line')
+        unmatched_statement = statement.drop(index=matched_lines['line'])
+        unmatched_book = book[~book['id'].isin(matches['journal_item_id']) & (book['entry_date'].str[:10] >= start.isoformat())]
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Mutasi", len(statement))
+        col2.metric("Cocok 1:1", int((matched_lines['match_type'] == '1:1').sum()))
+        col3.metric("Cocok Gabungan", int((matched_lines['match_type'] == 'Gabungan').sum()))
+        col4.metric("Belum Cocok", len(unmatched_statement))
+        st.markdown("#### Mutasi bank yang belum cocok")
+        if unmatched_statement.empty:
+            st.success("Semua mutasi cocok dengan buku.")
+        else:
+            st.dataframe(unmatched_statement.rename(columns={'line_date': 'Tanggal', 'description': 'Keterangan', 'ref': 'Referensi', 'amount': 'Jumlah', 'fee': 'Biaya', 'row': 'Baris File'})
+                         .style.format({'Tanggal': '{:%Y-%m-%d}', 'Jumlah': 'Rp {:,.0f}', 'Biaya': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+        st.markdown(f"#### Transaksi akun Bank {start:%d %b} - {end:%d %b %Y} yang belum ada di mutasi")
+        if unmatched_book.empty:
+            st.success("Semua transaksi akun Bank pada periode ini ada di mutasi.")
+        else:
+            st.dataframe(unmatched_book.rename(columns={'entry_date': 'Tanggal', 'amount': 'Jumlah', 'method': 'Metode', 'description': 'Keterangan'}).drop(columns='id')
+                         .style.format({'Jumlah': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+        if st.button("✅ Simpan Rekonsiliasi", key="save_reconciliation_btn", type="primary"):
+            success, message = save_reconciliation(statement, matches)
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
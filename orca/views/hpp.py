@@ -0,0 +1,29 @@
+"""Halaman Harga Pokok Penjualan (HPP)."""
+import streamlit as st
+import pandas as pd
+
+from orca.bom import get_standard_costs
+from orca.db import get_df
+
+
+def render():
+    st.header("💰 Harga Pokok Penjualan (HPP)")
+    prods_df = get_df("SELECT * FROM products")
+    if not prods_df.empty:
+        # HPP dari BOM rata (termasuk isi bahan setengah jadi), sekali hitung untuk semua produk
+        standard_costs = get_standard_costs()
+        hpp_data = []
+        for _, row in prods_df.iterrows():
+            hpp = standard_costs.get(row['id'], 0)
+            profit = row['price'] - hpp
+            hpp_data.append({"Nama Produk": row['name'], "Harga Jual": row['price'], "HPP (Modal)": hpp, "Profit Kotor": profit})
+        df_hpp = pd.DataFrame(hpp_data)
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(df_hpp.style.format({'Harga Jual': 'Rp {:,.0f}', 'HPP (Modal)': 'Rp {:,.2f}', 'Profit Kotor': 'Rp {:,.2f}'}), use_container_width=True, column_config={
+            "Nama Produk": st.column_config.Column(width="medium"),
+            "Harga Jual": st.column_config.Column(width="small"),
+            "HPP (Modal)": st.column_config.Column(width="small"),
+            "Profit Kotor": st.column_config.Column(width="small")
+        })
+    else:
+        st.info("Tidak ada produk untuk menghitung HPP. Silakan tambahkan produk terlebih dahulu.")
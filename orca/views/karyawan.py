@@ -0,0 +1,86 @@
+"""Halaman Manajemen Karyawan."""
+import streamlit as st
+import bcrypt
+from datetime import datetime, date
+
+from orca.config import OUTLET_ID
+from orca.db import run_query, get_df
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("👥 Manajemen Karyawan")
+    tab = lazy_tabs(["Daftar Karyawan", "➕ Tambah Karyawan", "✏️ Edit Karyawan", "🕒 Absensi Hari Ini"], key="karyawan_tab")
+    
+    if tab == "Daftar Karyawan":
+        st.subheader("Daftar Karyawan")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, name AS 'Nama', role AS 'Peran', wage_amount AS 'Jumlah Gaji', wage_period AS 'Periode Gaji', is_active AS 'Aktif' FROM employees").style.format({'Jumlah Gaji': 'Rp {:,.2f}'}), use_container_width=True, column_config={
+            "Nama": st.column_config.Column(width="medium"),
+            "Peran": st.column_config.Column(width="small"),
+            "Jumlah Gaji": st.column_config.Column(width="small"),
+            "Periode Gaji": st.column_config.Column(width="small"),
+            "Aktif": st.column_config.Column(width="small")
+        })
+    
+    elif tab == "➕ Tambah Karyawan":
+        st.subheader("Tambah Karyawan Baru")
+        with st.form("add_employee_form"):
+            name = st.text_input("Nama Karyawan").lower()
+            role = st.selectbox("Peran", ["Operator", "Admin"])
+            wage_period = st.selectbox("Periode Gaji", ["Per Jam", "Per Hari", "Per Bulan"])
+            wage_amount = st.number_input("Jumlah Gaji", value=0.0, format="%.2f", min_value=0.0)
+            password = st.text_input("Password", type="password")
+            is_active = st.checkbox("Aktif", value=True)
+            if st.form_submit_button("Tambah"):
+                if name and password:
+                    hashed_pw = bcrypt.hashpw(password.encode('utf8'), bcrypt.gensalt())
+                    run_query("INSERT INTO employees (name, wage_amount, wage_period, password, role, is_active) VALUES (?, ?, ?, ?, ?, ?)", (name, wage_amount, wage_period, hashed_pw, role, is_active)); st.success("Ditambahkan!"); st.rerun()
+                else: 
+                    st.error("Nama dan Password tidak boleh kosong.")
+    
+    elif tab == "✏️ Edit Karyawan":
+        st.subheader("Edit Karyawan")
+        search_term = st.text_input("Ketik nama karyawan untuk diedit", key="edit_emp_search", placeholder="Cari karyawan...")
+        if search_term:
+            emp_data = run_query("SELECT * FROM employees WHERE name LIKE ?", (f'%{search_term}%',), fetch='one')
+            if emp_data:
+                with st.form("edit_employee_form"):
+                    st.info(f"Mengedit data untuk: **{emp_data[1]}**")
+                    name = st.text_input("Nama", value=emp_data[1]).lower()
+                    role = st.selectbox("Peran", ["Operator", "Admin"], index=["Operator", "Admin"].index(emp_data[5]))
+                    wage_period = st.selectbox("Periode Gaji", ["Per Jam", "Per Hari", "Per Bulan"], index=["Per Jam", "Per Hari", "Per Bulan"].index(emp_data[3]))
+                    wage_amount = st.number_input("Jumlah Gaji", value=float(emp_data[2]), format="%.2f", min_value=0.0)
+                    password = st.text_input("Password Baru (kosongkan jika tidak diubah)", type="password")
+                    is_active = st.checkbox("Aktif", value=bool(emp_data[6]))
+                    if st.form_submit_button("Simpan"):
+                        if password:
+                            hashed_pw = bcrypt.hashpw(password.encode('utf8'), bcrypt.gensalt())
+                            run_query("UPDATE employees SET name=?, wage_amount=?, wage_period=?, role=?, is_active=?, password=? WHERE id=?", (name, wage_amount, wage_period, role, is_active, hashed_pw, emp_data[0]))
+                        else:
+                            run_query("UPDATE employees SET name=?, wage_amount=?, wage_period=?, role=?, is_active=? WHERE id=?", (name, wage_amount, wage_period, role, is_active, emp_data[0]))
+                        st.success("Diperbarui!"); st.rerun()
+            else:
+                st.warning("Karyawan tidak ditemukan.")
+        else:
+            st.info("Ketik nama karyawan di atas untuk mulai mengedit.")
+    
+    elif tab == "🕒 Absensi Hari Ini":
+        st.subheader("Absensi Karyawan Hari Ini")
+        employees_df = get_df("SELECT id, name FROM employees WHERE is_active = 1")
+        if not employees_df.empty:
+            employee_id = st.selectbox("Pilih Karyawan", employees_df['id'], format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0], key="attendance_emp_select")
+            today_str = date.today().isoformat()
+            attendance = run_query("SELECT * FROM attendance WHERE employee_id=? AND date(check_in)=?", (employee_id, today_str), fetch='one')
+            
+            if not attendance:
+                if st.button("Check In", use_container_width=True):
+                    run_query("INSERT INTO attendance (employee_id, check_in, outlet_id) VALUES (?, ?, ?)", (employee_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), OUTLET_ID)); st.success("Check in berhasil!"); st.rerun()
+            elif not attendance[3]: # Check-out is null
+                st.info(f"Sudah check in pada: **{attendance[2]}**")
+                if st.button("Check Out", use_container_width=True):
+                    run_query("UPDATE attendance SET check_out=? WHERE id=?", (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), attendance[0])); st.success("Check out berhasil!"); st.rerun()
+            else: 
+                st.success(f"Sudah check in ({attendance[2]}) dan check out ({attendance[3]}) hari ini.")
+        else: 
+            st.info("Tidak ada karyawan aktif untuk absensi.")
@@ -0,0 +1,191 @@
+"""Halaman Kasir (Point of Sale)."""
+import streamlit as st
+
+from orca.cart import Cart, get_cart, park_cart, list_parked_orders, resume_parked_order
+from orca.config import OUTLET_ID, TERMINAL_ID
+from orca.outlets import get_outlets
+from orca.sales import process_atomic_sale, void_transaction
+from orca.search import get_product_index
+from orca.shifts import get_open_shift
+from orca.variants import get_variant_catalog
+
+
+def park_current_cart():
+    """Callback: tahan keranjang aktif dan kosongkan keranjang + label meja."""
+    cart = get_cart(st.session_state)
+    if cart:
+        park_cart(cart, TERMINAL_ID, st.session_state.get('park_label') or None, st.session_state.user_id)
+    st.session_state.cart = Cart()
+    st.session_state.park_label = ""
+
+def switch_to_parked_order(order_id):
+    """Callback: tahan keranjang aktif (jika ada isinya) lalu lanjutkan pesanan yang dipilih."""
+    park_current_cart()
+    st.session_state.cart = resume_parked_order(order_id) or Cart()
+
+
+def choose_options(product_id):
+    """Callback: buka panel pilihan varian/tambahan untuk produk ini."""
+    st.session_state.option_product = product_id
+
+def add_with_options(product_id, name, price):
+    """Callback: tambahkan produk dengan varian/tambahan yang dipilih di panel opsi."""
+    catalog = get_variant_catalog()
+    option_ids = []
+    for i, (_, is_modifier, ids) in enumerate(catalog.groups.get(product_id, [])):
+        if is_modifier:
+            option_ids += [option_id for option_id in ids if st.session_state.get(f"opt_mod_{option_id}")]
+            for option_id in ids: # Tambahan tidak terbawa ke pesanan berikutnya
+                st.session_state[f"opt_mod_{option_id}"] = False
+        else:
+            option_ids.append(st.session_state[f"opt_{product_id}_{i}"])
+    label = catalog.label(option_ids)
+    get_cart(st.session_state).add(product_id, f"{name} ({label})" if label else name, price + catalog.price_delta(option_ids), option_ids=option_ids)
+    st.session_state.option_product = None
+    st.toast(f"'{name}' ditambahkan ke keranjang!")
+
+
+def render():
+    st.header("🌺 Kasir (Point of Sale)")
+    st.caption(f"Outlet: {get_outlets(active_only=False).get(OUTLET_ID, OUTLET_ID)}")
+    cart = get_cart(st.session_state)
+    
+    # Use columns for better layout
+    col1, col2 = st.columns([3, 2]) # Adjusted column ratio for more product space
+
+    with col1:
+        st.subheader("Katalog Produk")
+        search_term = st.text_input("Cari Nama Produk...", key="product_search", placeholder="Ketik nama produk atau kode (mis. kad)...")
+        
+        # Pencarian lewat indeks di memori (tanpa query LIKE per ketikan), hasil sudah terurut relevansi
+        product_index = get_product_index(active_only=True)
+        products = [product_index.rows[product_id] for product_id in product_index.search(search_term)]
+        catalog = get_variant_catalog()
+
+        # Panel pilihan varian/tambahan: hanya dirender untuk satu produk yang sedang dipilih
+        option_product = st.session_state.get('option_product')
+        if option_product in product_index.rows and catalog.has_options(option_product):
+            _, name, price = product_index.rows[option_product]
+            with st.container(border=True):
+                st.markdown(f"**{name}** · Rp {price:,.0f}")
+                for i, (group_name, is_modifier, ids) in enumerate(catalog.groups[option_product]):
+                    if is_modifier:
+                        st.caption(group_name)
+                        modifier_cols = st.columns(min(len(ids), 4))
+                        for j, option_id in enumerate(ids):
+                            _, _, option_name, price_delta, _ = catalog.options[option_id]
+                            with modifier_cols[j % len(modifier_cols)]:
+                                st.checkbox(f"{option_name} (+Rp {price_delta:,.0f})", key=f"opt_mod_{option_id}")
+                    else:
+                        st.radio(group_name, ids, key=f"opt_{option_product}_{i}", horizontal=True,
+                                 format_func=lambda option_id: f"{catalog.options[option_id][2]}" + (f" ({catalog.options[option_id][3]:+,.0f})" if catalog.options[option_id][3] else ""))
+                col_add, col_cancel = st.columns(2)
+                with col_add:
+                    st.button("Tambah ke Keranjang", key="opt_add_btn", on_click=add_with_options, args=(option_product, name, price), type="primary", use_container_width=True)
+                with col_cancel:
+                    st.button("Batal", key="opt_cancel_btn", on_click=choose_options, args=(None,), use_container_width=True)
+        
+        if products:
+            # Dynamic columns based on screen width or preference
+            num_cols = 4 
+            cols = st.columns(num_cols) 
+            for i, (product_id, name, price) in enumerate(products):
+                with cols[i % num_cols]:
+                    # Use a container for each product button for better visual separation
+                    with st.container(border=True):
+                        st.markdown(f"**{name}**")
+                        st.markdown(f"Rp {price:,.0f}")
+                        if catalog.has_options(product_id):
+                            st.button("Pilih Varian", key=f"prod_{product_id}", on_click=choose_options, args=(product_id,), use_container_width=True)
+                        elif st.button("Tambah", key=f"prod_{product_id}", use_container_width=True):
+                            cart.add(product_id, name, price)
+                            st.toast(f"'{name}' ditambahkan ke keranjang!"); st.rerun()
+        else: 
+            st.info("Produk tidak ditemukan.")
+
+    with col2:
+        st.subheader("Keranjang Belanja")
+        shift = get_open_shift()
+        if shift:
+            st.caption(f"Shift #{shift['id']} · {shift['employee_name'] or '-'} · dibuka {shift['opened_at']}")
+        else:
+            st.warning(f"Belum ada shift terbuka di {TERMINAL_ID}; penjualan tidak masuk laporan laci kas. Buka shift di menu 🧾 Shift Kasir.")
+        # --- Pesanan yang ditahan di terminal ini (open bill) ---
+        parked_orders = list_parked_orders(TERMINAL_ID)
+        if parked_orders:
+            st.caption(f"Pesanan ditahan di {TERMINAL_ID} (klik untuk melanjutkan; keranjang aktif akan ditahan otomatis):")
+            parked_cols = st.columns(min(len(parked_orders), 4))
+            for i, (order_id, label, order_total, created_at) in enumerate(parked_orders):
+                with parked_cols[i % len(parked_cols)]:
+                    st.button(f"{label or f'#{order_id}'} · Rp {order_total:,.0f}", key=f"resume_parked_{order_id}", on_click=switch_to_parked_order, args=(order_id,), use_container_width=True, help=f"Ditahan {created_at}")
+
+        if not cart: 
+            st.info("Keranjang masih kosong. Silakan pilih produk dari katalog.")
+        else:
+            total_price = cart.total
+            
+            # Display cart items in a more structured way
+            st.markdown("---")
+            st.markdown("**Daftar Item:**")
+            for line_key, _, _, name, price, qty in cart.items():
+                subtotal = price * qty
+                
+                # Memperbaiki lebar kolom agar tulisan tidak terpotong
+                cart_col1, cart_col2, cart_col3 = st.columns([4, 2, 1]) 
+                with cart_col1:
+                    st.write(f"**{name}** (x{qty})")
+                with cart_col2:
+                    st.write(f"Rp {subtotal:,.0f}")
+                with cart_col3:
+                    if st.button("Hapus", key=f"del_{line_key}", use_container_width=True):
+                        cart.remove(line_key)
+                        st.rerun()
+            st.markdown("---")
+            st.metric("Total Harga", f"Rp {total_price:,.0f}")
+
+            col_park_label, col_park_btn = st.columns([3, 2])
+            with col_park_label:
+                st.text_input("Nama/No. Meja", key="park_label", placeholder="Contoh: Meja 4", label_visibility="collapsed")
+            with col_park_btn:
+                st.button("⏸️ Tahan Pesanan", key="park_cart_btn", on_click=park_current_cart, use_container_width=True)
+
+            with st.expander("Proses Pembayaran", expanded=True):
+                payment_method = st.selectbox("Metode Pembayaran", ["Cash", "Qris", "Card"])
+                cash_received = 0
+                if payment_method == 'Cash':
+                    cash_received = st.number_input("Jumlah Uang Diterima (Rp)", min_value=0, step=1000, key="cash_input")
+                    if cash_received >= total_price:
+                        st.metric("Kembalian", f"Rp {cash_received - total_price:,.0f}")
+                    else: 
+                        st.warning("Uang diterima kurang dari total.")
+                
+                if st.button("✅ Proses Pembayaran", use_container_width=True, disabled=(payment_method == 'Cash' and cash_received < total_price)):
+                    success, message, transaction_id, change_amount = process_atomic_sale(st.session_state.cart, payment_method, st.session_state.user_id, cash_received)
+                    if success:
+                        st.success(f"{message} (ID: {transaction_id})")
+                        if payment_method == 'Cash': 
+                            st.info(f"Kembalian: Rp {change_amount:,.0f}")
+                        st.session_state.last_transaction_id = transaction_id; st.session_state.cart = Cart()
+                    else: 
+                        st.error(f"Gagal: {message}")
+                    st.rerun()
+
+        if 'last_transaction_id' in st.session_state and st.session_state.last_transaction_id:
+            st.markdown("---")
+            st.subheader("Opsi Transaksi Terakhir")
+            last_id = st.session_state.last_transaction_id
+            from orca.receipt import generate_receipt_pdf # FPDF hanya dimuat jika ada struk untuk dicetak
+            pdf_bytes = generate_receipt_pdf(last_id)
+            
+            col_receipt_btn1, col_receipt_btn2 = st.columns(2)
+            with col_receipt_btn1:
+                st.download_button(label="📄 Cetak Struk (PDF)", data=pdf_bytes, file_name=f"struk_{last_id}.pdf", mime="application/pdf", use_container_width=True)
+            with col_receipt_btn2:
+                if st.button("❌ Batalkan Pesanan", use_container_width=True, type="primary"):
+                    success, message = void_transaction(last_id, "Dibatalkan di kasir")
+                    if success: 
+                        st.success(message); del st.session_state['last_transaction_id']
+                    else: 
+                        st.error(message)
+                    st.rerun()
+            st.caption("Membatalkan pesanan mengembalikan stok bahan baku dan membalik jurnalnya; transaksi tetap tercatat dengan status dibatalkan.")
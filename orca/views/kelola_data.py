@@ -0,0 +1,157 @@
+"""Halaman Kelola & Hapus Data."""
+import streamlit as st
+
+from orca.db import run_query, get_df
+from orca.expenses import void_expense
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("🗑️ Kelola & Hapus Data")
+    st.warning("⚠️ **PERHATIAN:** Tindakan menghapus data di halaman ini bersifat permanen dan tidak dapat dibatalkan. Lakukan dengan sangat hati-hati.")
+    
+    tab = lazy_tabs(["Hapus Bahan", "Hapus Produk", "Hapus Pengeluaran", "Hapus Karyawan", "Hapus Absensi", "Hapus Akun", "Hapus Pelanggan", "Hapus Pemasok", "Hapus Aktiva Tetap"], key="kelola_data_tab")
+
+    if tab == "Hapus Bahan":
+        st.subheader("Hapus Bahan Baku")
+        all_ingredients = get_df("SELECT id, name FROM ingredients")
+        if not all_ingredients.empty:
+            options = all_ingredients['name'].tolist()
+            ing_to_delete = st.selectbox("Pilih bahan untuk dihapus", options, key="del_ing_select_main")
+            
+            if st.button(f"Hapus '{ing_to_delete}'", type="primary", key="del_ing_btn"):
+                ing_id_to_delete = all_ingredients[all_ingredients['name'] == ing_to_delete]['id'].iloc[0]
+                run_query("DELETE FROM ingredients WHERE id=?", (ing_id_to_delete,))
+                run_query("DELETE FROM stock_movements WHERE ingredient_id=?", (ing_id_to_delete,))
+                run_query("DELETE FROM inventory_lots WHERE ingredient_id=?", (ing_id_to_delete,))
+                run_query("DELETE FROM outlet_stock WHERE ingredient_id=?", (ing_id_to_delete,))
+                run_query("DELETE FROM option_recipe_deltas WHERE ingredient_id=?", (ing_id_to_delete,))
+                st.success(f"Bahan '{ing_to_delete}' telah dihapus."); st.rerun()
+        else: 
+            st.info("Tidak ada bahan untuk dihapus.")
+
+    elif tab == "Hapus Produk":
+        st.subheader("Hapus Produk")
+        products_df = get_df("SELECT id, name FROM products")
+        if not products_df.empty:
+            prod_to_delete = st.selectbox("Pilih produk untuk dihapus", products_df['name'].tolist(), key="del_prod_select_main")
+            if st.button(f"Hapus '{prod_to_delete}'", type="primary", key="del_prod_btn"):
+                prod_id_to_delete = products_df[products_df['name'] == prod_to_delete]['id'].iloc[0]
+                run_query("DELETE FROM products WHERE id=?", (prod_id_to_delete,))
+                run_query("DELETE FROM option_recipe_deltas WHERE option_id IN (SELECT id FROM product_options WHERE product_id=?)", (prod_id_to_delete,))
+                run_query("DELETE FROM product_options WHERE product_id=?", (prod_id_to_delete,))
+                st.success(f"Produk '{prod_to_delete}' telah dihapus."); st.rerun()
+        else: 
+            st.info("Tidak ada produk untuk dihapus.")
+
+    elif tab == "Hapus Pengeluaran":
+        st.subheader("Batalkan Pengeluaran")
+        expenses_df = get_df("SELECT id, description FROM expenses WHERE voided_at IS NULL")
+        if not expenses_df.empty:
+            exp_to_delete = st.selectbox("Pilih pengeluaran untuk dibatalkan", expenses_df['description'].tolist(), key="del_exp_select_main")
+            if st.button(f"Batalkan '{exp_to_delete}'", type="primary", key="del_exp_btn"):
+                exp_id_to_delete = int(expenses_df[expenses_df['description'] == exp_to_delete]['id'].iloc[0])
+                # Pengeluaran ditandai batal dan jurnalnya dibalik; tidak ada baris yang dihapus
+                success, message = void_expense(exp_id_to_delete)
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+            st.caption("Pengeluaran yang dibatalkan tetap tersimpan dan jurnalnya dibalik dengan jurnal pembalik.")
+        else: 
+            st.info("Tidak ada pengeluaran untuk dibatalkan.")
+
+    elif tab == "Hapus Karyawan":
+        st.subheader("Hapus Karyawan")
+        emp_df = get_df("SELECT id, name FROM employees")
+        if not emp_df.empty:
+            emp_to_delete = st.selectbox("Pilih karyawan untuk dihapus", emp_df['name'].tolist(), key="del_emp_select_main")
+            if st.button(f"Hapus '{emp_to_delete}'", type="primary", key="del_emp_btn"):
+                emp_id_to_delete = emp_df[emp_df['name'] == emp_to_delete]['id'].iloc[0]
+                run_query("DELETE FROM employees WHERE id=?", (emp_id_to_delete,)); 
+                st.success(f"Karyawan '{emp_to_delete}' dihapus.")
+                st.rerun()
+        else: 
+            st.info("Tidak ada karyawan untuk dihapus.")
+    
+    elif tab == "Hapus Absensi":
+        st.subheader("Hapus Data Absensi")
+        attendance_df = get_df("SELECT a.id, e.name, a.check_in FROM attendance a JOIN employees e ON a.employee_id = e.id ORDER BY a.check_in DESC")
+        if not attendance_df.empty:
+            attendance_options = {f"ID: {row['id']} - {row['name']} ({row['check_in']})": row['id'] for _, row in attendance_df.iterrows()}
+            selected_att_str = st.selectbox("Pilih absensi untuk dihapus", list(attendance_options.keys()), key="del_att_select_main")
+            if st.button("Hapus Absensi Ini", type="primary", key="del_att_btn"):
+                att_id = attendance_options[selected_att_str]
+                run_query("DELETE FROM attendance WHERE id=?", (att_id,)); 
+                st.success("Data absensi dihapus.")
+                st.rerun()
+        else: 
+            st.info("Tidak ada data absensi untuk dihapus.")
+
+    # NEW: Delete Account
+    elif tab == "Hapus Akun":
+        st.subheader("Hapus Akun")
+        accounts_df = get_df("SELECT id, account_code, account_name FROM accounts")
+        if not accounts_df.empty:
+            account_options = {f"{row['account_code']} - {row['account_name']}": row['id'] for _, row in accounts_df.iterrows()}
+            acc_to_delete_str = st.selectbox("Pilih akun untuk dihapus", list(account_options.keys()), key="del_acc_select_main")
+            if st.button(f"Hapus Akun '{acc_to_delete_str}'", type="primary", key="del_acc_btn"):
+                acc_id_to_delete = account_options[acc_to_delete_str]
+                # Check if account is used in journal_items
+                if run_query("SELECT COUNT(*) FROM journal_items WHERE account_id = ?", (acc_id_to_delete,), fetch='one')[0] > 0:
+                    st.error("Akun ini tidak bisa dihapus karena sudah digunakan dalam jurnal.")
+                else:
+                    run_query("DELETE FROM accounts WHERE id=?", (acc_id_to_delete,)); 
+                    st.success(f"Akun '{acc_to_delete_str}' dihapus.")
+                    st.rerun()
+        else: 
+            st.info("Tidak ada akun untuk dihapus.")
+
+    # NEW: Delete Customer
+    elif tab == "Hapus Pelanggan":
+        st.subheader("Hapus Pelanggan")
+        customers_df = get_df("SELECT id, name FROM customers")
+        if not customers_df.empty:
+            customer_options = {row['name']: row['id'] for _, row in customers_df.iterrows()}
+            cust_to_delete_name = st.selectbox("Pilih pelanggan untuk dihapus", list(customer_options.keys()), key="del_cust_select_main")
+            if st.button(f"Hapus Pelanggan '{cust_to_delete_name}'", type="primary", key="del_cust_btn"):
+                cust_id_to_delete = customer_options[cust_to_delete_name]
+                if run_query("SELECT COUNT(*) FROM open_items WHERE kind = 'Piutang' AND party_id = ?", (cust_id_to_delete,), fetch='one')[0] > 0:
+                    st.error("Pelanggan ini tidak bisa dihapus karena memiliki faktur piutang.")
+                else:
+                    run_query("DELETE FROM customers WHERE id=?", (cust_id_to_delete,)); 
+                    st.success(f"Pelanggan '{cust_to_delete_name}' dihapus.")
+                    st.rerun()
+        else: 
+            st.info("Tidak ada pelanggan untuk dihapus.")
+
+    # NEW: Delete Supplier
+    elif tab == "Hapus Pemasok":
+        st.subheader("Hapus Pemasok")
+        suppliers_df = get_df("SELECT id, name FROM suppliers")
+        if not suppliers_df.empty:
+            supplier_options = {row['name']: row['id'] for _, row in suppliers_df.iterrows()}
+            supp_to_delete_name = st.selectbox("Pilih pemasok untuk dihapus", list(supplier_options.keys()), key="del_supp_select_main")
+            if st.button(f"Hapus Pemasok '{supp_to_delete_name}'", type="primary", key="del_supp_btn"):
+                supp_id_to_delete = supplier_options[supp_to_delete_name]
+                if run_query("SELECT COUNT(*) FROM open_items WHERE kind = 'Utang' AND party_id = ?", (supp_id_to_delete,), fetch='one')[0] > 0:
+                    st.error("Pemasok ini tidak bisa dihapus karena memiliki tagihan utang.")
+                else:
+                    run_query("DELETE FROM suppliers WHERE id=?", (supp_id_to_delete,)); 
+                    st.success(f"Pemasok '{supp_to_delete_name}' dihapus.")
+                    st.rerun()
+        else: 
+            st.info("Tidak ada pemasok untuk dihapus.")
+
+    # NEW: Delete Fixed Asset
+    elif tab == "Hapus Aktiva Tetap":
+        st.subheader("Hapus Aktiva Tetap")
+        assets_df = get_df("SELECT id, asset_name FROM fixed_assets")
+        if not assets_df.empty:
+            asset_options = {row['asset_name']: row['id'] for _, row in assets_df.iterrows()}
+            asset_to_delete_name = st.selectbox("Pilih aktiva untuk dihapus", list(asset_options.keys()), key="del_asset_select_main")
+            if st.button(f"Hapus Aktiva '{asset_to_delete_name}'", type="primary", key="del_asset_btn"):
+                asset_id_to_delete = asset_options[asset_to_delete_name]
+                run_query("DELETE FROM fixed_assets WHERE id=?", (asset_id_to_delete,))
+                run_query("DELETE FROM depreciation_postings WHERE asset_id=?", (asset_id_to_delete,))
+                st.success(f"Aktiva '{asset_to_delete_name}' dihapus.")
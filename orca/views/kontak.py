@@ -0,0 +1,102 @@
+"""Halaman Manajemen Pelanggan & Pemasok."""
+import streamlit as st
+
+from orca.db import run_query, get_df
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("👤 Manajemen Pelanggan & Pemasok")
+    tab = lazy_tabs(["Pelanggan", "Pemasok"], key="kontak_tab")
+
+    if tab == "Pelanggan":
+        st.subheader("Daftar Pelanggan")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, name AS 'Nama', address AS 'Alamat', phone AS 'Telepon', email AS 'Email' FROM customers"), use_container_width=True, column_config={
+            "Nama": st.column_config.Column(width="medium"),
+            "Alamat": st.column_config.Column(width="medium"),
+            "Telepon": st.column_config.Column(width="small"),
+            "Email": st.column_config.Column(width="medium")
+        })
+        st.markdown("---")
+        st.subheader("Tambah/Edit Pelanggan")
+        customers_df = get_df("SELECT id, name FROM customers")
+        customer_options = {row['name']: row['id'] for _, row in customers_df.iterrows()}
+        
+        edit_cust_mode = st.checkbox("Mode Edit Pelanggan yang Ada?", key="edit_cust_mode_checkbox")
+        selected_cust_id = None
+        if edit_cust_mode and not customers_df.empty:
+            selected_cust_name = st.selectbox("Pilih Pelanggan untuk Diedit", list(customer_options.keys()), key="select_cust_to_edit")
+            selected_cust_id = customer_options[selected_cust_name]
+            cust_data = run_query("SELECT * FROM customers WHERE id = ?", (selected_cust_id,), fetch='one')
+            
+            with st.form("edit_customer_form"):
+                st.info(f"Mengedit pelanggan: **{cust_data[1]}**")
+                new_cust_name = st.text_input("Nama Pelanggan", value=cust_data[1], key="edit_cust_name")
+                new_cust_address = st.text_area("Alamat", value=cust_data[2], key="edit_cust_address")
+                new_cust_phone = st.text_input("Telepon", value=cust_data[3], key="edit_cust_phone")
+                new_cust_email = st.text_input("Email", value=cust_data[4], key="edit_cust_email")
+                if st.form_submit_button("Simpan Perubahan Pelanggan"):
+                    if new_cust_name:
+                        run_query("UPDATE customers SET name=?, address=?, phone=?, email=? WHERE id=?", (new_cust_name, new_cust_address, new_cust_phone, new_cust_email, selected_cust_id))
+                        st.success("Pelanggan berhasil diperbarui!"); st.rerun()
+                    else:
+                        st.error("Nama Pelanggan tidak boleh kosong.")
+        else:
+            with st.form("add_customer_form"):
+                new_cust_name = st.text_input("Nama Pelanggan Baru", placeholder="Contoh: Budi Santoso", key="add_cust_name")
+                new_cust_address = st.text_area("Alamat", key="add_cust_address")
+                new_cust_phone = st.text_input("Telepon", placeholder="Contoh: 081234567890", key="add_cust_phone")
+                new_cust_email = st.text_input("Email", placeholder="Contoh: budi@example.com", key="add_cust_email")
+                if st.form_submit_button("Tambah Pelanggan Baru"):
+                    if new_cust_name:
+                        run_query("INSERT INTO customers (name, address, phone, email) VALUES (?, ?, ?, ?)", (new_cust_name, new_cust_address, new_cust_phone, new_cust_email))
+                        st.success("Pelanggan baru berhasil ditambahkan!"); st.rerun()
+                    else:
+                        st.error("Nama Pelanggan tidak boleh kosong.")
+
+    elif tab == "Pemasok":
+        st.subheader("Daftar Pemasok")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, name AS 'Nama', address AS 'Alamat', phone AS 'Telepon', email AS 'Email' FROM suppliers"), use_container_width=True, column_config={
+            "Nama": st.column_config.Column(width="medium"),
+            "Alamat": st.column_config.Column(width="medium"),
+            "Telepon": st.column_config.Column(width="small"),
+            "Email": st.column_config.Column(width="medium")
+        })
+        st.markdown("---")
+        st.subheader("Tambah/Edit Pemasok")
+        suppliers_df = get_df("SELECT id, name FROM suppliers")
+        supplier_options = {row['name']: row['id'] for _, row in suppliers_df.iterrows()}
+        
+        edit_supp_mode = st.checkbox("Mode Edit Pemasok yang Ada?", key="edit_supp_mode_checkbox")
+        selected_supp_id = None
+        if edit_supp_mode and not suppliers_df.empty:
+            selected_supp_name = st.selectbox("Pilih Pemasok untuk Diedit", list(supplier_options.keys()), key="select_supp_to_edit")
+            selected_supp_id = supplier_options[selected_supp_name]
+            supp_data = run_query("SELECT * FROM suppliers WHERE id = ?", (selected_supp_id,), fetch='one')
+            
+            with st.form("edit_supplier_form"):
+                st.info(f"Mengedit pemasok: **{supp_data[1]}**")
+                new_supp_name = st.text_input("Nama Pemasok", value=supp_data[1], key="edit_supp_name")
+                new_supp_address = st.text_area("Alamat", value=supp_data[2], key="edit_supp_address")
+                new_supp_phone = st.text_input("Telepon", value=supp_data[3], key="edit_supp_phone")
+                new_supp_email = st.text_input("Email", value=supp_data[4], key="edit_supp_email")
+                if st.form_submit_button("Simpan Perubahan Pemasok"):
+                    if new_supp_name:
+                        run_query("UPDATE suppliers SET name=?, address=?, phone=?, email=? WHERE id=?", (new_supp_name, new_supp_address, new_supp_phone, new_supp_email, selected_supp_id))
+                        st.success("Pemasok berhasil diperbarui!"); st.rerun()
+                    else:
+                        st.error("Nama Pemasok tidak boleh kosong.")
+        else:
+            with st.form("add_supplier_form"):
+                new_supp_name = st.text_input("Nama Pemasok Baru", placeholder="Contoh: PT. Kopi Jaya", key="add_supp_name")
+                new_supp_address = st.text_area("Alamat", key="add_supp_address")
+                new_supp_phone = st.text_input("Telepon", placeholder="Contoh: 021-12345678", key="add_supp_phone")
+                new_supp_email = st.text_input("Email", placeholder="Contoh: info@kopijaya.com", key="add_supp_email")
+                if st.form_submit_button("Tambah Pemasok Baru"):
+                    if new_supp_name:
+                        run_query("INSERT INTO suppliers (name, address, phone, email) VALUES (?, ?, ?, ?)", (new_supp_name, new_supp_address, new_supp_phone, new_supp_email))
+                        st.success("Pemasok baru berhasil ditambahkan!"); st.rerun()
+                    else:
+                        st.error("Nama Pemasok tidak boleh kosong.")
@@ -0,0 +1,211 @@
+"""Halaman Laporan & Analisa Bisnis."""
+import streamlit as st
+import pandas as pd
+import urllib.parse
+import random
+from datetime import datetime, date
+import plotly.graph_objects as go
+
+from orca.db import get_df
+from orca.outlets import get_outlets, map_outlets
+
+
+def load_outlet_period(outlet_id, start, end):
+    """Data parsial satu outlet untuk rentang [start, end] (teks 'YYYY-MM-DD HH:MM:SS').
+
+    Setiap query difilter outlet_id lebih dulu sehingga memakai indeks yang diawali outlet_id. Penjualan
+    diringkas per hari di SQL (bukan baris mentah), sehingga query antar outlet benar-benar berjalan paralel.
+    """
+    period = (outlet_id, start, end)
+    return {
+        'daily': get_df("""SELECT date(transaction_date) AS day, SUM(total_amount) AS total_amount, COUNT(*) AS transactions
+            FROM transactions WHERE outlet_id = ? AND transaction_date BETWEEN ? AND ? AND voided_at IS NULL GROUP BY day""", period),
+        'expenses': get_df("SELECT * FROM expenses WHERE outlet_id = ? AND date BETWEEN ? AND ? AND voided_at IS NULL", (outlet_id, start[:10], end[:10])),
+        'attendance': get_df("SELECT * FROM attendance WHERE outlet_id = ? AND check_in BETWEEN ? AND ?", period),
+        'product_qty': get_df("""SELECT ti.product_id, SUM(ti.quantity) AS quantity FROM transactions t
+            JOIN transaction_items ti ON ti.transaction_id = t.id
+            WHERE t.outlet_id = ? AND t.transaction_date BETWEEN ? AND ? AND t.voided_at IS NULL GROUP BY ti.product_id""", period),
+        'modal': get_df("""SELECT IFNULL(SUM(ti.quantity * r.qty_per_unit * i.cost_per_unit), 0) AS modal FROM transactions t
+            JOIN transaction_items ti ON ti.transaction_id = t.id
+            JOIN recipes r ON ti.product_id = r.product_id JOIN ingredients i ON r.ingredient_id = i.id
+            WHERE t.outlet_id = ? AND t.transaction_date BETWEEN ? AND ? AND t.voided_at IS NULL""", period)['modal'].iloc[0],
+    }
+
+
+def render():
+    st.header("📈 Laporan & Analisa Bisnis")
+    
+    col_date1, col_date2 = st.columns(2)
+    with col_date1:
+        start_date = st.date_input("Tanggal Mulai", date.today().replace(day=1))
+    with col_date2:
+        end_date = st.date_input("Tanggal Akhir", date.today())
+    outlets = get_outlets(active_only=False)
+    outlet_choice = st.selectbox("Outlet", ["Semua Outlet (Konsolidasi)", *outlets.values()], key="laporan_outlet") if len(outlets) > 1 else None
+    outlet_ids = [outlet_id for outlet_id, name in outlets.items() if outlet_choice in (None, "Semua Outlet (Konsolidasi)", name)]
+    
+    start_datetime, end_datetime = datetime.combine(start_date, datetime.min.time()), datetime.combine(end_date, datetime.max.time())
+    
+    st.subheader("Ringkasan Kinerja Bisnis")
+    
+    # Parsial per outlet dihitung paralel lalu digabung (konsolidasi)
+    partials = map_outlets(load_outlet_period, outlet_ids, start_datetime.strftime("%Y-%m-%d %H:%M:%S"), end_datetime.strftime("%Y-%m-%d %H:%M:%S"))
+    daily_df = pd.concat([part['daily'] for part in partials.values()], ignore_index=True)
+    expenses_df = pd.concat([part['expenses'] for part in partials.values()], ignore_index=True)
+    product_qty_df = pd.concat([part['product_qty'] for part in partials.values()], ignore_index=True).groupby('product_id', as_index=False)['quantity'].sum()
+    
+    salary_details = []
+    total_gaji = 0
+    employees_df = get_df("SELECT id, name, wage_amount, wage_period FROM employees WHERE is_active = 1")
+    attendance_df = pd.concat([part['attendance'] for part in partials.values()], ignore_index=True)
+    
+    if not attendance_df.empty:
+        attendance_df['check_in'] = pd.to_datetime(attendance_df['check_in'])
+        attendance_df['check_out'] = pd.to_datetime(attendance_df['check_out'])
+        for _, emp in employees_df.iterrows():
+            emp_attendance = attendance_df[attendance_df['employee_id'] == emp['id']].copy()
+            if not emp_attendance.empty:
+                emp_salary = 0
+                if emp['wage_period'] == 'Per Jam':
+                    emp_attendance['duration'] = (emp_attendance['check_out'] - emp_attendance['check_in']).dt.total_seconds() / 3600
+                    total_hours = emp_attendance['duration'].sum()
+                    emp_salary = total_hours * emp['wage_amount']
+                    salary_details.append({'Karyawan': emp['name'], 'Detail': f'{total_hours:.2f} jam kerja', 'Total Gaji': emp_salary})
+                elif emp['wage_period'] == 'Per Hari':
+                    work_days = emp_attendance['check_in'].dt.date.nunique()
+                    emp_salary = work_days * emp['wage_amount']
+                    salary_details.append({'Karyawan': emp['name'], 'Detail': f'{work_days} hari kerja', 'Total Gaji': emp_salary})
+                elif emp['wage_period'] == 'Per Bulan':
+                    days_in_range = (end_date - start_date).days + 1
+                    emp_salary = (emp['wage_amount'] / 30) * days_in_range
+                    salary_details.append({'Karyawan': emp['name'], 'Detail': f'{days_in_range} hari dalam rentang', 'Total Gaji': emp_salary})
+                total_gaji += emp_salary
+    salary_df = pd.DataFrame(salary_details)
+
+    total_pendapatan = daily_df['total_amount'].sum()
+    total_modal = sum(part['modal'] for part in partials.values())
+    
+    op_expenses_df = expenses_df[expenses_df['category'] == 'Operasional']
+    other_expenses_df = expenses_df[expenses_df['category'] == 'Lainnya']
+    total_biaya_operasional = op_expenses_df['amount'].sum()
+    total_pengeluaran_lainnya = other_expenses_df['amount'].sum()
+
+    laba_kotor = total_pendapatan - total_modal
+    laba_bersih = laba_kotor - total_biaya_operasional - total_pengeluaran_lainnya - total_gaji
+    margin_laba_kotor = (laba_kotor / total_pendapatan * 100) if total_pendapatan > 0 else 0
+    margin_laba_bersih = (laba_bersih / total_pendapatan * 100) if total_pendapatan > 0 else 0
+    
+    kpi_cols = st.columns(5)
+    kpi_cols[0].metric("Total Pendapatan", f"Rp {total_pendapatan:,.0f}")
+    kpi_cols[1].metric("Total Modal (HPP)", f"Rp {total_modal:,.0f}")
+    kpi_cols[2].metric("Total Gaji Karyawan", f"Rp {total_gaji:,.0f}")
+    kpi_cols[3].metric("Biaya Operasional", f"Rp {total_biaya_operasional:,.0f}")
+    kpi_cols[4].metric("Pengeluaran Lain", f"Rp {total_pengeluaran_lainnya:,.0f}")
+    
+    st.markdown("---")
+    st.metric("Laba Bersih", f"Rp {laba_bersih:,.0f}", delta=f"{margin_laba_bersih:.1f}% Margin")
+
+    if len(partials) > 1:
+        st.markdown("#### Rincian per Outlet")
+        st.dataframe(pd.DataFrame([{
+            'Outlet': outlets[outlet_id],
+            'Transaksi': part['daily']['transactions'].sum(),
+            'Pendapatan': part['daily']['total_amount'].sum(),
+            'Modal (HPP)': part['modal'],
+            'Biaya Operasional': part['expenses'].loc[part['expenses']['category'] == 'Operasional', 'amount'].sum(),
+            'Pengeluaran Lain': part['expenses'].loc[part['expenses']['category'] == 'Lainnya', 'amount'].sum(),
+        } for outlet_id, part in partials.items()]).style.format({col: 'Rp {:,.0f}' for col in ['Pendapatan', 'Modal (HPP)', 'Biaya Operasional', 'Pengeluaran Lain']}), hide_index=True, use_container_width=True)
+
+    if total_modal > 0 or total_biaya_operasional > 0 or total_pengeluaran_lainnya > 0 or total_gaji > 0:
+        st.markdown("#### Komposisi Biaya")
+        fig_pie = go.Figure(data=[go.Pie(labels=['Modal (HPP)', 'Gaji Karyawan', 'Biaya Operasional', 'Pengeluaran Lain'], values=[total_modal, total_gaji, total_biaya_operasional, total_pengeluaran_lainnya], hole=.3)])
+        fig_pie.update_layout(title_text='Distribusi Biaya', title_x=0.5) # Center title
+        st.plotly_chart(fig_pie, use_container_width=True)
+
+    st.markdown("---")
+    st.subheader("💡 Analisa & Saran Manajemen")
+    
+    # Initialize laris_df to prevent UnboundLocalError
+    laris_df = pd.DataFrame(columns=['Produk', 'Jumlah Terjual'])
+    
+    col_an1, col_an2 = st.columns(2)
+    with col_an1:
+        if not daily_df.empty:
+            st.markdown("#### Kinerja Produk Terlaris")
+            product_names = get_df("SELECT id, name FROM products")
+            laris_df = product_qty_df.merge(product_names, left_on='product_id', right_on='id').groupby('name', as_index=False)['quantity'].sum() \
+                .sort_values('quantity', ascending=False).head(5).rename(columns={'name': 'Produk', 'quantity': 'Jumlah Terjual'})
+            st.dataframe(laris_df, hide_index=True, use_container_width=True)
+
+            st.markdown("#### Produk Paling Menguntungkan")
+            hpp_df = get_df("SELECT p.id, p.name, p.price, IFNULL(SUM(r.qty_per_unit * i.cost_per_unit), 0) as hpp FROM products p LEFT JOIN recipes r ON p.id = r.product_id LEFT JOIN ingredients i ON r.ingredient_id = i.id GROUP BY p.id")
+            merged_df = pd.merge(product_qty_df, hpp_df, left_on='product_id', right_on='id')
+            merged_df['profit'] = (merged_df['price'] - merged_df['hpp']) * merged_df['quantity']
+            profit_summary = merged_df.groupby('name')['profit'].sum().reset_index().sort_values(by='profit', ascending=False).head(5)
+            st.dataframe(profit_summary.style.format({'profit': 'Rp {:,.0f}'}), hide_index=True, use_container_width=True)
+
+            st.markdown("#### Tren Pendapatan Harian")
+            daily_df['day'] = pd.to_datetime(daily_df['day'])
+            daily_revenue = daily_df.groupby('day')['total_amount'].sum().resample('D').sum().reset_index()
+            fig_trend = go.Figure(data=go.Scatter(x=daily_revenue['day'], y=daily_revenue['total_amount'], mode='lines+markers'))
+            fig_trend.update_layout(title_text='Tren Pendapatan Harian', xaxis_title='Tanggal', yaxis_title='Pendapatan (Rp)', title_x=0.5)
+            st.plotly_chart(fig_trend, use_container_width=True)
+        else:
+            st.info("Belum ada data penjualan pada rentang tanggal ini.")
+    
+    with col_an2:
+        st.markdown("#### Saran Santai untuk Bisnis Anda")
+        saran = []
+        total_biaya = total_modal + total_gaji + total_biaya_operasional + total_pengeluaran_lainnya
+        
+        # Inisialisasi variabel untuk menghindari UnboundLocalError
+        produk_laris = ""
+        produk_untung = ""
+        
+        if total_pendapatan > 0:
+            if laba_bersih < 0:
+                saran.append(" Waduh, profitnya lagi merah nih. Coba cek lagi harga modal (HPP) atau biaya operasional, mungkin ada yang bisa ditekan. Naikin harga dikit buat produk best seller juga boleh dicoba, lho.")
+            if total_biaya > 0 and (total_gaji / total_biaya) > 0.5:
+                saran.append(" Gaji karyawan porsinya gede banget, nih. Mungkin bisa dicek lagi jadwalnya, biar jam kerja lebih efisien dan nggak banyak lemburan yang nggak perlu.")
+            
+            # Periksa apakah laris_df dan profit_summary ada dan tidak kosong
+            if 'laris_df' in locals() and not laris_df.empty and 'profit_summary' in locals() and not profit_summary.empty:
+                produk_laris = laris_df['Produk'].iloc[0]
+                produk_untung = profit_summary['name'].iloc[0]
+                if produk_laris != produk_untung:
+                    saran.append(f" Eh, tau gak? '{produk_laris}' paling laku, tapi '{produk_untung}' paling untung. Gimana kalau kasir diajarin buat nawarin '{produk_untung}' tiap ada yang beli '{produk_laris}'? Cuan dobel!")
+        
+        if 'laris_df' in locals() and not laris_df.empty:
+            saran.append(f" Mantap! '{laris_df['Produk'].iloc[0]}' lagi naik daun. Stoknya jangan sampai kosong, ya. Mungkin bisa dibikinin varian baru biar makin hits?")
+        
+        if total_biaya > 0 and (total_biaya_operasional / total_biaya) > 0.4:
+            saran.append(" Biaya operasional kayaknya agak boros. Coba deh ngobrol lagi sama supplier, siapa tau bisa dapet harga lebih miring. Cek juga tagihan listrik sama air, kali aja ada yang bocor.")
+        
+        if len(saran) < 3:
+            saran.extend([
+                " Coba deh, luangin waktu tiap minggu buat liat laporan ini. Biar makin jago baca situasi dan ambil keputusan.",
+                " Produk yang lagi laris itu 'harta karun'. Sering-sering pamerin di sosmed biar makin banyak yang penasaran!",
+                " Penasaran pelanggan maunya apa? Coba deh taruh kotak saran atau bikin polling di Instagram. Siapa tau ada masukan emas!"
+            ])
+
+        random.shuffle(saran)
+        for i in range(min(3, len(saran))):
+            st.info(saran[i])
+
+        summary_text = f"Laporan Orca Cafe ({start_date.strftime('%d %b')} - {end_date.strftime('%d %b')})\n- Pendapatan: Rp {total_pendapatan:,.0f}\n- Modal (HPP): Rp {total_modal:,.0f}\n- Gaji: Rp {total_gaji:,.0f}\n- Laba Bersih: Rp {laba_bersih:,.0f}"
+        st.link_button("Kirim Ringkasan via WhatsApp", f"https://api.whatsapp.com/send?text={urllib.parse.quote(summary_text)}")
+
+    st.markdown("---")
+    st.subheader("🗃️ Detail Data")
+    if not daily_df.empty:
+        with st.expander("Detail Data Transaksi (Data Mentah)"):
+            # Baris mentah hanya dimuat jika diminta
+            if st.toggle("Tampilkan data mentah", key="laporan_raw_transactions"):
+                st.dataframe(get_df(f"SELECT * FROM transactions WHERE outlet_id IN ({', '.join('?' * len(outlet_ids))}) AND transaction_date BETWEEN ? AND ? AND voided_at IS NULL ORDER BY transaction_date",
+                                    (*outlet_ids, start_datetime.strftime("%Y-%m-%d %H:%M:%S"), end_datetime.strftime("%Y-%m-%d %H:%M:%S"))), use_container_width=True)
+    if not salary_df.empty:
+        with st.expander("Detail Gaji Karyawan"): st.dataframe(salary_df.style.format({'Total Gaji': 'Rp {:,.2f}'}), use_container_width=True)
+    if not op_expenses_df.empty:
+        with st.expander("Detail Biaya Operasional"): st.dataframe(op_expenses_df, use_container_width=True)
+    if not other_expenses_df.empty:
+        with st.expander("Detail Pengeluaran Lainnya"): st.dataframe(other_expenses_df, use_container_width=True)
@@ -0,0 +1,59 @@
+"""Halaman Manajemen Outlet (cabang)."""
+import pandas as pd
+import streamlit as st
+
+from orca.config import OUTLET_ID
+from orca.db import get_df
+from orca.outlets import get_outlets, add_outlet, transfer_stock
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("🏪 Manajemen Outlet")
+    st.caption(f"Terminal ini tercatat di outlet #{OUTLET_ID} (atur lewat variabel lingkungan ORCA_OUTLET).")
+    tab = lazy_tabs(["Daftar Outlet", "➕ Tambah Outlet", "🔁 Transfer Stok"], key="outlet_tab")
+
+    if tab == "Daftar Outlet":
+        st.subheader("Daftar Outlet")
+        st.dataframe(get_df("""
+            SELECT o.id, o.name AS 'Nama Outlet', o.address AS 'Alamat',
+                (SELECT COUNT(*) FROM outlet_stock s WHERE s.outlet_id = o.id AND s.stock > 0) AS 'Bahan Tersedia',
+                (SELECT IFNULL(SUM(s.stock * i.cost_per_unit), 0) FROM outlet_stock s JOIN ingredients i ON i.id = s.ingredient_id WHERE s.outlet_id = o.id) AS 'Nilai Stok'
+            FROM outlets o ORDER BY o.id
+        """).style.format({'Nilai Stok': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+
+    elif tab == "➕ Tambah Outlet":
+        st.subheader("Tambah Outlet Baru")
+        with st.form("add_outlet_form"):
+            name = st.text_input("Nama Outlet", placeholder="Contoh: Orca Cafe Cabang 2")
+            address = st.text_input("Alamat")
+            if st.form_submit_button("Tambah Outlet"):
+                success, message = add_outlet(name.strip(), address.strip() or None)
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+    elif tab == "🔁 Transfer Stok":
+        st.subheader("Transfer Stok antar Outlet")
+        outlets = get_outlets()
+        if len(outlets) < 2:
+            st.info("Transfer stok membutuhkan minimal dua outlet aktif.")
+            return
+        col1, col2 = st.columns(2)
+        from_outlet = col1.selectbox("Dari Outlet", list(outlets), format_func=outlets.get, key="transfer_from")
+        to_outlet = col2.selectbox("Ke Outlet", [outlet_id for outlet_id in outlets if outlet_id != from_outlet], format_func=outlets.get, key="transfer_to")
+        stock_df = get_df("""SELECT i.id, i.name AS 'Nama Bahan', i.unit AS 'Satuan', s.stock AS 'Stok Asal'
+            FROM outlet_stock s JOIN ingredients i ON i.id = s.ingredient_id WHERE s.outlet_id = ? AND s.stock > 0 ORDER BY i.name""", (from_outlet,))
+        if stock_df.empty:
+            st.info("Outlet asal tidak memiliki stok bahan.")
+            return
+        stock_df['Jumlah Transfer'] = 0.0
+        edited = st.data_editor(stock_df, column_config={'id': None}, disabled=['Nama Bahan', 'Satuan', 'Stok Asal'], hide_index=True, use_container_width=True, key="transfer_editor")
+        lines = [(int(ingredient_id), float(qty)) for ingredient_id, qty in zip(edited['id'], pd.to_numeric(edited['Jumlah Transfer']).fillna(0)) if qty > 0]
+        if st.button("🔁 Transfer", key="transfer_btn", type="primary", disabled=not lines):
+            success, message = transfer_stock(lines, from_outlet, to_outlet)
+            if success:
+                st.success(message); st.rerun()
+            else:
+                st.error(message)
@@ -0,0 +1,146 @@
+"""Halaman Pembelian: purchase order dan penerimaan barang dari pemasok."""
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+
+from orca.config import PAYMENT_TERM_DAYS
+from orca.db import get_df
+from orca.purchasing import create_purchase_order, cancel_purchase_order, receive_goods
+from orca.ui import lazy_tabs
+
+
+def _line_editor(ingredient_names, key, lines_df=None):
+    """Tabel isian baris (Bahan, Jumlah, Harga Satuan); mengembalikan DataFrame hasil edit."""
+    if lines_df is None:
+        lines_df = pd.DataFrame({'Bahan': pd.Series(dtype='object'), 'Jumlah': pd.Series(dtype='float'), 'Harga Satuan': pd.Series(dtype='float')})
+    return st.data_editor(lines_df, key=key, num_rows="dynamic", use_container_width=True, hide_index=True, column_config={
+        "Bahan": st.column_config.SelectboxColumn("Bahan", options=list(ingredient_names), required=True, width="large"),
+        "Jumlah": st.column_config.NumberColumn("Jumlah", min_value=0.0, format="%.2f"),
+        "Harga Satuan": st.column_config.NumberColumn("Harga Satuan (Rp)", min_value=0.0, format="%.2f"),
+    })
+
+def _editor_lines(edited_df, ingredient_names):
+    """Baris editor -> [(ingredient_id, qty, unit_cost), ...] (baris kosong diabaikan)."""
+    edited_df = edited_df.dropna(subset=['Bahan', 'Jumlah'])
+    return [(ingredient_names[name], float(qty), float(cost) if pd.notna(cost) else 0.0)
+            for name, qty, cost in zip(edited_df['Bahan'], edited_df['Jumlah'], edited_df['Harga Satuan'])]
+
+
+def render():
+    st.header("🚚 Pembelian Bahan")
+    tab = lazy_tabs(["📋 Daftar PO", "➕ Buat PO", "📥 Terima Barang", "🧾 Riwayat Penerimaan"], key="pembelian_tab")
+
+    suppliers_df = get_df("SELECT id, name FROM suppliers ORDER BY name")
+    supplier_names = dict(zip(suppliers_df['name'], suppliers_df['id']))
+    ingredients_df = get_df("SELECT id, name, unit FROM ingredients ORDER BY name")
+    ingredient_names = dict(zip(ingredients_df['name'], ingredients_df['id']))
+
+    if tab == "📋 Daftar PO":
+        st.subheader("Daftar Purchase Order")
+        po_df = get_df("""
+            SELECT po.id AS 'No. PO', po.order_date AS 'Tanggal', s.name AS 'Pemasok', po.status AS 'Status',
+                COUNT(poi.id) AS 'Jumlah Bahan', SUM(poi.qty_ordered * poi.unit_cost) AS 'Nilai PO'
+            FROM purchase_orders po
+            LEFT JOIN suppliers s ON s.id = po.supplier_id
+            LEFT JOIN purchase_order_items poi ON poi.po_id = po.id
+            GROUP BY po.id ORDER BY po.id DESC
+        """)
+        if po_df.empty:
+            st.info("Belum ada purchase order.")
+        else:
+            st.dataframe(po_df.style.format({'Nilai PO': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+            selected_po = st.selectbox("Lihat detail PO", po_df['No. PO'].tolist(), key="po_detail_select")
+            st.dataframe(get_df("""
+                SELECT i.name AS 'Bahan', i.unit AS 'Unit', poi.qty_ordered AS 'Dipesan', poi.qty_received AS 'Diterima', poi.unit_cost AS 'Harga Satuan'
+                FROM purchase_order_items poi JOIN ingredients i ON i.id = poi.ingredient_id WHERE poi.po_id = ?
+            """, (selected_po,)).style.format({'Harga Satuan': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
+            if st.button("❌ Batalkan PO", key="cancel_po_btn"):
+                success, message = cancel_purchase_order(selected_po)
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+    elif tab == "➕ Buat PO":
+        st.subheader("Buat Purchase Order")
+        if not supplier_names:
+            st.warning("Belum ada pemasok. Tambahkan di menu Pelanggan & Pemasok.")
+            return
+        col_supp, col_date = st.columns(2)
+        with col_supp:
+            supplier_name = st.selectbox("Pemasok", list(supplier_names), key="po_supplier")
+        with col_date:
+            order_date = st.date_input("Tanggal PO", date.today(), key="po_date")
+        notes = st.text_input("Catatan", key="po_notes")
+        edited = _line_editor(ingredient_names, key="po_lines")
+        lines = _editor_lines(edited, ingredient_names)
+        st.metric("Nilai PO", f"Rp {sum(qty * cost for _, qty, cost in lines):,.0f}")
+        if st.button("💾 Simpan PO", key="save_po_btn", type="primary"):
+            success, message, _ = create_purchase_order(supplier_names[supplier_name], order_date.isoformat(), lines, notes or None, st.session_state.user_id)
+            if success:
+                st.success(message); del st.session_state['po_lines']; st.rerun()
+            else:
+                st.error(message)
+
+    elif tab == "📥 Terima Barang":
+        st.subheader("Penerimaan Barang")
+        open_pos = get_df("""
+            SELECT po.id, po.supplier_id, s.name AS supplier_name, po.order_date FROM purchase_orders po
+            LEFT JOIN suppliers s ON s.id = po.supplier_id
+            WHERE po.status IN ('Dipesan', 'Sebagian Diterima') ORDER BY po.id
+        """)
+        po_labels = {None: "Tanpa PO (pembelian langsung)"}
+        po_labels.update({row['id']: f"PO #{row['id']} - {row['supplier_name']} ({row['order_date']})" for _, row in open_pos.iterrows()})
+        po_id = st.selectbox("Dari Purchase Order", list(po_labels), format_func=po_labels.get, key="receipt_po_select")
+
+        if po_id:
+            po_row = open_pos[open_pos['id'] == po_id].iloc[0]
+            supplier_id = po_row['supplier_id']
+            st.info(f"Pemasok: **{po_row['supplier_name']}**. Baris terisi sisa jumlah PO yang belum diterima; sesuaikan dengan faktur.")
+            lines_df = get_df("""
+                SELECT i.name AS 'Bahan', poi.qty_ordered - poi.qty_received AS 'Jumlah', poi.unit_cost AS 'Harga Satuan'
+                FROM purchase_order_items poi JOIN ingredients i ON i.id = poi.ingredient_id
+                WHERE poi.po_id = ? AND poi.qty_received < poi.qty_ordered
+            """, (po_id,))
+        else:
+            if not supplier_names:
+                st.warning("Belum ada pemasok. Tambahkan di menu Pelanggan & Pemasok.")
+                return
+            supplier_id = supplier_names[st.selectbox("Pemasok", list(supplier_names), key="receipt_supplier")]
+            lines_df = None
+
+        col_inv, col_date, col_due = st.columns(3)
+        with col_inv:
+            invoice_no = st.text_input("No. Faktur Pemasok", key="receipt_invoice")
+        with col_date:
+            receipt_date = st.date_input("Tanggal Terima", date.today(), key="receipt_date")
+        with col_due:
+            due_date = st.date_input("Jatuh Tempo", receipt_date + timedelta(days=PAYMENT_TERM_DAYS), key=f"receipt_due_{receipt_date}")
+        edited = _line_editor(ingredient_names, key=f"receipt_lines_{po_id}", lines_df=lines_df)
+        lines = _editor_lines(edited, ingredient_names)
+        st.metric("Total Faktur", f"Rp {sum(qty * cost for _, qty, cost in lines):,.0f}")
+        st.caption("Posting menambah stok, memperbarui HPP rata-rata bahan, membuat jurnal Persediaan Bahan Baku (D) / Utang Usaha (K), dan mencatat tagihan terbuka pemasok.")
+        if st.button("📥 Posting Penerimaan", key="post_receipt_btn", type="primary"):
+            success, message, _ = receive_goods(int(supplier_id), receipt_date.isoformat(), lines, po_id=po_id, invoice_no=invoice_no or None,
+                                             employee_id=st.session_state.user_id, due_date=due_date.isoformat())
+            if success:
+                st.success(message); st.session_state.pop(f"receipt_lines_{po_id}", None); st.rerun()
+            else:
+                st.error(message)
+
+    elif tab == "🧾 Riwayat Penerimaan":
+        st.subheader("Riwayat Penerimaan Barang")
+        receipts_df = get_df("""
+            SELECT gr.id AS 'No.', gr.receipt_date AS 'Tanggal', s.name AS 'Pemasok', gr.invoice_no AS 'No. Faktur',
+                gr.po_id AS 'No. PO', gr.total_amount AS 'Total'
+            FROM goods_receipts gr LEFT JOIN suppliers s ON s.id = gr.supplier_id ORDER BY gr.id DESC
+        """)
+        if receipts_df.empty:
+            st.info("Belum ada penerimaan barang.")
+        else:
+            st.dataframe(receipts_df.style.format({'Total': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+            selected_receipt = st.selectbox("Lihat detail penerimaan", receipts_df['No.'].tolist(), key="receipt_detail_select")
+            st.dataframe(get_df("""
+                SELECT i.name AS 'Bahan', i.unit AS 'Unit', gri.qty AS 'Jumlah', gri.unit_cost AS 'Harga Satuan', gri.qty * gri.unit_cost AS 'Subtotal'
+                FROM goods_receipt_items gri JOIN ingredients i ON i.id = gri.ingredient_id WHERE gri.receipt_id = ?
+            """, (selected_receipt,)).style.format({'Harga Satuan': 'Rp {:,.2f}', 'Subtotal': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
@@ -0,0 +1,59 @@
+"""Halaman Pencarian Global (full-text) atas pengeluaran, jurnal, kontak, dan transaksi."""
+import streamlit as st
+from datetime import date
+
+from orca.fulltext import global_search
+
+KIND_ICONS = {"Pengeluaran": "💸", "Jurnal": "📚", "Pelanggan": "👤", "Pemasok": "🚚", "Transaksi": "🧾"}
+
+
+def open_record(kind, ref_id, ref_date, title):
+    """Callback tombol 'Buka': pindah ke halaman asal data dan langsung memilih record-nya."""
+    day = date.fromisoformat(ref_date[:10]) if ref_date else None
+    if kind == "Pengeluaran":
+        st.session_state.main_menu = "💸 Catat Pengeluaran"
+        st.session_state.pengeluaran_tab = "✏️ Edit Pengeluaran"
+        st.session_state.edit_exp_search = title
+        st.session_state.edit_exp_select = ref_id
+    elif kind == "Jurnal":
+        st.session_state.main_menu = "📚 Akuntansi"
+        st.session_state.akuntansi_tab = "Jurnal Umum"
+        st.session_state.journal_start_date = day
+        st.session_state.journal_end_date = day
+    elif kind == "Pelanggan":
+        st.session_state.main_menu = "👤 Pelanggan & Pemasok"
+        st.session_state.kontak_tab = "Pelanggan"
+        st.session_state.edit_cust_mode_checkbox = True
+        st.session_state.select_cust_to_edit = title
+    elif kind == "Pemasok":
+        st.session_state.main_menu = "👤 Pelanggan & Pemasok"
+        st.session_state.kontak_tab = "Pemasok"
+        st.session_state.edit_supp_mode_checkbox = True
+        st.session_state.select_supp_to_edit = title
+    elif kind == "Transaksi":
+        st.session_state.main_menu = "📜 Riwayat Transaksi"
+        st.session_state.search_trans_id = str(ref_id)
+        st.session_state.trans_start_date = day
+        st.session_state.trans_end_date = day
+        st.session_state.selected_trans_id = ref_id
+
+
+def render():
+    st.header("🔎 Pencarian Global")
+    search_text = st.text_input("Cari di pengeluaran, jurnal, pelanggan, pemasok, dan transaksi", placeholder="Contoh: listrik, budi, latte, qris...", key="global_search_text")
+    results = global_search(search_text)
+    if results is None:
+        st.info("Ketik kata kunci di atas. Setiap kata dicocokkan sebagai awalan kata, tanpa membedakan huruf besar/kecil dan aksen.")
+        return
+    if results.empty:
+        st.warning("Tidak ada data yang cocok.")
+        return
+
+    st.caption(f"{len(results)} hasil, diurutkan berdasarkan relevansi.")
+    for i, row in results.iterrows():
+        col_info, col_action = st.columns([5, 1])
+        with col_info:
+            ref_date = f" · {row['ref_date']}" if row['ref_date'] else ""
+            st.markdown(f"{KIND_ICONS[row['kind']]} **{row['kind']}** · {row['title']}{ref_date}  \n{row['snippet']}")
+        with col_action:
+            st.button("Buka", key=f"open_search_hit_{i}", on_click=open_record, args=(row['kind'], int(row['ref_id']), row['ref_date'], row['title']), use_container_width=True)
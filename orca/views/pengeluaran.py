@@ -0,0 +1,100 @@
+"""Halaman Catat Pengeluaran."""
+import streamlit as st
+from datetime import datetime, date
+
+from orca.config import OUTLET_ID
+from orca.db import run_query, get_df
+from orca.expenses import create_expense, update_expense
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("💸 Catat Pengeluaran")
+    tab = lazy_tabs(["Daftar Pengeluaran", "➕ Tambah Pengeluaran", "✏️ Edit Pengeluaran"], key="pengeluaran_tab")
+    
+    if tab == "Daftar Pengeluaran":
+        st.subheader("Daftar Pengeluaran")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, date AS 'Tanggal', category AS 'Kategori', description AS 'Deskripsi', amount AS 'Jumlah', payment_method AS 'Metode Pembayaran', account_id AS 'ID Akun', CASE WHEN voided_at IS NULL THEN 'Aktif' ELSE 'Dibatalkan' END AS 'Status' FROM expenses").style.format({'Jumlah': 'Rp {:,.0f}'}), use_container_width=True, column_config={
+            "Tanggal": st.column_config.Column(width="small"),
+            "Kategori": st.column_config.Column(width="small"),
+            "Deskripsi": st.column_config.Column(width="medium"),
+            "Jumlah": st.column_config.Column(width="small"),
+            "Metode Pembayaran": st.column_config.Column(width="small"),
+            "ID Akun": st.column_config.Column(width="small"),
+            "Status": st.column_config.Column(width="small")
+        })
+    
+    elif tab == "➕ Tambah Pengeluaran":
+        st.subheader("Tambah Pengeluaran Baru")
+        accounts_df = get_df("SELECT id, account_code, account_name FROM accounts WHERE account_type = 'Beban' OR account_type = 'Aset'")
+        account_options = {f"{row['account_code']} - {row['account_name']}": row['id'] for _, row in accounts_df.iterrows()}
+        
+        with st.form("add_expense_form"):
+            date_exp = st.date_input("Tanggal", date.today())
+            category = st.selectbox("Kategori", ["Operasional", "Lainnya"])
+            description = st.text_input("Deskripsi", placeholder="Contoh: Pembelian ATK, Bayar Listrik")
+            amount = st.number_input("Jumlah (Rp)", value=1000, step=1000, min_value=1)
+            payment_method = st.selectbox("Metode Pembayaran", ["Cash", "Transfer"])
+            
+            # Ensure account_options is not empty before creating selectbox
+            if account_options:
+                selected_account_name = st.selectbox("Pilih Akun Beban/Aset", list(account_options.keys()))
+            else:
+                st.warning("Tidak ada akun Beban/Aset yang tersedia. Harap tambahkan di menu Akuntansi > Daftar Akun.")
+                selected_account_name = None # Prevent error if no accounts
+
+            if st.form_submit_button("Tambah"):
+                if selected_account_name and description and amount > 0:
+                    success, message = create_expense(date_exp.isoformat(), category, description, amount, payment_method, account_options[selected_account_name], OUTLET_ID)
+                    if success:
+                        st.success(message); st.rerun()
+                    else:
+                        st.error(message)
+                else:
+                    st.error("Harap lengkapi semua kolom yang wajib diisi (Deskripsi, Jumlah, dan Akun).")
+
+    elif tab == "✏️ Edit Pengeluaran":
+        st.subheader("Edit Pengeluaran")
+        search_term = st.text_input("Ketik deskripsi pengeluaran untuk diedit", key="edit_exp_search", placeholder="Cari pengeluaran...")
+        if search_term:
+            matches = run_query("SELECT id, date, description, amount FROM expenses WHERE description LIKE ? AND voided_at IS NULL ORDER BY date DESC, id DESC", (f'%{search_term}%',), fetch='all')
+            match_labels = {row[0]: f"{row[1]} - {row[2]} (Rp {row[3]:,.0f})" for row in matches}
+            selected_exp_id = st.selectbox("Pilih pengeluaran", list(match_labels), format_func=match_labels.get, key="edit_exp_select") if match_labels else None
+            exp_data = run_query("SELECT * FROM expenses WHERE id = ?", (selected_exp_id,), fetch='one') if selected_exp_id else None
+            if exp_data:
+                accounts_df = get_df("SELECT id, account_code, account_name FROM accounts WHERE account_type = 'Beban' OR account_type = 'Aset'")
+                account_options = {f"{row['account_code']} - {row['account_name']}": row['id'] for _, row in accounts_df.iterrows()}
+                
+                # Get current account name for default selection
+                current_account_name_tuple = run_query("SELECT account_code || ' - ' || account_name FROM accounts WHERE id = ?", (exp_data[6],), fetch='one')
+                current_account_name = current_account_name_tuple[0] if current_account_name_tuple else list(account_options.keys())[0]
+
+                with st.form("edit_expense_form"):
+                    st.info(f"Mengedit data untuk: **{exp_data[3]}**")
+                    date_exp = st.date_input("Tanggal", value=datetime.strptime(exp_data[1], '%Y-%m-%d').date())
+                    category = st.selectbox("Kategori", ["Operasional", "Lainnya"], index=["Operasional", "Lainnya"].index(exp_data[2] if exp_data[2] else "Lainnya"))
+                    description = st.text_input("Deskripsi", value=exp_data[3])
+                    amount = st.number_input("Jumlah (Rp)", value=int(exp_data[4]), step=1000, min_value=1)
+                    payment_method = st.selectbox("Metode Pembayaran", ["Cash", "Transfer"], index=["Cash", "Transfer"].index(exp_data[5]))
+                    
+                    if account_options:
+                        selected_account_name_edit = st.selectbox("Pilih Akun Beban/Aset", list(account_options.keys()), index=list(account_options.keys()).index(current_account_name))
+                    else:
+                        st.warning("Tidak ada akun Beban/Aset yang tersedia. Harap tambahkan di menu Akuntansi > Daftar Akun.")
+                        selected_account_name_edit = None
+
+                    if st.form_submit_button("Simpan Perubahan"):
+                        if selected_account_name_edit and description and amount > 0:
+                            selected_account_id_edit = account_options[selected_account_name_edit]
+                            success, message = update_expense(exp_data[0], date_exp.isoformat(), category, description, amount, payment_method, selected_account_id_edit)
+                            if success:
+                                st.success(message); st.rerun()
+                            else:
+                                st.error(message)
+                        else:
+                            st.error("Harap lengkapi semua kolom yang wajib diisi (Deskripsi, Jumlah, dan Akun).")
+            else:
+                st.warning("Pengeluaran tidak ditemukan.")
+        else:
+            st.info("Ketik deskripsi pengeluaran di atas untuk mulai mengedit.")
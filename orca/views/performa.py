@@ -0,0 +1,70 @@
+"""Halaman Performa Aplikasi (khusus Admin)."""
+import streamlit as st
+import pandas as pd
+
+from orca.config import PERF_BUFFER_SIZE
+from orca.db import get_df
+from orca.perf import get_perf_recorder
+
+
+def render():
+    st.header("⏱️ Performa Aplikasi")
+    recorder = get_perf_recorder()
+
+    col_opt1, col_opt2, col_opt3 = st.columns(3)
+    with col_opt1:
+        recorder.persist = st.toggle("Simpan sampel ke database", value=recorder.persist, key="perf_persist_toggle")
+    with col_opt2:
+        source = st.radio("Sumber Data", ["Memori", "Database"], horizontal=True, key="perf_source")
+    with col_opt3:
+        if st.button("Kosongkan Buffer", key="perf_clear_btn", use_container_width=True):
+            recorder.clear(); st.rerun()
+
+    if source == "Database":
+        samples_df = get_df("SELECT kind, menu, fingerprint, duration_ms, rows, recorded_at FROM perf_samples ORDER BY id DESC LIMIT ?", (PERF_BUFFER_SIZE * 2,))
+        query_df = samples_df[samples_df['kind'] == 'query']
+        rerun_df = samples_df[samples_df['kind'] == 'rerun']
+    else:
+        query_df = pd.DataFrame(list(recorder.queries))
+        rerun_df = pd.DataFrame(list(recorder.reruns))
+    st.caption(f"Buffer memori: {len(recorder.queries)} sampel query, {len(recorder.reruns)} sampel rerun (maks. {PERF_BUFFER_SIZE} masing-masing).")
+
+    st.subheader("Query Paling Lambat")
+    if not query_df.empty:
+        slow_df = query_df.groupby('fingerprint').agg(
+            Jumlah=('duration_ms', 'size'),
+            Total_ms=('duration_ms', 'sum'),
+            Rata_ms=('duration_ms', 'mean'),
+            P95_ms=('duration_ms', lambda x: x.quantile(0.95)),
+            Maks_ms=('duration_ms', 'max'),
+            Baris=('rows', 'mean'),
+            Menu=('menu', lambda x: ', '.join(sorted(set(x))))
+        ).reset_index().sort_values('Total_ms', ascending=False)
+        st.dataframe(slow_df.rename(columns={'fingerprint': 'SQL'}).style.format({'Total_ms': '{:,.1f}', 'Rata_ms': '{:,.2f}', 'P95_ms': '{:,.2f}', 'Maks_ms': '{:,.2f}', 'Baris': '{:,.1f}'}), hide_index=True, use_container_width=True, column_config={
+            "SQL": st.column_config.Column(width="large")
+        })
+    else:
+        st.info("Belum ada sampel query.")
+
+    st.subheader("Waktu Rerun per Halaman")
+    if not rerun_df.empty:
+        rerun_summary = rerun_df.groupby('menu')['duration_ms'].describe(percentiles=[0.5, 0.9, 0.99])[['count', '50%', '90%', '99%', 'max']]
+        rerun_summary.columns = ['Jumlah', 'P50 (ms)', 'P90 (ms)', 'P99 (ms)', 'Maks (ms)']
+        st.dataframe(rerun_summary.sort_values('P90 (ms)', ascending=False).style.format('{:,.1f}'), use_container_width=True)
+    else:
+        st.info("Belum ada sampel rerun.")
+
+    st.subheader("EXPLAIN QUERY PLAN")
+    if recorder.examples:
+        fingerprints = sorted(recorder.examples.keys())
+        selected_fp = st.selectbox("Pilih Query", fingerprints, key="perf_explain_select")
+        if st.button("Jalankan EXPLAIN QUERY PLAN", key="perf_explain_btn"):
+            sql, params = recorder.examples[selected_fp]
+            st.code(sql.strip(), language="sql")
+            try:
+                plan_df = get_df(f"EXPLAIN QUERY PLAN {sql}", params)
+                st.dataframe(plan_df, hide_index=True, use_container_width=True)
+            except Exception as e:
+                st.error(f"Gagal menjalankan EXPLAIN: {e}")
+    else:
+        st.info("Belum ada query yang direkam di memori.")
@@ -0,0 +1,104 @@
+"""Halaman Piutang & Utang: umur piutang/utang, faktur terbuka, faktur baru, dan pembayaran."""
+import streamlit as st
+from datetime import date, timedelta
+
+from orca.config import AGING_BUCKETS, PAYMENT_TERM_DAYS
+from orca.db import get_df
+from orca.subledgers import CONTROL_ACCOUNTS, KINDS, PARTY_TABLES, create_invoice, get_aging, get_open_items, record_payment
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("📒 Piutang & Utang")
+    kind = st.radio("Buku Pembantu", KINDS, format_func=lambda k: "Piutang (Pelanggan)" if k == 'Piutang' else "Utang (Pemasok)", horizontal=True, key="subledger_kind")
+    party_label = "Pelanggan" if kind == 'Piutang' else "Pemasok"
+    parties_df = get_df(f"SELECT id, name FROM {PARTY_TABLES[kind]} ORDER BY name")
+    party_names = dict(zip(parties_df['name'], parties_df['id']))
+    tab = lazy_tabs(["📊 Umur", "📄 Faktur Terbuka", "➕ Faktur Baru", "💵 Pembayaran"], key="subledger_tab")
+
+    if tab == "📊 Umur":
+        st.subheader(f"Umur {kind} per {party_label}")
+        as_of = st.date_input("Per Tanggal", date.today(), key="aging_as_of")
+        aging = get_aging(kind, as_of.isoformat())
+        if aging.empty:
+            st.info(f"Tidak ada {kind.lower()} yang terbuka.")
+            return
+        cols = st.columns(len(AGING_BUCKETS) + 1)
+        for col, bucket in zip(cols, [*AGING_BUCKETS, 'Total']):
+            col.metric(bucket, f"Rp {aging[bucket].sum():,.0f}")
+        st.dataframe(aging.style.format('Rp {:,.0f}'), use_container_width=True)
+        ledger = get_df("""SELECT IFNULL(SUM(ji.debit - ji.kredit), 0) AS saldo FROM journal_items ji
+            JOIN accounts a ON a.id = ji.account_id WHERE a.account_name = ?""", (CONTROL_ACCOUNTS[kind],))['saldo'].iloc[0]
+        ledger = ledger if kind == 'Piutang' else -ledger
+        subledger = get_df("SELECT IFNULL(SUM(amount - paid_amount), 0) AS sisa FROM open_items WHERE kind = ? AND status = 'Terbuka'", (kind,))['sisa'].iloc[0]
+        st.caption(f"Saldo akun {CONTROL_ACCOUNTS[kind]} di buku besar: Rp {ledger:,.0f} · total buku pembantu: Rp {subledger:,.0f}")
+
+    elif tab == "📄 Faktur Terbuka":
+        st.subheader(f"Faktur {kind} Terbuka")
+        party_name = st.selectbox(party_label, [f"Semua {party_label}", *party_names], key="open_items_party")
+        items = get_open_items(kind, party_names.get(party_name))
+        if items.empty:
+            st.info("Tidak ada faktur terbuka.")
+        else:
+            if len(items) == 1000:
+                st.caption("Menampilkan 1.000 faktur dengan jatuh tempo terlama.")
+            overdue = items['due_date'] < date.today().isoformat()
+            st.dataframe(items.rename(columns={
+                'id': 'ID', 'party_name': party_label, 'doc_no': 'No. Dokumen', 'doc_date': 'Tanggal', 'due_date': 'Jatuh Tempo',
+                'description': 'Keterangan', 'amount': 'Nilai', 'paid_amount': 'Dibayar', 'outstanding': 'Sisa'
+            }).style.format({'Nilai': 'Rp {:,.0f}', 'Dibayar': 'Rp {:,.0f}', 'Sisa': 'Rp {:,.0f}'}).apply(
+                lambda col: ['color: #d9534f' if late else '' for late in overdue], subset=['Jatuh Tempo']), use_container_width=True, hide_index=True)
+
+    elif tab == "➕ Faktur Baru":
+        st.subheader("Faktur Pelanggan Baru" if kind == 'Piutang' else "Tagihan Pemasok Baru")
+        if not party_names:
+            st.warning(f"Belum ada {party_label.lower()}. Tambahkan di menu Pelanggan & Pemasok.")
+            return
+        if kind == 'Utang':
+            st.caption("Tagihan pembelian bahan tercatat otomatis saat penerimaan barang diposting; gunakan form ini untuk tagihan lain (mis. jasa atau sewa).")
+        counter_type = 'Pendapatan' if kind == 'Piutang' else 'Beban'
+        counter_df = get_df("SELECT id, account_code || ' - ' || account_name AS label FROM accounts WHERE account_type IN (?, 'Aset') AND account_name NOT IN (?, 'Kas', 'Bank') ORDER BY account_type = ? DESC, account_code",
+                            (counter_type, CONTROL_ACCOUNTS[kind], counter_type))
+        counter_accounts = dict(zip(counter_df['label'], counter_df['id']))
+        with st.form("new_invoice_form", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            party_name = col1.selectbox(party_label, list(party_names))
+            doc_no = col2.text_input("No. Dokumen (kosongkan untuk nomor otomatis)")
+            col3, col4 = st.columns(2)
+            doc_date = col3.date_input("Tanggal", date.today())
+            due_date = col4.date_input("Jatuh Tempo", date.today() + timedelta(days=PAYMENT_TERM_DAYS))
+            counter_label = st.selectbox("Akun Pendapatan" if kind == 'Piutang' else "Akun Beban / Aset", list(counter_accounts))
+            description = st.text_input("Keterangan")
+            amount = st.number_input("Nilai (Rp)", min_value=0, step=1000)
+            if st.form_submit_button("💾 Simpan", type="primary"):
+                success, message, _ = create_invoice(kind, party_names[party_name], doc_date.isoformat(), amount, counter_accounts[counter_label],
+                                                     description or None, doc_no or None, due_date.isoformat())
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+
+    elif tab == "💵 Pembayaran":
+        st.subheader("Terima Pembayaran Pelanggan" if kind == 'Piutang' else "Bayar Pemasok")
+        if not party_names:
+            st.warning(f"Belum ada {party_label.lower()}. Tambahkan di menu Pelanggan & Pemasok.")
+            return
+        party_name = st.selectbox(party_label, list(party_names), key="payment_party")
+        items = get_open_items(kind, party_names[party_name])
+        if items.empty:
+            st.info(f"Tidak ada faktur terbuka untuk {party_name}.")
+            return
+        item_labels = {row['id']: f"{row['doc_no']} · jatuh tempo {row['due_date']} · sisa Rp {row['outstanding']:,.0f}" for _, row in items.iterrows()}
+        selected_ids = st.multiselect("Faktur yang dibayar (kosongkan = jatuh tempo terlama lebih dulu)", list(item_labels), format_func=item_labels.get, key=f"payment_items_{kind}_{party_name}")
+        outstanding = items[items['id'].isin(selected_ids)]['outstanding'].sum() if selected_ids else items['outstanding'].sum()
+        col1, col2, col3 = st.columns(3)
+        amount = col1.number_input("Jumlah (Rp)", min_value=0, max_value=int(outstanding), value=int(outstanding), step=1000, key=f"payment_amount_{kind}_{party_name}_{len(selected_ids)}")
+        payment_date = col2.date_input("Tanggal Bayar", date.today(), key="payment_date")
+        cash_account = col3.selectbox("Kas/Bank", ["Kas", "Bank"], key="payment_account")
+        notes = st.text_input("Catatan", key="payment_notes")
+        if st.button("💵 Simpan Pembayaran", type="primary", key="save_payment_btn"):
+            success, message = record_payment(kind, party_names[party_name], payment_date.isoformat(), amount, cash_account, selected_ids or None, notes or None)
+            if success:
+                st.success(message); st.rerun()
+            else:
+                st.error(message)
@@ -0,0 +1,333 @@
+"""Halaman Manajemen Produk & Resep."""
+import pandas as pd
+import streamlit as st
+
+from orca.bom import get_flat_bom, would_create_cycle, run_production
+from orca.config import OUTLET_ID
+from orca.db import run_query, get_df
+from orca.pricing import PRICING_RULES, ROUNDING_STEPS, ROUNDING_MODES, preview_prices, apply_prices
+from orca.importer import IMPORT_KINDS, import_template, prepare_import, apply_import
+from orca.search import get_product_index
+from orca.ui import lazy_tabs
+from orca.variants import get_variant_catalog, add_option, delete_option, merge_temperature_pairs
+
+
+def render():
+    st.header("🍛 Manajemen Produk & Resep")
+    tab = lazy_tabs(["Daftar Produk", "➕ Tambah Produk", "✏️ Edit Produk", "🍲 Kelola Resep", "🧪 Bahan Setengah Jadi", "🏭 Produksi Batch", "🎛️ Varian & Tambahan", "💲 Harga Massal", "📥 Impor Massal"], key="produk_tab")
+    
+    if tab == "Daftar Produk":
+        st.subheader("Daftar Produk Saat Ini")
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df("SELECT id, name AS 'Nama Produk', price AS 'Harga Jual', IFNULL(is_active, 1) = 1 AS 'Aktif' FROM products").style.format({'Harga Jual': 'Rp {:,.0f}'}), use_container_width=True, column_config={
+            "Nama Produk": st.column_config.Column(width="medium"),
+            "Harga Jual": st.column_config.Column(width="small")
+        })
+    
+    elif tab == "➕ Tambah Produk":
+        st.subheader("Tambah Produk Baru")
+        with st.form("add_product_form"):
+            name = st.text_input("Nama Produk", placeholder="Contoh: Coffee Latte")
+            price = st.number_input("Harga Jual", value=0.0, format="%.2f")
+            if st.form_submit_button("Tambah Produk"):
+                if name and price > 0:
+                    run_query("INSERT INTO products (name, price) VALUES (?, ?)", (name, price)); st.success(f"Produk '{name}' ditambahkan!"); st.rerun()
+                else:
+                    st.error("Nama Produk dan Harga Jual tidak boleh kosong atau nol.")
+    
+    elif tab == "✏️ Edit Produk":
+        st.subheader("Edit Produk")
+        search_term = st.text_input("Ketik nama produk untuk diedit", key="edit_prod_search", placeholder="Cari produk...")
+        if search_term:
+            product_index = get_product_index()
+            matches = product_index.search(search_term, limit=20)
+            prod_data = None
+            if matches:
+                # Pilih eksplisit dari hasil terurut, bukan sembarang baris pertama yang cocok
+                product_id = st.selectbox("Pilih produk", matches, format_func=lambda i: product_index.rows[i][1], key="edit_prod_select")
+                prod_data = run_query("SELECT * FROM products WHERE id = ?", (product_id,), fetch='one')
+            if prod_data:
+                with st.form("edit_product_form"):
+                    st.info(f"Mengedit data untuk: **{prod_data[1]}**")
+                    name = st.text_input("Nama Produk", value=prod_data[1])
+                    price = st.number_input("Harga Jual", value=float(prod_data[2]), format="%.2f")
+                    is_active = st.checkbox("Tampilkan di katalog kasir", value=prod_data[3] != 0)
+                    if st.form_submit_button("Simpan Perubahan"):
+                        if name and price > 0:
+                            run_query("UPDATE products SET name=?, price=?, is_active=? WHERE id=?", (name, price, int(is_active), prod_data[0])); st.success("Produk diperbarui!"); st.rerun()
+                        else:
+                            st.error("Nama Produk dan Harga Jual tidak boleh kosong atau nol.")
+            else:
+                st.warning("Produk tidak ditemukan.")
+        else:
+            st.info("Ketik nama produk di atas untuk mulai mengedit.")
+    
+    elif tab == "🍲 Kelola Resep":
+        st.subheader("Kelola Resep per Produk")
+        products_df = get_df("SELECT id, name FROM products")
+        if not products_df.empty:
+            product_id = st.selectbox("Pilih Produk", products_df['id'], format_func=lambda x: products_df[products_df['id'] == x]['name'].iloc[0], key="recipe_prod_select")
+            
+            st.markdown("#### Resep Saat Ini:")
+            current_recipe_df = get_df("SELECT i.name AS 'Bahan', r.qty_per_unit AS 'Jumlah Dibutuhkan', i.unit AS 'Satuan' FROM recipes r JOIN ingredients i ON r.ingredient_id = i.id WHERE r.product_id=?", (product_id,))
+            if not current_recipe_df.empty:
+                # Memperbaiki lebar kolom agar tulisan tidak terpotong
+                st.dataframe(current_recipe_df, use_container_width=True, column_config={
+                    "Bahan": st.column_config.Column(width="medium"),
+                    "Jumlah Dibutuhkan": st.column_config.Column(width="small"),
+                    "Satuan": st.column_config.Column(width="small")
+                })
+            else:
+                st.info("Produk ini belum memiliki resep. Tambahkan bahan di bawah.")
+
+            st.markdown("---")
+            st.markdown("#### Tambah/Update Bahan ke Resep:")
+            with st.form("recipe_form"):
+                ingredients_df = get_df("SELECT id, name, unit FROM ingredients")
+                if not ingredients_df.empty:
+                    ingredient_options = {f"{row['name']} ({row['unit']})": row['id'] for _, row in ingredients_df.iterrows()}
+                    selected_ing_name = st.selectbox("Pilih Bahan", list(ingredient_options.keys()), key="recipe_ing_select")
+                    ingredient_id = ingredient_options[selected_ing_name]
+                    
+                    qty = st.number_input("Jumlah Dibutuhkan", format="%.2f", min_value=0.01)
+                    
+                    if st.form_submit_button("Tambah/Update Bahan ke Resep"):
+                        run_query("REPLACE INTO recipes (product_id, ingredient_id, qty_per_unit) VALUES (?, ?, ?)", (product_id, ingredient_id, qty)); st.success("Resep diperbarui."); st.rerun()
+                else: 
+                    st.warning("Tidak ada bahan baku. Tambahkan di menu Manajemen Stok terlebih dahulu.")
+        else: 
+            st.info("Tidak ada produk untuk dikelola resepnya. Tambahkan produk terlebih dahulu.")
+
+    elif tab == "🧪 Bahan Setengah Jadi":
+        st.subheader("Resep Bahan Setengah Jadi")
+        st.caption("Bahan setengah jadi (sirup, espresso base, sambal, ...) dibuat per batch dari bahan lain dan bisa dipakai di resep produk seperti bahan biasa.")
+        ingredients_df = get_df("SELECT id, name, unit, is_intermediate, batch_yield FROM ingredients ORDER BY name")
+        if ingredients_df.empty:
+            st.warning("Tidak ada bahan baku. Tambahkan di menu Manajemen Stok terlebih dahulu.")
+            return
+        ingredient_labels = {row['id']: f"{row['name']} ({row['unit']})" for _, row in ingredients_df.iterrows()}
+        parent_id = st.selectbox("Pilih Bahan", list(ingredient_labels), format_func=ingredient_labels.get, key="intermediate_select")
+        parent_row = ingredients_df[ingredients_df['id'] == parent_id].iloc[0]
+
+        with st.form("intermediate_settings_form"):
+            is_intermediate = st.checkbox("Bahan setengah jadi (dibuat sendiri per batch)", value=bool(parent_row['is_intermediate']))
+            batch_yield = st.number_input(f"Hasil per batch ({parent_row['unit']})", value=float(parent_row['batch_yield'] or 1.0), min_value=0.01, format="%.2f")
+            if st.form_submit_button("Simpan Pengaturan"):
+                run_query("UPDATE ingredients SET is_intermediate = ?, batch_yield = ? WHERE id = ?", (int(is_intermediate), batch_yield, parent_id))
+                st.success("Pengaturan bahan disimpan."); st.rerun()
+
+        if parent_row['is_intermediate']:
+            st.markdown("#### Komponen per Batch:")
+            components_df = get_df("SELECT i.name AS 'Bahan', sr.qty_per_batch AS 'Jumlah per Batch', i.unit AS 'Satuan' FROM sub_recipes sr JOIN ingredients i ON i.id = sr.ingredient_id WHERE sr.parent_id = ?", (parent_id,))
+            if components_df.empty:
+                st.info("Belum ada komponen. Tambahkan di bawah.")
+            else:
+                st.dataframe(components_df, use_container_width=True, hide_index=True)
+            with st.form("sub_recipe_form"):
+                component_options = {i: label for i, label in ingredient_labels.items() if i != parent_id}
+                component_id = st.selectbox("Pilih Komponen", list(component_options), format_func=component_options.get, key="sub_recipe_ing_select")
+                qty = st.number_input("Jumlah per Batch", format="%.2f", min_value=0.0)
+                col_save, col_remove = st.columns(2)
+                with col_save:
+                    save_component = st.form_submit_button("Tambah/Update Komponen")
+                with col_remove:
+                    remove_component = st.form_submit_button("Hapus Komponen")
+                if save_component:
+                    if qty <= 0:
+                        st.error("Jumlah harus lebih dari nol.")
+                    elif would_create_cycle(parent_id, component_id):
+                        st.error("Komponen ini (langsung atau lewat bahan lain) sudah memakai bahan yang sedang diedit.")
+                    else:
+                        run_query("REPLACE INTO sub_recipes (parent_id, ingredient_id, qty_per_batch) VALUES (?, ?, ?)", (parent_id, component_id, qty)); st.success("Resep diperbarui."); st.rerun()
+                if remove_component:
+                    run_query("DELETE FROM sub_recipes WHERE parent_id = ? AND ingredient_id = ?", (parent_id, component_id)); st.success("Komponen dihapus."); st.rerun()
+
+            flat_bom = get_flat_bom()
+            raw_needs = {ing_id: qty for ing_id, qty in flat_bom.expansion.get(parent_id, {}).items() if ing_id not in flat_bom.intermediates}
+            if raw_needs:
+                st.markdown(f"#### Kebutuhan Bahan Baku per 1 {parent_row['unit']} (semua tingkat):")
+                raw_df = get_df(f"SELECT id, name AS 'Bahan', unit AS 'Satuan', IFNULL(cost_per_unit, 0) AS cost_per_unit FROM ingredients WHERE id IN ({', '.join('?' * len(raw_needs))})", tuple(raw_needs))
+                raw_df['Jumlah'] = raw_df['id'].map(raw_needs)
+                raw_df['Biaya'] = raw_df['Jumlah'] * raw_df['cost_per_unit']
+                st.dataframe(raw_df[['Bahan', 'Jumlah', 'Satuan', 'Biaya']].style.format({'Jumlah': '{:,.4f}', 'Biaya': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
+                st.caption(f"HPP standar: Rp {raw_df['Biaya'].sum():,.2f} per {parent_row['unit']}")
+
+    elif tab == "🏭 Produksi Batch":
+        st.subheader("Produksi Batch Bahan Setengah Jadi")
+        intermediates_df = get_df("""SELECT i.id, i.name, i.unit, i.batch_yield, s.stock FROM ingredients i
+            LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id WHERE i.is_intermediate = 1 ORDER BY i.name""", (OUTLET_ID,))
+        if intermediates_df.empty:
+            st.info("Belum ada bahan setengah jadi. Atur di tab 🧪 Bahan Setengah Jadi.")
+            return
+        intermediate_labels = {row['id']: f"{row['name']} (stok {row['stock'] or 0:,.2f} {row['unit']})" for _, row in intermediates_df.iterrows()}
+        intermediate_id = st.selectbox("Bahan yang Diproduksi", list(intermediate_labels), format_func=intermediate_labels.get, key="production_select")
+        batches = st.number_input("Jumlah Batch", min_value=0.5, value=1.0, step=0.5, key="production_batches")
+        row = intermediates_df[intermediates_df['id'] == intermediate_id].iloc[0]
+        st.caption(f"Hasil: {row['batch_yield'] * batches:,.2f} {row['unit']}")
+        st.dataframe(get_df("""
+            SELECT i.name AS 'Komponen', sr.qty_per_batch * ? AS 'Dibutuhkan', IFNULL(s.stock, 0) AS 'Stok', i.unit AS 'Satuan'
+            FROM sub_recipes sr JOIN ingredients i ON i.id = sr.ingredient_id
+            LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = sr.ingredient_id WHERE sr.parent_id = ?
+        """, (batches, OUTLET_ID, intermediate_id)), use_container_width=True, hide_index=True)
+        if st.button("🏭 Jalankan Produksi", key="run_production_btn", type="primary"):
+            success, message = run_production(intermediate_id, batches, st.session_state.user_id)
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
+
+        st.markdown("---")
+        st.markdown("#### Riwayat Produksi")
+        st.dataframe(get_df("""
+            SELECT pr.id AS 'No.', pr.produced_at AS 'Waktu', i.name AS 'Bahan', pr.batches AS 'Batch', pr.qty_produced AS 'Hasil',
+                pr.total_cost AS 'Biaya', e.name AS 'Oleh'
+            FROM production_runs pr JOIN ingredients i ON i.id = pr.ingredient_id LEFT JOIN employees e ON e.id = pr.employee_id
+            ORDER BY pr.id DESC LIMIT 100
+        """).style.format({'Biaya': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+
+    elif tab == "🎛️ Varian & Tambahan":
+        st.subheader("Varian & Tambahan Produk")
+        st.caption("Varian (mis. Suhu: Panas/Dingin, Ukuran: Reguler/Large) dipilih satu per grup; tambahan (mis. Double Shoot) boleh lebih dari satu. Selisih harga ditambahkan ke harga dasar dan selisih resep ke resep produk.")
+        products_df = get_df("SELECT id, name FROM products WHERE IFNULL(is_active, 1) = 1 ORDER BY name")
+        ingredients_df = get_df("SELECT id, name || ' (' || IFNULL(unit, '') || ')' AS label FROM ingredients ORDER BY name")
+        if products_df.empty:
+            st.info("Tidak ada produk aktif.")
+        else:
+            product_names = dict(zip(products_df['id'], products_df['name']))
+            product_id = st.selectbox("Pilih Produk", list(product_names), format_func=product_names.get, key="option_prod_select")
+            catalog = get_variant_catalog()
+            if catalog.has_options(product_id):
+                option_rows = [{'id': option_id, 'Grup': group_name, 'Opsi': catalog.options[option_id][2], 'Jenis': 'Tambahan' if is_modifier else 'Varian', 'Selisih Harga': catalog.options[option_id][3]}
+                               for group_name, is_modifier, ids in catalog.groups[product_id] for option_id in ids]
+                st.dataframe(pd.DataFrame(option_rows).drop(columns='id').style.format({'Selisih Harga': 'Rp {:+,.0f}'}), use_container_width=True, hide_index=True)
+                variant_boms = [(variant, bom) for (pid, variant), bom in catalog.boms.items() if pid == product_id and variant]
+                if variant_boms:
+                    st.markdown("**Resep Efektif per Varian**")
+                    ingredient_names = dict(zip(ingredients_df['id'], ingredients_df['label']))
+                    st.dataframe(pd.DataFrame([{'Varian': catalog.label(variant), **{ingredient_names.get(ing_id, ing_id): qty for ing_id, qty in bom.items()}} for variant, bom in variant_boms]), use_container_width=True, hide_index=True)
+                option_labels = {row['id']: f"{row['Grup']}: {row['Opsi']}" for row in option_rows}
+                col_opt, col_del = st.columns([3, 1])
+                with col_opt:
+                    option_to_delete = st.selectbox("Hapus opsi", list(option_labels), format_func=option_labels.get, key="option_delete_select")
+                with col_del:
+                    st.write("")
+                    if st.button("Hapus Opsi", key="option_delete_btn", use_container_width=True):
+                        success, message = delete_option(option_to_delete)
+                        if success:
+                            st.success(message); st.rerun()
+                        else:
+                            st.error(message)
+            else:
+                st.info("Produk ini belum memiliki varian/tambahan.")
+
+            st.markdown("---")
+            st.markdown("#### Tambah Opsi")
+            target_ids = st.multiselect("Terapkan ke produk", list(product_names), default=[product_id], format_func=product_names.get, key="option_target_products")
+            col_group, col_name, col_price, col_kind = st.columns(4)
+            with col_group:
+                group_name = st.text_input("Grup", placeholder="Contoh: Suhu / Ukuran / Tambahan", key="option_group")
+            with col_name:
+                option_name = st.text_input("Nama Opsi", placeholder="Contoh: Dingin", key="option_name")
+            with col_price:
+                price_delta = st.number_input("Selisih Harga (Rp)", value=0.0, step=500.0, key="option_price_delta")
+            with col_kind:
+                option_kind = st.radio("Jenis", ["Varian", "Tambahan"], key="option_kind", horizontal=True)
+            ingredient_ids = dict(zip(ingredients_df['label'], ingredients_df['id']))
+            deltas_df = st.data_editor(pd.DataFrame({'Bahan': pd.Series(dtype='object'), 'Selisih Jumlah': pd.Series(dtype='float')}), key="option_deltas_editor", num_rows="dynamic", use_container_width=True, hide_index=True, column_config={
+                "Bahan": st.column_config.SelectboxColumn("Bahan", options=list(ingredient_ids), required=True, width="large"),
+                "Selisih Jumlah": st.column_config.NumberColumn("Selisih Jumlah (negatif = dikurangi)", format="%.2f"),
+            })
+            if st.button("Simpan Opsi", key="option_add_btn", type="primary"):
+                deltas_df = deltas_df.dropna(subset=['Bahan', 'Selisih Jumlah'])
+                success, message = add_option(target_ids, group_name.strip(), option_name.strip(), price_delta, option_kind == "Tambahan",
+                                              [(ingredient_ids[name], float(qty)) for name, qty in zip(deltas_df['Bahan'], deltas_df['Selisih Jumlah'])])
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+        if st.session_state.role == 'Admin':
+            st.markdown("---")
+            st.markdown("#### Gabungkan Produk Panas/Dingin")
+            st.caption("Pasangan '<Nama> Panas' dan '<Nama> Dingin' dijadikan satu produk '<Nama>' dengan varian Suhu. Produk lama disembunyikan dari katalog, riwayat penjualannya tetap.")
+            if st.button("🔗 Gabungkan Pasangan Panas/Dingin", key="merge_temperature_btn"):
+                success, message = merge_temperature_pairs()
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+
+    elif tab == "💲 Harga Massal":
+        st.subheader("Ubah Harga Massal")
+        st.caption("Harga baru dihitung untuk semua produk yang cocok sekaligus. Target margin memakai HPP standar dari resep; produk tanpa resep tidak diubah.")
+        col_rule, col_value, col_filter = st.columns(3)
+        with col_rule:
+            rule = st.radio("Aturan", PRICING_RULES, key="pricing_rule", horizontal=True)
+        with col_value:
+            if rule == "Persentase":
+                value = st.number_input("Perubahan Harga (%)", value=10.0, step=1.0, key="pricing_percent")
+            else:
+                value = st.number_input("Target Margin (%)", min_value=0.0, max_value=95.0, value=60.0, step=5.0, key="pricing_margin")
+        with col_filter:
+            name_filter = st.text_input("Filter nama produk (opsional)", key="pricing_filter", placeholder="Contoh: latte")
+        col_step, col_mode = st.columns(2)
+        with col_step:
+            rounding_label = st.selectbox("Pembulatan", list(ROUNDING_STEPS), index=2, key="pricing_rounding")
+        with col_mode:
+            rounding_mode = st.selectbox("Arah Pembulatan", list(ROUNDING_MODES), key="pricing_rounding_mode")
+        try:
+            preview = preview_prices(rule, value, ROUNDING_STEPS[rounding_label], rounding_mode, name_filter.strip())
+        except ValueError as e:
+            st.error(str(e))
+            preview = None
+        if preview is not None and not preview.empty:
+            changed = preview[preview['Selisih'].abs() > 1e-9]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Produk Berubah", f"{len(changed)} / {len(preview)}")
+            col2.metric("Rata-rata Margin Lama", f"{preview['Margin Lama %'].mean():.1f}%")
+            col3.metric("Rata-rata Margin Baru", f"{preview['Margin Baru %'].mean():.1f}%")
+            st.dataframe(preview.drop(columns='id').style.format({'HPP': 'Rp {:,.0f}', 'Harga Lama': 'Rp {:,.0f}', 'Harga Baru': 'Rp {:,.0f}', 'Selisih': 'Rp {:+,.0f}', 'Margin Lama %': '{:.1f}%', 'Margin Baru %': '{:.1f}%'}, na_rep='-'), use_container_width=True, hide_index=True)
+            low_margin = preview[preview['Margin Baru %'] < 0]
+            if not low_margin.empty:
+                st.warning(f"{len(low_margin)} produk akan dijual di bawah HPP: {', '.join(low_margin['Nama Produk'].head(10))}")
+            if st.button(f"✅ Terapkan Harga Baru ({len(changed)} produk)", key="pricing_apply_btn", type="primary", disabled=changed.empty):
+                success, message = apply_prices(preview)
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+        elif preview is not None:
+            st.info("Tidak ada produk yang cocok dengan filter.")
+
+    elif tab == "📥 Impor Massal":
+        st.subheader("Impor Massal Produk, Bahan & Resep")
+        st.caption("Baris dengan nama yang sudah ada akan diperbarui, sisanya ditambahkan. Impor resep membutuhkan produk dan bahan yang sudah terdaftar. Stok bahan tidak diubah (gunakan Stok Opname atau Pembelian Bahan).")
+        kind = st.radio("Jenis data", list(IMPORT_KINDS), horizontal=True, key="import_kind")
+        st.download_button(f"📥 Unduh Template {kind}", import_template(kind), f"template_{kind.lower()}.csv", "text/csv", key="import_template_btn")
+        uploaded = st.file_uploader("Unggah file (CSV/XLSX)", type=["csv", "xlsx"], key=f"import_upload_{kind}")
+        if uploaded is not None:
+            try:
+                diff, errors = prepare_import(kind, uploaded)
+            except Exception as e:
+                diff, errors = None, [f"Gagal membaca file: {e}"]
+            for error in errors[:20]:
+                st.error(error)
+            if len(errors) > 20:
+                st.error(f"... dan {len(errors) - 20} kesalahan lainnya.")
+            if diff is not None and not diff.empty:
+                counts = diff['Status'].value_counts()
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Baru", counts.get('Baru', 0))
+                col2.metric("Berubah", counts.get('Berubah', 0))
+                col3.metric("Sama", counts.get('Sama', 0))
+                visible = [col for col in diff.columns if not col.endswith('_id')]
+                st.dataframe(diff.loc[diff['Status'] != 'Sama', visible], use_container_width=True, hide_index=True)
+                st.caption("Kolom berakhiran _lama berisi nilai di database saat ini. Baris berstatus Sama tidak ditampilkan.")
+                if errors:
+                    st.warning("Baris yang bermasalah akan dilewati.")
+                if st.button(f"✅ Simpan Impor {kind}", key="import_apply_btn", type="primary"):
+                    success, message = apply_import(kind, diff)
+                    if success:
+                        st.success(message)
+                    else:
+                        st.error(message)
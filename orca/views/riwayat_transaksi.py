@@ -0,0 +1,80 @@
+"""Halaman Riwayat Transaksi."""
+import streamlit as st
+from datetime import date
+
+from orca.db import get_df
+from orca.sales import void_transaction
+
+
+def render():
+    st.header("🌊 Riwayat Transaksi")
+    
+    col_search, col_filter = st.columns([2, 1])
+    with col_search:
+        search_id = st.text_input("Cari dengan ID Transaksi...", placeholder="Ketik ID transaksi...", key="search_trans_id")
+    with col_filter:
+        # Optional: Add date range filter for transactions
+        today = date.today()
+        default_start = today.replace(day=1)
+        st.session_state.setdefault("trans_start_date", default_start)
+        st.session_state.setdefault("trans_end_date", today)
+        transaction_start_date = st.date_input("Dari Tanggal", key="trans_start_date")
+        transaction_end_date = st.date_input("Sampai Tanggal", key="trans_end_date")
+
+    query = "SELECT t.id AS 'ID', t.transaction_date AS 'Waktu', t.total_amount AS 'Total', t.payment_method AS 'Metode', e.name AS 'Kasir', CASE WHEN t.voided_at IS NULL THEN 'Selesai' ELSE 'Dibatalkan' END AS 'Status' FROM transactions t JOIN employees e ON t.employee_id = e.id WHERE 1=1"
+    params = []
+
+    if search_id.isdigit(): 
+        query += " AND t.id = ?"
+        params.append(int(search_id))
+    
+    query += " AND t.transaction_date BETWEEN ? AND ?"
+    params.append(transaction_start_date.strftime("%Y-%m-%d 00:00:00"))
+    params.append(transaction_end_date.strftime("%Y-%m-%d 23:59:59"))
+
+    query += " ORDER BY t.id DESC"
+    transactions_df = get_df(query, params)
+    
+    # Memperbaiki lebar kolom agar tulisan tidak terpotong
+    st.dataframe(transactions_df.style.format({'Total': 'Rp {:,.0f}'}), use_container_width=True, column_config={
+        "ID": st.column_config.Column(width="small"),
+        "Waktu": st.column_config.Column(width="medium"),
+        "Total": st.column_config.Column(width="small"),
+        "Metode": st.column_config.Column(width="small"),
+        "Kasir": st.column_config.Column(width="small"),
+        "Status": st.column_config.Column(width="small")
+    })
+    
+    st.markdown("---")
+    st.subheader("Kelola Transaksi")
+    if not transactions_df.empty:
+        selected_id = st.selectbox("Pilih ID dari tabel di atas untuk melihat detail atau membatalkan", options=transactions_df['ID'].tolist(), key="selected_trans_id")
+        if selected_id:
+            col_detail, col_action = st.columns(2)
+            with col_detail:
+                st.markdown(f"#### Detail Item Transaksi #{selected_id}:")
+                items_df = get_df("SELECT p.name || IFNULL(' (' || ti.options_label || ')', '') AS 'Produk', ti.quantity AS 'Jumlah', ti.price_per_unit AS 'Harga Satuan', (ti.quantity * ti.price_per_unit) AS 'Subtotal' FROM transaction_items ti JOIN products p ON ti.product_id = p.id WHERE ti.transaction_id = ?", (selected_id,))
+                # Memperbaiki lebar kolom agar tulisan tidak terpotong
+                st.dataframe(items_df.style.format({'Harga Satuan': 'Rp {:,.0f}', 'Subtotal': 'Rp {:,.0f}'}), use_container_width=True, column_config={
+                    "Produk": st.column_config.Column(width="medium"),
+                    "Jumlah": st.column_config.Column(width="small"),
+                    "Harga Satuan": st.column_config.Column(width="small"),
+                    "Subtotal": st.column_config.Column(width="small")
+                })
+            with col_action:
+                st.markdown("#### Opsi:")
+                voided_at = get_df("SELECT voided_at FROM transactions WHERE id = ?", (selected_id,))['voided_at'].iloc[0]
+                if voided_at:
+                    st.info(f"Transaksi ini sudah dibatalkan pada {voided_at}.")
+                else:
+                    reason = st.text_input("Alasan Pembatalan", value="Dibatalkan", key=f"void_reason_{selected_id}")
+                    if st.button("Batalkan Transaksi Ini", type="primary", key=f"del_trans_{selected_id}", use_container_width=True):
+                        success, message = void_transaction(selected_id, reason or "Dibatalkan")
+                        if success: 
+                            st.success(message)
+                        else: 
+                            st.error(message)
+                        st.rerun()
+                    st.caption("Pembatalan mengembalikan stok bahan baku dan membalik jurnal terkait; transaksi dan jurnal aslinya tetap tersimpan.")
+    else: 
+        st.info("Tidak ada transaksi untuk dikelola dalam rentang tanggal ini.")
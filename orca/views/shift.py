@@ -0,0 +1,105 @@
+"""Halaman Shift Kasir: buka shift, kas masuk/keluar, tutup shift dengan hitung laci (Z-report)."""
+import streamlit as st
+
+from orca.config import CASH_DENOMINATIONS, TERMINAL_ID
+from orca.shifts import get_open_shift, open_shift, record_cash_movement, get_shift_report, close_shift, get_shifts
+from orca.ui import lazy_tabs
+
+
+def show_shift_report(shift_id):
+    """Tampilkan ringkasan shift (X-report jika masih buka, Z-report jika sudah ditutup)."""
+    shift, totals, expected_cash = get_shift_report(shift_id)
+    closed = bool(shift['closed_at'])
+    st.markdown(f"**{'Z-Report' if closed else 'X-Report'} Shift #{shift_id}** · {shift['terminal']} · {shift['employee_name'] or '-'}")
+    st.caption(f"Dibuka {shift['opened_at']}" + (f" · ditutup {shift['closed_at']} oleh {shift['closed_by_name'] or '-'}" if closed else " · masih berjalan"))
+    if totals.empty:
+        st.info("Belum ada penjualan di shift ini.")
+    else:
+        st.dataframe(totals.style.format({'Penjualan': 'Rp {:,.0f}', 'Nilai Batal': 'Rp {:,.0f}', 'Bersih': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Modal Awal", f"Rp {shift['opening_float']:,.0f}")
+    col2.metric("Kas Masuk", f"Rp {shift['cash_in']:,.0f}")
+    col3.metric("Kas Keluar", f"Rp {shift['cash_out']:,.0f}")
+    col4.metric("Kas Seharusnya", f"Rp {(shift['expected_cash'] if closed else expected_cash):,.0f}")
+    if closed:
+        col1, col2 = st.columns(2)
+        col1.metric("Kas Dihitung", f"Rp {shift['counted_cash']:,.0f}")
+        col2.metric("Selisih", f"Rp {shift['variance']:+,.0f}")
+        if shift['notes']:
+            st.caption(f"Catatan: {shift['notes']}")
+
+
+def render():
+    st.header("🧾 Shift Kasir")
+    st.caption(f"Terminal: {TERMINAL_ID}")
+    tab = lazy_tabs(["Shift Aktif", "Kas Masuk/Keluar", "Tutup Shift", "Riwayat Shift"], key="shift_tab")
+    shift = get_open_shift()
+
+    if tab == "Shift Aktif":
+        if shift:
+            show_shift_report(shift['id'])
+        else:
+            st.subheader("Buka Shift")
+            with st.form("open_shift_form"):
+                opening_float = st.number_input("Modal Awal Laci (Rp)", min_value=0, step=1000, key="opening_float")
+                if st.form_submit_button("Buka Shift"):
+                    success, message = open_shift(st.session_state.user_id, opening_float)
+                    if success:
+                        st.success(message); st.rerun()
+                    else:
+                        st.error(message)
+
+    elif tab == "Kas Masuk/Keluar":
+        st.subheader("Kas Masuk/Keluar Laci")
+        if not shift:
+            st.info("Belum ada shift terbuka di terminal ini.")
+            return
+        with st.form("cash_movement_form"):
+            kind = st.radio("Jenis", ["Masuk", "Keluar"], horizontal=True, key="cash_movement_kind")
+            amount = st.number_input("Jumlah (Rp)", min_value=0, step=1000, key="cash_movement_amount")
+            reason = st.text_input("Keterangan", placeholder="Contoh: Tambah uang kembalian / Setor ke brankas")
+            if st.form_submit_button("Catat"):
+                success, message = record_cash_movement(shift['id'], kind, amount, reason.strip() or None, st.session_state.user_id)
+                if success:
+                    st.success(message); st.rerun()
+                else:
+                    st.error(message)
+
+    elif tab == "Tutup Shift":
+        st.subheader("Tutup Shift")
+        if not shift:
+            st.info("Belum ada shift terbuka di terminal ini.")
+            if st.session_state.get('last_closed_shift'):
+                show_shift_report(st.session_state.last_closed_shift)
+            return
+        st.caption("Hitung uang fisik di laci per pecahan.")
+        cols = st.columns(5)
+        counted_cash = 0
+        for i, denomination in enumerate(CASH_DENOMINATIONS):
+            with cols[i % len(cols)]:
+                counted_cash += denomination * st.number_input(f"Rp {denomination:,.0f}", min_value=0, step=1, key=f"denom_{denomination}")
+        _, _, expected_cash = get_shift_report(shift['id'])
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Kas Dihitung", f"Rp {counted_cash:,.0f}")
+        col2.metric("Kas Seharusnya", f"Rp {expected_cash:,.0f}")
+        col3.metric("Selisih", f"Rp {counted_cash - expected_cash:+,.0f}")
+        notes = st.text_input("Catatan", key="close_shift_notes")
+        if st.button("🔒 Tutup Shift", key="close_shift_btn", type="primary"):
+            success, message = close_shift(shift['id'], counted_cash, st.session_state.user_id, notes.strip() or None)
+            if success:
+                st.success(message)
+                st.session_state.last_closed_shift = shift['id']
+                show_shift_report(shift['id'])
+            else:
+                st.error(message)
+
+    elif tab == "Riwayat Shift":
+        st.subheader("Riwayat Shift")
+        shifts_df = get_shifts()
+        if shifts_df.empty:
+            st.info("Belum ada shift.")
+            return
+        money = ['Modal Awal', 'Kas Seharusnya', 'Kas Dihitung', 'Selisih']
+        st.dataframe(shifts_df.style.format({col: 'Rp {:,.0f}' for col in money}, na_rep='-'), use_container_width=True, hide_index=True)
+        shift_id = st.selectbox("Lihat laporan shift", shifts_df['ID'], key="shift_report_select")
+        show_shift_report(int(shift_id))
@@ -0,0 +1,196 @@
+"""Halaman Manajemen Stok Bahan."""
+import streamlit as st
+from datetime import date
+
+from orca.db import get_connection, run_query, get_df
+from orca.config import OUTLET_ID, REORDER_LEAD_TIME_DAYS, REORDER_SAFETY_Z
+from orca.inventory import post_stock_movements, set_stock, stock_as_of, get_stock_card, get_open_lots, compact_stock_movements
+from orca.opname import count_template, read_count_file, compare_counts, post_stock_opname
+from orca.reorder import get_reorder_plan, get_usage_forecast
+from orca.search import get_ingredient_index
+from orca.ui import lazy_tabs
+
+
+def render():
+    st.header("🌴 Manajemen Stok Bahan")
+    # Batas stok per bahan dari laju pemakaiannya (bukan satu angka untuk gram dan liter sekaligus)
+    reorder_plan = get_reorder_plan()
+    low_stock_df = reorder_plan[reorder_plan['Perlu Pesan']]
+    
+    if not low_stock_df.empty: 
+        st.warning("⚠️ **Perhatian!** Stok bahan berikut sudah di bawah titik pesan ulang:")
+        st.dataframe(low_stock_df[['Nama', 'Stok', 'Unit', 'Titik Pesan Ulang', 'Hari Ketersediaan']].style.format({'Stok': '{:,.2f}', 'Titik Pesan Ulang': '{:,.2f}', 'Hari Ketersediaan': '{:,.1f}'}, na_rep='-'), use_container_width=True, hide_index=True)
+    
+    tab = lazy_tabs(["📊 Daftar Bahan", "➕ Tambah Bahan", "✏️ Edit Bahan", "📜 Mutasi Stok", "📈 Titik Pesan Ulang", "📋 Stok Opname"], key="stok_tab")
+    
+    if tab == "📊 Daftar Bahan":
+        st.subheader("Daftar Bahan Saat Ini")
+        search_ing = st.text_input("Cari Nama Bahan...", key="ingredient_search", placeholder="Ketik nama bahan...")
+        # Stok = saldo outlet terminal ini; Stok Semua Outlet = ingredients.stock
+        query, params = ("""SELECT i.id, i.name AS 'Nama', i.unit AS 'Unit', IFNULL(s.stock, 0) AS 'Stok', i.stock AS 'Stok Semua Outlet', i.cost_per_unit AS 'HPP/Unit', i.pack_price AS 'Harga Kemasan', i.pack_weight AS 'Berat Kemasan'
+            FROM ingredients i LEFT JOIN outlet_stock s ON s.outlet_id = ? AND s.ingredient_id = i.id""", (OUTLET_ID,))
+        if search_ing: 
+            query += " WHERE i.name LIKE ?"; params = (OUTLET_ID, f'%{search_ing}%')
+        # Memperbaiki lebar kolom agar tulisan tidak terpotong
+        st.dataframe(get_df(query, params).style.format({'HPP/Unit': 'Rp {:,.2f}', 'Harga Kemasan': 'Rp {:,.2f}'}), use_container_width=True, column_config={
+            "Nama": st.column_config.Column(width="medium"),
+            "Unit": st.column_config.Column(width="small"),
+            "Stok": st.column_config.Column(width="small"),
+            "HPP/Unit": st.column_config.Column(width="medium"),
+            "Harga Kemasan": st.column_config.Column(width="medium"),
+            "Berat Kemasan": st.column_config.Column(width="medium")
+        })
+    
+    elif tab == "➕ Tambah Bahan":
+        st.subheader("Tambah Bahan Baru")
+        with st.form("add_ingredient_form"):
+            name = st.text_input("Nama Bahan", placeholder="Contoh: Biji Kopi Arabika")
+            unit = st.text_input("Satuan/Unit (e.g., gr, ml, pcs)", placeholder="Contoh: gram")
+            stock = st.number_input("Jumlah Stok Awal", value=0.0, format="%.2f")
+            
+            st.markdown("---")
+            st.info("Kalkulator Harga Pokok per Satuan (HPP/Unit)")
+            pack_price = st.number_input("Harga Beli per Kemasan (Rp)", value=0.0, format="%.2f")
+            pack_weight = st.number_input("Isi/Berat per Kemasan (sesuai satuan)", value=0.0, format="%.2f")
+            
+            cost_per_unit = (pack_price / pack_weight) if pack_weight > 0 else 0
+            st.metric("Harga Pokok per Satuan", f"Rp {cost_per_unit:,.2f}")
+            
+            if st.form_submit_button("Tambah Bahan"):
+                if name and unit:
+                    conn = get_connection()
+                    c = conn.cursor()
+                    try:
+                        c.execute("INSERT INTO ingredients (name, unit, cost_per_unit, stock, pack_weight, pack_price) VALUES (?, ?, ?, 0, ?, ?)", (name, unit, cost_per_unit, pack_weight, pack_price))
+                        post_stock_movements(c, [(c.lastrowid, stock)], 'Stok Awal')
+                        conn.commit()
+                        st.success(f"Bahan '{name}' berhasil ditambahkan."); st.rerun()
+                    except Exception as e:
+                        conn.rollback()
+                        st.error(f"Gagal menambahkan bahan: {e}")
+                    finally:
+                        conn.close()
+                else:
+                    st.error("Nama dan Satuan Bahan tidak boleh kosong.")
+    
+    elif tab == "✏️ Edit Bahan":
+        st.subheader("Edit Bahan")
+        search_term = st.text_input("Ketik nama bahan untuk diedit", key="edit_ing_search", placeholder="Cari bahan...")
+        
+        if search_term:
+            ingredient_index = get_ingredient_index()
+            matches = ingredient_index.search(search_term, limit=20)
+            ingredient_data = None
+            if matches:
+                # Pilih eksplisit dari hasil terurut, bukan sembarang baris pertama yang cocok
+                ingredient_id = st.selectbox("Pilih bahan", matches, format_func=lambda i: f"{ingredient_index.rows[i][1]} ({ingredient_index.rows[i][2]})", key="edit_ing_select")
+                ingredient_data = run_query("SELECT * FROM ingredients WHERE id = ?", (ingredient_id,), fetch='one')
+            if ingredient_data:
+                with st.form("edit_ingredient_form"):
+                    st.info(f"Mengedit data untuk: **{ingredient_data[1]}**")
+                    name = st.text_input("Nama Bahan", value=ingredient_data[1])
+                    unit = st.text_input("Satuan/Unit", value=ingredient_data[2])
+                    stock = st.number_input("Jumlah Stok (outlet ini)", value=float(run_query("SELECT IFNULL(SUM(stock), 0) FROM outlet_stock WHERE outlet_id = ? AND ingredient_id = ?", (OUTLET_ID, ingredient_data[0]), fetch='one')[0]), format="%.2f")
+                    pack_price = st.number_input("Harga Beli per Kemasan (Rp)", value=float(ingredient_data[6]), format="%.2f")
+                    pack_weight = st.number_input("Isi/Berat per Kemasan", value=float(ingredient_data[5]), format="%.2f")
+                    
+                    cost_per_unit = (pack_price / pack_weight) if pack_weight > 0 else 0
+                    st.metric("Harga Pokok per Satuan", f"Rp {cost_per_unit:,.2f}")
+                    
+                    if st.form_submit_button("Simpan Perubahan"):
+                        conn = get_connection()
+                        c = conn.cursor()
+                        try:
+                            c.execute("UPDATE ingredients SET name=?, unit=?, cost_per_unit=?, pack_weight=?, pack_price=? WHERE id=?", (name, unit, cost_per_unit, pack_weight, pack_price, ingredient_data[0]))
+                            set_stock(c, ingredient_data[0], stock, 'Penyesuaian') # Perubahan stok dicatat sebagai mutasi selisihnya
+                            conn.commit()
+                            st.success(f"Bahan '{name}' diperbarui."); st.rerun()
+                        except Exception as e:
+                            conn.rollback()
+                            st.error(f"Gagal memperbarui bahan: {e}")
+                        finally:
+                            conn.close()
+            else:
+                st.warning("Bahan tidak ditemukan. Silakan cek kembali nama yang dimasukkan.")
+        else:
+            st.info("Ketik nama bahan di atas untuk mulai mengedit.")
+
+    elif tab == "📜 Mutasi Stok":
+        st.subheader("Posisi Stok per Tanggal")
+        as_of_date = st.date_input("Posisi per akhir tanggal", date.today(), key="stock_as_of_date")
+        st.dataframe(stock_as_of(as_of_date.isoformat()).drop(columns='id'), use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+        st.subheader("Kartu Stok")
+        ingredients_df = get_df("SELECT id, name FROM ingredients ORDER BY name")
+        if not ingredients_df.empty:
+            ingredient_names = dict(zip(ingredients_df['id'], ingredients_df['name']))
+            card_ing_id = st.selectbox("Pilih bahan", list(ingredient_names), format_func=ingredient_names.get, key="stock_card_ing")
+            st.dataframe(get_stock_card(card_ing_id), use_container_width=True, hide_index=True)
+            st.caption("Menampilkan 200 mutasi terbaru. Saldo = stok setelah mutasi tersebut.")
+            st.markdown("**Lot FIFO Terbuka** (lot tertua dipakai lebih dulu untuk HPP penjualan)")
+            st.dataframe(get_open_lots(card_ing_id).style.format({'Harga Satuan': 'Rp {:,.2f}'}), use_container_width=True, hide_index=True)
+
+        if st.session_state.role == 'Admin':
+            st.markdown("---")
+            st.subheader("Ringkas Mutasi Lama")
+            total_rows = run_query("SELECT COUNT(*) FROM stock_movements", fetch='one')[0]
+            st.caption(f"Total {total_rows:,} baris mutasi. Mutasi sebelum tanggal yang dipilih digabung menjadi satu baris saldo awal per bahan; posisi stok sejak tanggal itu tetap akurat.")
+            compact_before = st.date_input("Ringkas mutasi sebelum tanggal", date.today().replace(day=1), key="compact_stock_before")
+            if st.button("🗜️ Ringkas Mutasi", key="compact_stock_btn"):
+                success, message = compact_stock_movements(compact_before.isoformat())
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+
+    elif tab == "📈 Titik Pesan Ulang":
+        st.subheader("Titik Pesan Ulang & Hari Ketersediaan")
+        st.caption("Laju pemakaian dihitung dari penjualan setahun terakhir x resep, diproyeksikan per hari dalam seminggu (exponential smoothing). Proyeksi dihitung sekali per hari.")
+        col_lead, col_z, col_refresh = st.columns(3)
+        with col_lead:
+            lead_time_days = st.number_input("Waktu Tunggu Pemasok (hari)", min_value=1, max_value=28, value=REORDER_LEAD_TIME_DAYS, key="reorder_lead_time")
+        with col_z:
+            service_levels = {"90%": 1.28, "95%": REORDER_SAFETY_Z, "99%": 2.33}
+            safety_z = service_levels[st.selectbox("Tingkat Layanan", list(service_levels), index=1, key="reorder_service_level")]
+        with col_refresh:
+            if st.button("🔄 Hitung Ulang Proyeksi", key="reorder_refresh_btn", use_container_width=True):
+                get_usage_forecast.clear(); st.rerun()
+        plan = get_reorder_plan(lead_time_days, safety_z) if (lead_time_days, safety_z) != (REORDER_LEAD_TIME_DAYS, REORDER_SAFETY_Z) else reorder_plan
+        st.dataframe(plan.drop(columns='id').style.format({'Stok': '{:,.2f}', 'Pemakaian/Hari': '{:,.2f}', 'Titik Pesan Ulang': '{:,.2f}', 'Hari Ketersediaan': '{:,.1f}'}, na_rep='-'), use_container_width=True, hide_index=True)
+
+    elif tab == "📋 Stok Opname":
+        st.subheader("Stok Opname (Hitung Fisik)")
+        st.caption("Isi kolom 'Stok Fisik' pada template, lalu unggah kembali. Bahan yang kolomnya kosong dianggap tidak dihitung.")
+        st.download_button("📥 Unduh Template Hitung Fisik", count_template(), f"stok_opname_{date.today().isoformat()}.csv", "text/csv", key="opname_template_btn")
+        uploaded = st.file_uploader("Unggah hasil hitung fisik (CSV/XLSX)", type=["csv", "xlsx"], key="opname_upload")
+        if uploaded is not None and st.session_state.get('opname_posted_file') == uploaded.file_id:
+            st.info("File ini sudah diposting. Unggah file hitung fisik baru untuk opname berikutnya.")
+        elif uploaded is not None:
+            try:
+                result, errors = compare_counts(read_count_file(uploaded))
+            except Exception as e:
+                result, errors = None, [f"Gagal membaca file: {e}"]
+            for error in errors[:20]:
+                st.error(error)
+            if len(errors) > 20:
+                st.error(f"... dan {len(errors) - 20} kesalahan lainnya.")
+            if result is not None and not result.empty:
+                changed = result[result['variance'].abs() > 1e-9]
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Bahan Dihitung", len(result))
+                col2.metric("Bahan Selisih", len(changed))
+                col3.metric("Nilai Selisih", f"Rp {result['variance_value'].sum():,.0f}")
+                display = changed.drop(columns='ingredient_id').rename(columns={'system_name': 'Nama Bahan', 'unit': 'Satuan', 'system_qty': 'Stok Sistem', 'counted_qty': 'Stok Fisik', 'variance': 'Selisih', 'unit_cost': 'HPP/Satuan', 'variance_value': 'Nilai Selisih'})
+                st.dataframe(display.style.format({'Stok Sistem': '{:,.2f}', 'Stok Fisik': '{:,.2f}', 'Selisih': '{:+,.2f}', 'HPP/Satuan': 'Rp {:,.2f}', 'Nilai Selisih': 'Rp {:,.0f}'}), use_container_width=True, hide_index=True)
+                st.caption("Nilai selisih di atas memakai HPP rata-rata; selisih kurang diposting dengan biaya lot FIFO.")
+                opname_notes = st.text_input("Catatan", key="opname_notes")
+                if st.button("✅ Posting Stok Opname", key="opname_post_btn", type="primary", disabled=errors != []):
+                    success, message = post_stock_opname(result, st.session_state.get('user_id'), opname_notes)
+                    if success:
+                        st.session_state.opname_posted_file = uploaded.file_id
+                        st.success(message)
+                    else:
+                        st.error(message)
+                if errors:
+                    st.warning("Perbaiki kesalahan pada file sebelum memposting.")